@@ -0,0 +1,214 @@
+"""
+House of Cards Assessment™
+Headless API - score assessments and render briefs over HTTP (WSGI)
+
+Same scoring and rendering as the results page, for partner portals that
+submit assessments programmatically. Served by gunicorn (see gunicorn.conf.py):
+
+    gunicorn api:app
+
+    GET  /health
+    POST /v1/assessments   -> {"analysis", "export", "brief_html"?, "assessment_id"?}
+    POST /v1/brief         -> the executive brief as text/html
+
+Request body (JSON):
+
+    {
+      "organization": "Acme",
+      "assessment_date": "2026-01-28",        # optional, defaults to today
+      "responses": {"0_0_signal": "Observed", "0_0_response": "...", ...},
+      "include_brief": false,                  # /v1/assessments only
+      "store": false                           # also save it (history, roll-ups, outbox, signal store)
+    }
+
+Response keys follow st.session_state.responses: "<lifeline>_<question>_signal"
+holds a signal name, optionally followed by " - description".
+With SIA_API_TOKEN set, requests need "Authorization: Bearer <token>".
+"""
+import hmac
+import json
+import logging
+import os
+from datetime import date
+
+from core import LIFELINES
+from storage import SIGNALS
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 256 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+}
+
+SIGNAL_KEYS = {
+    f"{lifeline_idx}_{q_idx}_signal"
+    for lifeline_idx, lifeline in LIFELINES.items()
+    for q_idx in range(len(lifeline["questions"]))
+}
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _response(start_response, status: int, body: bytes, content_type: str):
+    start_response(f"{status} {REASONS.get(status, '')}", [
+        ("Content-Type", content_type),
+        ("Content-Length", str(len(body))),
+    ])
+    return [body]
+
+
+def _json(start_response, status: int, payload) -> list[bytes]:
+    body = json.dumps(payload, default=str).encode("utf-8")
+    return _response(start_response, status, body, "application/json")
+
+
+def _check_auth(environ):
+    token = os.environ.get("SIA_API_TOKEN")
+    if not token:
+        return
+    supplied = environ.get("HTTP_AUTHORIZATION", "")
+    if not hmac.compare_digest(supplied, f"Bearer {token}"):
+        raise ApiError(401, "Missing or invalid bearer token")
+
+
+def _read_json(environ) -> dict:
+    try:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        raise ApiError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise ApiError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+    try:
+        payload = json.loads(environ["wsgi.input"].read(length) or b"{}")
+    except ValueError:
+        raise ApiError(400, "Body is not valid JSON")
+    if not isinstance(payload, dict):
+        raise ApiError(400, "Body must be a JSON object")
+    return payload
+
+
+def parse_submission(payload: dict) -> dict:
+    """Validate a submission; returns organization, assessment_date and responses"""
+    organization = payload.get("organization")
+    if not isinstance(organization, str) or not organization.strip():
+        raise ApiError(422, "'organization' is required")
+
+    try:
+        assessment_date = date.fromisoformat(str(payload.get("assessment_date") or date.today()))
+    except ValueError:
+        raise ApiError(422, "'assessment_date' must be YYYY-MM-DD")
+
+    responses = payload.get("responses")
+    if not isinstance(responses, dict) or not responses:
+        raise ApiError(422, "'responses' must be a non-empty object")
+    for key, value in responses.items():
+        if not isinstance(value, str):
+            raise ApiError(422, f"Response {key!r} must be a string")
+        if key.endswith("_signal"):
+            if key not in SIGNAL_KEYS:
+                raise ApiError(422, f"Unknown question {key!r}")
+            if value.split(" - ")[0] not in SIGNALS:
+                raise ApiError(422, f"{key!r}: signal must be one of {', '.join(SIGNALS)}")
+
+    return {"organization": organization.strip(), "assessment_date": assessment_date, "responses": responses}
+
+
+def _score(submission: dict):
+    from results import analyze_signal_responses
+    from stability import status_stability
+
+    analysis = analyze_signal_responses(submission["responses"])
+    if not analysis:
+        raise ApiError(422, "No signals found in 'responses'")
+    return analysis, status_stability(analysis)
+
+
+def _brief(submission: dict, analysis: dict, stability: dict) -> str:
+    from results import build_executive_brief_html, fig_to_png_base64, network_signal_map_spec
+
+    return build_executive_brief_html(
+        org_name=submission["organization"],
+        assessment_date=str(submission["assessment_date"]),
+        analysis=analysis,
+        map_png_b64=fig_to_png_base64(network_signal_map_spec(analysis)),
+        stability=stability,
+    )
+
+
+def handle_assessment(payload: dict) -> dict:
+    from results import build_export_data
+
+    submission = parse_submission(payload)
+    analysis, stability = _score(submission)
+    result = {
+        "analysis": {
+            name: {**data, "signals": dict(data["signals"]), "stability": stability.get(name)}
+            for name, data in analysis.items()
+        },
+        "export": build_export_data(submission["organization"], submission["assessment_date"], analysis, stability),
+    }
+    if payload.get("include_brief"):
+        result["brief_html"] = _brief(submission, analysis, stability)
+    if payload.get("store"):
+        from rules import active_rules
+        from storage import SignalStoreError, record_completed_assessment
+
+        try:
+            result["assessment_id"] = record_completed_assessment(
+                org_name=submission["organization"],
+                assessment_date=submission["assessment_date"],
+                analysis=analysis,
+                responses=submission["responses"],
+                ruleset_version=active_rules()["version"],
+            )
+        except SignalStoreError as exc:
+            # The assessment itself is stored; only the research copy is missing
+            logger.exception("Could not append assessment to the signal store")
+            result["assessment_id"] = exc.assessment_id
+    return result
+
+
+def handle_brief(payload: dict) -> str:
+    submission = parse_submission(payload)
+    analysis, stability = _score(submission)
+    return _brief(submission, analysis, stability)
+
+
+def app(environ, start_response):
+    """WSGI entry point"""
+    method = environ.get("REQUEST_METHOD", "GET")
+    path = environ.get("PATH_INFO", "/").rstrip("/") or "/"
+
+    try:
+        if path == "/health":
+            return _json(start_response, 200, {"status": "ok"})
+        if path not in ("/v1/assessments", "/v1/brief"):
+            raise ApiError(404, f"No route for {path}")
+        if method != "POST":
+            raise ApiError(405, "Use POST")
+
+        _check_auth(environ)
+        payload = _read_json(environ)
+        if path == "/v1/brief":
+            html = handle_brief(payload)
+            return _response(start_response, 200, html.encode("utf-8"), "text/html; charset=utf-8")
+        return _json(start_response, 200, handle_assessment(payload))
+
+    except ApiError as exc:
+        return _json(start_response, exc.status, {"error": str(exc)})
+    except Exception:
+        logger.exception("API request failed: %s %s", method, path)
+        return _json(start_response, 500, {"error": "Internal error"})
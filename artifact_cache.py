@@ -0,0 +1,186 @@
+"""
+House of Cards Assessment™
+Artifact Cache - content-addressed, on disk, shared by every worker process
+
+Rendered artifacts (signal map PNG, executive brief HTML, JSON export) are
+stored under the SHA-256 of their kind and inputs, so any process that needs
+the same artifact finds the file instead of rebuilding it:
+
+    html = cached("brief", [org, date, analysis, template_version], build)
+
+Files are written to a temporary name and renamed into place, so readers
+never see partial content and concurrent writers of the same key are
+harmless. A hit refreshes the file's mtime; when the cache outgrows its cap,
+whichever process notices takes the directory lock and deletes the least
+recently used files.
+
+    SIA_ARTIFACT_CACHE      directory (default data/artifact_cache)
+    SIA_ARTIFACT_CACHE_MB   size cap (default 256)
+"""
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("data/artifact_cache")
+
+# Evict down to this share of the cap, so eviction does not run on every write
+EVICT_TO = 0.8
+
+_lock = threading.Lock()
+_counters = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+_size_estimate = None  # bytes on disk as of the last scan, plus writes since
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get("SIA_ARTIFACT_CACHE", DEFAULT_CACHE_DIR))
+
+
+def cap_bytes() -> int:
+    try:
+        return int(float(os.environ.get("SIA_ARTIFACT_CACHE_MB", 256)) * 1024 * 1024)
+    except ValueError:
+        return 256 * 1024 * 1024
+
+
+def artifact_key(kind: str, inputs) -> str:
+    """SHA-256 of the artifact kind and its canonical JSON inputs"""
+    digest = hashlib.sha256(kind.encode("utf-8") + b"\0")
+    digest.update(json.dumps(inputs, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _path(key: str) -> Path:
+    return cache_dir() / key[:2] / key
+
+
+def _count(name: str, n: int = 1):
+    with _lock:
+        _counters[name] += n
+
+
+def get(key: str) -> bytes | None:
+    path = _path(key)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        _count("misses")
+        return None
+    try:
+        os.utime(path)  # recency for LRU eviction
+    except OSError:
+        pass
+    _count("hits")
+    return data
+
+
+def put(key: str, data: bytes):
+    global _size_estimate
+    with _lock:
+        if _size_estimate is None:
+            _size_estimate = _scan_size()
+
+    path = _path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("Could not write artifact %s", key, exc_info=True)
+        return
+
+    _count("writes")
+    with _lock:
+        _size_estimate += len(data)
+        over = _size_estimate > cap_bytes()
+    if over:
+        evict()
+
+
+def cached(kind: str, inputs, build) -> str | None:
+    """Text artifact for these inputs, from the cache or built and stored (None is not cached)"""
+    key = artifact_key(kind, inputs)
+    data = get(key)
+    if data is not None:
+        return data.decode("utf-8")
+    value = build()
+    if value is not None:
+        put(key, value.encode("utf-8"))
+    return value
+
+
+def _files():
+    root = cache_dir()
+    if not root.exists():
+        return
+    for sub in root.iterdir():
+        if sub.is_dir():
+            for path in sub.iterdir():
+                if not path.name.startswith(".tmp-"):
+                    yield path
+
+
+def _scan_size() -> int:
+    total = 0
+    for path in _files():
+        try:
+            total += path.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def evict() -> int:
+    """Delete least recently used artifacts until under EVICT_TO of the cap; returns files removed"""
+    global _size_estimate
+    root = cache_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / ".lock", "a+") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return 0  # another process is already evicting
+        try:
+            entries = []
+            for path in _files():
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            target = cap_bytes() * EVICT_TO
+            removed = 0
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+    with _lock:
+        _size_estimate = total
+    _count("evicted", removed)
+    return removed
+
+
+def cache_stats() -> dict:
+    """This process's counters and the last known size on disk"""
+    with _lock:
+        lookups = _counters["hits"] + _counters["misses"]
+        return {
+            **_counters,
+            "hit_rate": _counters["hits"] / lookups if lookups else 0.0,
+            "size_bytes": _size_estimate,
+            "cap_bytes": cap_bytes(),
+        }
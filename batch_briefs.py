@@ -0,0 +1,199 @@
+"""
+House of Cards Assessment™
+Batch Executive Briefs - render stored assessments into one ZIP archive
+
+    python batch_briefs.py briefs.zip
+    python batch_briefs.py --org "Acme" --org "Globex" --latest briefs.zip
+    python batch_briefs.py --since 2026-01-01 - > briefs.zip
+
+Assessments are read from storage (DATABASE_URL) in id order and rendered by
+results.build_executive_brief_html in a process pool. Only a bounded window
+of briefs is in flight at a time, and each finished brief is written to the
+archive straight away, so memory stays flat however many organizations are
+included. Statuses are the stored ones; descriptions come from the active
+rule table.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from sqlalchemy import select
+
+from storage import SIGNALS, assessments, get_engine, history_filters, lifeline_results
+
+# Briefs in flight per worker; bounds memory while keeping every worker busy
+WINDOW_PER_WORKER = 4
+
+
+def stored_analysis(lifelines: dict) -> dict:
+    """
+    Analysis dict (as from results.analyze_signal_responses) for stored
+    lifeline results {name: {'status', 'signals'}}
+    """
+    from rules import active_rules
+
+    compiled = active_rules()
+    descriptions = dict(zip(compiled["statuses"], compiled["descriptions"]))
+    analysis = {}
+    for name, data in lifelines.items():
+        signals = Counter({s: n for s, n in data["signals"].items() if n})
+        total = sum(signals.values()) or 1
+        analysis[name] = {
+            "signals": signals,
+            "status": data["status"],
+            "description": descriptions.get(data["status"], ""),
+            "observed_pct": signals.get("Observed", 0) / total * 100,
+            "compensated_pct": signals.get("Compensated", 0) / total * 100,
+            "fragile_pct": (signals.get("Assumed", 0) + signals.get("Historical", 0)) / total * 100,
+        }
+    return analysis
+
+
+def _latest_ids(conn, where: list) -> list[int]:
+    """Each organization's most recent assessment (by date, then id) among the filtered ones"""
+    query = (
+        select(assessments.c.id, assessments.c.org_key)
+        .where(*where)
+        .order_by(assessments.c.assessment_date, assessments.c.id)
+    )
+    newest = {row.org_key: row.id for row in conn.execute(query)}
+    return sorted(newest.values())
+
+
+def iter_stored_assessments(orgs=None, since=None, until=None, latest: bool = False, engine=None):
+    """
+    Yield {'assessment_id', 'org_name', 'assessment_date', 'analysis'} for
+    stored assessments in id order, streaming rows from the database.
+    With `latest`, only each organization's most recent assessment.
+    """
+    engine = engine or get_engine()
+    where = history_filters(orgs, since, until)
+
+    def finish(current):
+        return {**current, "analysis": stored_analysis(current.pop("lifelines"))}
+
+    with engine.connect() as conn:
+        if latest:
+            where = [assessments.c.id.in_(_latest_ids(conn, where))]
+        query = (
+            select(
+                assessments.c.id,
+                assessments.c.org_name,
+                assessments.c.assessment_date,
+                lifeline_results.c.lifeline,
+                lifeline_results.c.status,
+                *(lifeline_results.c[s.lower()] for s in SIGNALS),
+            )
+            .join(lifeline_results, lifeline_results.c.assessment_id == assessments.c.id)
+            .where(*where)
+            .order_by(assessments.c.id)
+        )
+
+        current = None
+        rows = conn.execution_options(stream_results=True, yield_per=1000).execute(query).mappings()
+        for row in rows:
+            if current is None or current["assessment_id"] != row["id"]:
+                if current is not None:
+                    yield finish(current)
+                current = {
+                    "assessment_id": row["id"],
+                    "org_name": row["org_name"],
+                    "assessment_date": row["assessment_date"],
+                    "lifelines": {},
+                }
+            current["lifelines"][row["lifeline"]] = {
+                "status": row["status"],
+                "signals": {s: row[s.lower()] for s in SIGNALS},
+            }
+        if current is not None:
+            yield finish(current)
+
+
+def brief_filename(org_name: str, assessment_date) -> str:
+    """Same naming as the download on the results page, limited to safe archive member names"""
+    safe_org = re.sub(r"[^\w-]+", "_", org_name).strip("_") or "organization"
+    return f"Signal_Integrity_Brief_{safe_org}_{assessment_date}.html"
+
+
+def render_brief(item: dict, with_map: bool = True) -> tuple[int, bytes]:
+    """Worker task: one stored assessment -> (assessment_id, brief HTML bytes)"""
+    from results import build_executive_brief_html, fig_to_png_base64, network_signal_map_spec
+
+    analysis = item["analysis"]
+    html = build_executive_brief_html(
+        org_name=item["org_name"],
+        assessment_date=str(item["assessment_date"]),
+        analysis=analysis,
+        map_png_b64=fig_to_png_base64(network_signal_map_spec(analysis)) if with_map else None,
+    )
+    return item["assessment_id"], html.encode("utf-8")
+
+
+def write_briefs_zip(items, out, workers: int | None = None, with_map: bool = True) -> int:
+    """
+    Render `items` (see iter_stored_assessments) into a ZIP written to `out`
+    (path or binary file object); returns the number of briefs
+    """
+    workers = workers or os.cpu_count() or 1
+    window = workers * WINDOW_PER_WORKER
+    names: dict[int, str] = {}
+    used: set[str] = set()
+    written = 0
+
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as archive, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        items = iter(items)
+        exhausted = False
+
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                item = next(items, None)
+                if item is None:
+                    exhausted = True
+                    break
+                name = brief_filename(item["org_name"], item["assessment_date"])
+                if name in used:
+                    name = name[:-len(".html")] + f"_{item['assessment_id']}.html"
+                used.add(name)
+                names[item["assessment_id"]] = name
+                pending.add(pool.submit(render_brief, item, with_map))
+
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                assessment_id, html = future.result()
+                archive.writestr(names.pop(assessment_id), html)
+                written += 1
+
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render executive briefs for stored assessments into a ZIP.")
+    parser.add_argument("output", help="ZIP file to write, or - for stdout")
+    parser.add_argument("--org", action="append", help="organization name (repeatable; default all)")
+    parser.add_argument("--since", help="first assessment date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="last assessment date (YYYY-MM-DD)")
+    parser.add_argument("--latest", action="store_true", help="only each organization's latest assessment")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--no-map", action="store_true", help="skip the signal map image")
+    args = parser.parse_args(argv)
+
+    items = iter_stored_assessments(args.org, args.since, args.until, latest=args.latest)
+    out = sys.stdout.buffer if args.output == "-" else args.output
+
+    started = time.perf_counter()
+    count = write_briefs_zip(items, out, workers=args.workers, with_map=not args.no_map)
+    print(f"Wrote {count} brief(s) in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+House of Cards Assessment™
+Shared Core - instrument definition, branding, session defaults and page registry
+
+Everything here is defined once per process; pages import what they need.
+"""
+import importlib
+import hmac
+import os
+from datetime import date
+from pathlib import Path
+
+import streamlit as st
+
+APP_VERSION = "2026-01-28b"
+
+LOGO_MONO_PATH = Path("assets/southwind_logo_mono_navy.png")
+
+FOOTER_TEXT = "Southwind Planning • Readiness Is Not a Plan. It’s a Capability."
+FOOTER_SUBTEXT = "Prepared by Mike McCracken • 2026"
+
+# Assessment questions structure
+LIFELINES = {
+    0: {
+        'name': 'Leadership Awareness',
+        'questions': [
+            'How do you currently know what is working and what is under strain across critical operations?',
+            'When priorities compete, how do you know which dependencies will fail first?',
+            'What would become visible only under sustained pressure or resource constraints?',
+            'How do leaders verify that operational assumptions are still valid?',
+            'What information do you rely on that has not been independently confirmed in the past 6 months?'
+        ]
+    },
+    1: {
+        'name': 'Operational Dependencies',
+        'questions': [
+            'What critical processes depend on specific individuals to function properly?',
+            'Which vendor or supplier relationships have not been stress-tested in the past 12 months?',
+            'What workarounds have become standard operating procedure?',
+            'What happens if your top three operational experts are unavailable for two weeks?',
+            'Which systems or processes lack documented backup procedures?'
+        ]
+    },
+    2: {
+        'name': 'Decision Clarity',
+        'questions': [
+            'When urgent decisions are needed, how do you verify you\'re working from current information?',
+            'What decisions are currently being delayed due to incomplete information or competing priorities?',
+            'Where do informal channels override formal decision-making processes?',
+            'How do you know when a decision is based on accurate versus assumed information?',
+            'What percentage of major decisions are made with verified data versus historical assumptions?'
+        ]
+    },
+    3: {
+        'name': 'Resource Resilience',
+        'questions': [
+            'Which resources (people, systems, suppliers) operate with no viable backup or alternative?',
+            'What capabilities exist primarily because of individual expertise rather than documented process?',
+            'Where is organizational capacity being sustained through overtime, heroics, or goodwill?',
+            'What critical resources are operating at or above sustainable capacity?',
+            'Which resource constraints are currently being managed through workarounds?'
+        ]
+    },
+    4: {
+        'name': 'Information Flow',
+        'questions': [
+            'How do you know when critical information is not reaching decision-makers?',
+            'What signals of emerging problems currently go unnoticed or unreported?',
+            'Where does "everything is fine" actually mean "someone is handling it quietly"?',
+            'How is bad news communicated upward in your organization?',
+            'What information do you wish you had real-time visibility into?'
+        ]
+    }
+}
+
+SIGNAL_TYPES = [
+    'Observed - Direct, current evidence',
+    'Assumed - Believed but not verified',
+    'Historical - Once true, not recently tested',
+    'Compensated - Held together by people/workarounds'
+]
+
+# Custom CSS for professional styling
+GLOBAL_CSS = """
+<style>
+    .main {
+        padding: 2rem;
+    }
+    h1 {
+        font-weight: 300;
+        letter-spacing: 2px;
+        border-bottom: 2px solid #333;
+        padding-bottom: 10px;
+        margin-bottom: 20px;
+    }
+    h2 {
+        font-weight: 600;
+        margin-top: 30px;
+        margin-bottom: 10px;
+    }
+    .tagline {
+        font-size: 1.1rem;
+        color: #1e293b;
+        font-weight: 500;
+        margin-bottom: 0.5rem;
+        font-style: italic;
+    }
+    .stButton > button {
+        background-color: #1e293b;
+        color: white;
+        border: none;
+        padding: 0.75rem 2rem;
+        font-weight: 500;
+    }
+    .stButton > button:hover {
+        background-color: #334155;
+    }
+    .lifeline-header {
+        background-color: #f8fafc;
+        padding: 1rem;
+        border-left: 4px solid #64748b;
+        margin-bottom: 1rem;
+    }
+    .question-container {
+        background-color: #ffffff;
+        padding: 1.5rem;
+        border: 1px solid #e2e8f0;
+        margin-bottom: 1.5rem;
+        border-radius: 4px;
+        animation: fadeIn 0.3s ease-in;
+    }
+    .progress-text {
+        font-size: 0.9rem;
+        color: #64748b;
+        margin-bottom: 0.5rem;
+    }
+    @keyframes fadeIn {
+        from {
+            opacity: 0;
+            transform: translateY(10px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+    a[href*="mailto"]:hover {
+        background-color: #334155 !important;
+    }
+</style>
+"""
+
+# Page registry: name -> (module, function, title, url path).
+# Modules are imported the first time their page is visited.
+PAGES = {
+    'metadata': ('views.metadata', 'show_metadata_page', 'Start', 'start'),
+    'assessment': ('views.assessment', 'show_assessment_page', 'Assessment', 'assessment'),
+    'results': ('results', 'show_results_page', 'Results', 'results'),
+}
+DEFAULT_PAGE = 'metadata'
+
+# Internal pages, only routed for operators (see is_operator)
+OPERATOR_PAGES = {
+    'dashboard': ('views.dashboard', 'show_dashboard_page', 'Operator Dashboard', 'ops'),
+    'mirror': ('views.mirror', 'show_mirror_page', 'Mirror Session', 'mirror'),
+}
+
+
+def _lazy_page(module_name: str, func_name: str):
+    def run():
+        getattr(importlib.import_module(module_name), func_name)()
+    run.__name__ = func_name
+    return run
+
+
+def page(name: str):
+    """Build the st.Page for a registered page"""
+    module_name, func_name, title, url_path = {**PAGES, **OPERATOR_PAGES}[name]
+    return st.Page(
+        _lazy_page(module_name, func_name),
+        title=title,
+        url_path=url_path,
+        default=(name == DEFAULT_PAGE),
+    )
+
+
+def go_to(name: str):
+    """Navigate to a registered page (ends the current run)"""
+    st.switch_page(page(name))
+
+
+def is_operator() -> bool:
+    """
+    True once the session has presented ?operator=<SIA_OPERATOR_TOKEN>.
+
+    Without SIA_OPERATOR_TOKEN set, operator features stay off.
+    """
+    if st.session_state.get("operator"):
+        return True
+    token = os.environ.get("SIA_OPERATOR_TOKEN")
+    supplied = st.query_params.get("operator")
+    if token and supplied and hmac.compare_digest(supplied, token):
+        st.session_state.operator = True
+        return True
+    return False
+
+
+def is_lite_mode() -> bool:
+    """
+    True when results should use static charts instead of plotly.js.
+
+    ?lite=1 / ?lite=0 choose explicitly; otherwise browsers that send
+    "Save-Data: on" get lite mode. The choice is kept for the session
+    because query parameters do not survive page switches.
+    """
+    requested = st.query_params.get("lite")
+    if requested is not None:
+        st.session_state.lite_mode = requested.strip().lower() not in ("0", "false", "off", "no")
+    elif "lite_mode" not in st.session_state:
+        st.session_state.lite_mode = st.context.headers.get("Save-Data", "").strip().lower() == "on"
+    return st.session_state.lite_mode
+
+
+def init_session_state():
+    """Session state defaults (must run before any page renders)"""
+    if "org_name" not in st.session_state:
+        st.session_state.org_name = ""
+    if "assessment_date" not in st.session_state:
+        st.session_state.assessment_date = date.today()
+    if "current_lifeline" not in st.session_state:
+        st.session_state.current_lifeline = 0
+    if "responses" not in st.session_state:
+        st.session_state.responses = {}
+
+
+def render_brand_header(title: str, subtitle: str | None = None):
+    """Quiet-luxury header: small logo top-left, title to the right."""
+    left, right = st.columns([1, 6], vertical_alignment="center")
+
+    with left:
+        if LOGO_MONO_PATH.exists():
+            st.image(str(LOGO_MONO_PATH), width=95)
+        else:
+            st.markdown("")
+
+    with right:
+        st.markdown(f"# {title}")
+        if subtitle:
+            st.markdown(f"*{subtitle}*")
+
+
+def render_footer(show_prepared_by: bool = False):
+    """Discreet footer on every screen."""
+    extra = f"<br><span style='font-size:9px;'>{FOOTER_SUBTEXT}</span>" if show_prepared_by else ""
+    st.markdown(
+        f"""
+        <style>
+          .sw-footer {{
+            position: fixed;
+            left: 0;
+            bottom: 0;
+            width: 100%;
+            padding: 8px 0;
+            text-align: center;
+            color: #9ca3af;
+            font-size: 10px;
+            background: rgba(255,255,255,0.85);
+            border-top: 1px solid #e5e7eb;
+            z-index: 999;
+          }}
+        </style>
+        <div class="sw-footer">{FOOTER_TEXT}{extra}</div>
+        """,
+        unsafe_allow_html=True
+    )
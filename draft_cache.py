@@ -0,0 +1,171 @@
+"""
+House of Cards Assessment™
+Draft Cache - in-progress answers mirrored to the browser's localStorage
+
+When a respondent's connection drops (a laptop sleeping mid-assessment),
+Streamlit starts a new session and the answers held in session state are
+gone. app.py mounts this inline component once per run:
+
+    in progress   the draft (organization, date, lifeline, responses) rides
+                  along with the run; the browser stores it only when it changed
+    new session   the browser offers a stored draft once; it comes back as a
+                  single trigger value and restore_draft() applies every
+                  answer in one go, so there is one rerun, not one per field
+    completed     the stored draft is removed
+
+Drafts older than DRAFT_MAX_AGE_HOURS are ignored. Set SIA_DRAFT_CACHE=0 to
+keep answers out of the browser entirely (e.g. shared kiosks).
+"""
+import os
+from datetime import date
+
+import streamlit as st
+
+from core import SIGNAL_TYPES
+
+STORAGE_KEY = "sia-draft-v1"
+DRAFT_MAX_AGE_HOURS = 72
+
+_DRAFT_JS = """
+export default function(component) {
+    const { data, setTriggerValue } = component;
+    if (!data || !data.key) {
+        return;
+    }
+    let storage;
+    try {
+        storage = window.localStorage;
+    } catch (e) {
+        return;  // storage blocked (privacy mode, policy)
+    }
+
+    if (data.clear) {
+        storage.removeItem(data.key);
+        window.__siaDraftSaved = null;
+        return;
+    }
+    if (data.draft) {
+        const json = JSON.stringify(data.draft);
+        if (json !== window.__siaDraftSaved) {
+            try {
+                storage.setItem(data.key, JSON.stringify({saved_at: Date.now(), draft: data.draft}));
+                window.__siaDraftSaved = json;
+            } catch (e) {
+                // quota exceeded: keep working without the draft
+            }
+        }
+        return;
+    }
+    // Offer a stored draft once per server session
+    if (data.offer && window.__siaDraftOffered !== data.offer) {
+        window.__siaDraftOffered = data.offer;
+        const raw = storage.getItem(data.key);
+        if (!raw) {
+            return;
+        }
+        try {
+            const stored = JSON.parse(raw);
+            if (Date.now() - stored.saved_at > data.max_age_ms) {
+                storage.removeItem(data.key);
+                return;
+            }
+            window.__siaDraftSaved = JSON.stringify(stored.draft);
+            setTriggerValue('restore', stored.draft);
+        } catch (e) {
+            storage.removeItem(data.key);
+        }
+    }
+}
+"""
+
+# Registered once per process (re-registering on every run is discouraged)
+_draft_component = st.components.v2.component("draft_cache", js=_DRAFT_JS)
+
+
+def enabled() -> bool:
+    return os.environ.get("SIA_DRAFT_CACHE", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def mark_draft_complete():
+    """The assessment is finished: drop the browser copy on the next run"""
+    st.session_state.draft_complete = True
+
+
+def _valid_responses(responses) -> dict:
+    """Only known-shaped answers from a browser-supplied draft"""
+    if not isinstance(responses, dict):
+        return {}
+    valid = {}
+    for key, value in responses.items():
+        if not isinstance(key, str) or not isinstance(value, str):
+            continue
+        if key.endswith("_signal") and value in SIGNAL_TYPES:
+            valid[key] = value
+        elif key.endswith("_response"):
+            valid[key] = value
+    return valid
+
+
+def apply_draft(draft) -> bool:
+    """Put a browser-supplied draft into a session that has no answers of its own"""
+    if not isinstance(draft, dict) or st.session_state.get("responses"):
+        return False
+    responses = _valid_responses(draft.get("responses"))
+    if not responses:
+        return False
+
+    st.session_state.responses = responses
+    # The assessment widgets are keyed; seed them so they show the answers
+    for key, value in responses.items():
+        st.session_state[f"{key}_input"] = value
+    st.session_state.org_name = str(draft.get("org_name") or "")
+    try:
+        st.session_state.assessment_date = date.fromisoformat(str(draft.get("assessment_date")))
+    except ValueError:
+        pass
+    try:
+        st.session_state.current_lifeline = max(0, int(draft.get("current_lifeline") or 0))
+    except (TypeError, ValueError):
+        pass
+    st.session_state.draft_restored = True
+    return True
+
+
+def restore_draft():
+    """on_restore_change callback: the browser's draft arrives as one trigger value"""
+    state = st.session_state.get("draft_cache")
+    if isinstance(state, dict):
+        apply_draft(state.get("restore"))
+
+
+def render_draft_cache():
+    """Mount the draft-cache component (call once per run, before page content)"""
+    if not enabled():
+        return
+    from session_memory import current_session_id
+
+    data = {"key": STORAGE_KEY, "max_age_ms": DRAFT_MAX_AGE_HOURS * 3600 * 1000}
+    responses = st.session_state.get("responses")
+    if responses:
+        # The page copies widget values into responses after this runs, so
+        # take the just-committed ones from the widgets directly
+        responses = {
+            **responses,
+            **{
+                key[: -len("_input")]: value
+                for key, value in st.session_state.items()
+                if isinstance(key, str) and key.endswith(("_response_input", "_signal_input"))
+            },
+        }
+    if st.session_state.get("draft_complete"):
+        data["clear"] = True
+    elif responses and st.session_state.get("org_name", "").strip():
+        data["draft"] = {
+            "org_name": st.session_state.org_name,
+            "assessment_date": str(st.session_state.get("assessment_date", "")),
+            "current_lifeline": st.session_state.get("current_lifeline", 0),
+            "responses": responses,
+        }
+    elif not responses:
+        data["offer"] = current_session_id()
+    _draft_component(data=data, key="draft_cache", on_restore_change=restore_draft)
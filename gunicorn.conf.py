@@ -0,0 +1,22 @@
+"""
+House of Cards Assessment™
+Gunicorn settings for the headless API (api.py)
+
+Threaded workers with keep-alive so partner portals can reuse connections;
+the app is preloaded so each worker forks with the scoring code imported.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.environ.get("API_THREADS", 4))
+keepalive = 5
+timeout = 60
+graceful_timeout = 30
+preload_app = True
+
+
+def on_starting(server):
+    # Import the scoring and rendering stack once in the master
+    import results  # noqa: F401
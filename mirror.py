@@ -0,0 +1,254 @@
+"""
+House of Cards Assessment™
+Mirror Sessions - live rooms that combine many participants' signals
+
+A facilitator opens a room; participants join with ?room=<code> and take the
+normal assessment. Each submission replaces that participant's previous
+contribution in the room's running counts (questions x signals), so an
+update costs one subtract/add of a 25-element vector however many people
+are in the room. After every change the room scores the combined counts
+once, builds the map figure once, and publishes the snapshot to its
+subscribers; facilitator views only read the latest snapshot from their
+mailbox and never rescore anything. Written answers are kept per participant
+so the facilitator can group them into themes (themes.group_themes).
+
+Rooms live in this process (Streamlit runs all sessions in one process) and
+are dropped after ROOM_TTL_SECONDS without activity. Streamlit does not say
+when a browser goes away, so inside a room idle entries expire instead: a
+facilitator mailbox nobody has read for SUBSCRIBER_IDLE_SECONDS, and the
+partial answers of a participant who stopped before finishing for
+PARTICIPANT_IDLE_SECONDS. Finished participants stay counted.
+"""
+import secrets
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from core import LIFELINES
+from rules import classify
+from signal_store import QUESTION_KEYS, SIGNALS, UNANSWERED, encode_signals
+
+ROOM_TTL_SECONDS = 12 * 3600
+SUBSCRIBER_IDLE_SECONDS = 60        # facilitator views read every few seconds
+PARTICIPANT_IDLE_SECONDS = 30 * 60
+CODE_ALPHABET = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"  # no 0/O or 1/I/L
+CODE_LENGTH = 6
+
+
+def _lifeline_rows() -> dict[str, slice]:
+    """Row range of each lifeline's questions in QUESTION_KEYS order"""
+    rows, start = {}, 0
+    for lifeline in LIFELINES.values():
+        rows[lifeline['name']] = slice(start, start + len(lifeline['questions']))
+        start += len(lifeline['questions'])
+    return rows
+
+
+_LIFELINE_ROWS = _lifeline_rows()
+
+
+def analysis_from_counts(counts: np.ndarray) -> dict:
+    """Analysis dict (as from results.analyze_signal_responses) for aggregated counts"""
+    analysis = {}
+    for name, rows in _LIFELINE_ROWS.items():
+        totals = counts[rows].sum(axis=0)
+        total = int(totals.sum())
+        if not total:
+            continue
+        signals = Counter({s: int(n) for s, n in zip(SIGNALS, totals) if n})
+        observed_pct = signals.get('Observed', 0) / total * 100
+        compensated_pct = signals.get('Compensated', 0) / total * 100
+        fragile_pct = (signals.get('Assumed', 0) + signals.get('Historical', 0)) / total * 100
+        status, description = classify(observed_pct, compensated_pct, fragile_pct)
+        analysis[name] = {
+            'signals': signals,
+            'status': status,
+            'description': description,
+            'observed_pct': observed_pct,
+            'compensated_pct': compensated_pct,
+            'fragile_pct': fragile_pct,
+        }
+    return analysis
+
+
+def divergent_questions(counts: np.ndarray, n: int = 5) -> list[dict]:
+    """Questions where the room agrees least (lowest share for the most common signal)"""
+    answered = counts.sum(axis=1)
+    agreement = np.divide(counts.max(axis=1), answered, out=np.ones(len(answered)), where=answered > 1)
+    result = []
+    for i in np.argsort(agreement, kind="stable")[:n]:
+        if answered[i] < 2 or agreement[i] >= 1:
+            break
+        lifeline_idx, q_idx = map(int, QUESTION_KEYS[i].split("_"))
+        lifeline = LIFELINES[lifeline_idx]
+        result.append({
+            "lifeline": lifeline['name'],
+            "question": lifeline['questions'][q_idx],
+            "agreement": float(agreement[i]),
+            "split": {s: int(c) for s, c in zip(SIGNALS, counts[i]) if c},
+        })
+    return result
+
+
+class Room:
+    """One live mirror session: incremental counts plus published snapshots"""
+
+    def __init__(self, code: str, org_name: str):
+        self.code = code
+        self.org_name = org_name
+        self.created = time.time()
+        self.last_activity = time.monotonic()
+        self.counts = np.zeros((len(QUESTION_KEYS), len(SIGNALS)), dtype=np.int64)
+        self.contributions: dict[str, np.ndarray] = {}
+        self.answers: dict[str, dict[str, str]] = {}  # participant -> question key -> text
+        self._last_submit: dict[str, float] = {}
+        self._finished: set[str] = set()
+        self.version = 0
+        self.snapshot = self._build_snapshot()
+        self._subscribers: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _apply(self, codes: np.ndarray, sign: int):
+        answered = np.flatnonzero(codes != UNANSWERED)
+        self.counts[answered, codes[answered]] += sign
+
+    def _build_snapshot(self) -> dict:
+        from results import network_signal_map_spec
+
+        analysis = analysis_from_counts(self.counts)
+        return {
+            "version": self.version,
+            "participants": len(self.contributions),
+            "analysis": analysis,
+            "map_spec": network_signal_map_spec(analysis) if analysis else None,
+            "divergent": divergent_questions(self.counts),
+            "updated": time.time(),
+        }
+
+    def _publish(self):
+        self.version += 1
+        self.last_activity = time.monotonic()
+        snapshot = self._build_snapshot()
+        self.snapshot = snapshot
+        for mailbox in self._subscribers.values():
+            mailbox["latest"] = snapshot  # conflated: viewers only need the newest
+
+    def _remove(self, participant_id: str) -> bool:
+        self._last_submit.pop(participant_id, None)
+        self._finished.discard(participant_id)
+        self.answers.pop(participant_id, None)
+        previous = self.contributions.pop(participant_id, None)
+        if previous is None:
+            return False
+        self._apply(previous, -1)
+        return True
+
+    def submit(self, participant_id: str, responses: dict, finished: bool = False) -> int:
+        """Add or replace a participant's signals; returns the new version"""
+        codes = encode_signals(responses)
+        answers = {
+            key[: -len("_response")]: text.strip()
+            for key, text in responses.items()
+            if key.endswith("_response") and isinstance(text, str) and text.strip()
+        }
+        with self._lock:
+            self._last_submit[participant_id] = time.monotonic()
+            if finished:
+                self._finished.add(participant_id)
+            previous = self.contributions.get(participant_id)
+            if previous is not None:
+                if np.array_equal(previous, codes):
+                    if self.answers.get(participant_id) != answers:
+                        self.answers[participant_id] = answers
+                        self._publish()
+                    return self.version
+                self._apply(previous, -1)
+            self.answers[participant_id] = answers
+            self._apply(codes, +1)
+            self.contributions[participant_id] = codes
+            self._publish()
+            return self.version
+
+    def leave(self, participant_id: str):
+        with self._lock:
+            if self._remove(participant_id):
+                self._publish()
+
+    def expire_idle(self, now: float | None = None):
+        """Drop unread mailboxes and abandoned, unfinished contributions"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for subscriber_id in [
+                sid for sid, mailbox in self._subscribers.items()
+                if now - mailbox["seen"] > SUBSCRIBER_IDLE_SECONDS
+            ]:
+                del self._subscribers[subscriber_id]
+            abandoned = [
+                pid for pid, seen in self._last_submit.items()
+                if pid not in self._finished and now - seen > PARTICIPANT_IDLE_SECONDS
+            ]
+            removed = [pid for pid in abandoned if self._remove(pid)]
+            if removed:
+                self._publish()
+
+    def question_answers(self, question_key: str) -> list[str]:
+        """Every participant's written answer to one question"""
+        with self._lock:
+            return [texts[question_key] for texts in self.answers.values() if question_key in texts]
+
+    def subscribe(self, subscriber_id: str) -> dict:
+        """Mailbox that always holds the newest snapshot (idempotent per subscriber)"""
+        self.expire_idle()
+        with self._lock:
+            mailbox = self._subscribers.get(subscriber_id)
+            if mailbox is None:
+                mailbox = self._subscribers[subscriber_id] = {"latest": self.snapshot}
+            mailbox["seen"] = time.monotonic()
+            return mailbox
+
+    def unsubscribe(self, subscriber_id: str):
+        with self._lock:
+            self._subscribers.pop(subscriber_id, None)
+
+
+_rooms: dict[str, Room] = {}
+_rooms_lock = threading.Lock()
+
+
+def _expire_rooms():
+    cutoff = time.monotonic() - ROOM_TTL_SECONDS
+    for code in [code for code, room in _rooms.items() if room.last_activity < cutoff]:
+        del _rooms[code]
+
+
+def create_room(org_name: str) -> Room:
+    with _rooms_lock:
+        _expire_rooms()
+        code = "".join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+        while code in _rooms:
+            code = "".join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+        room = _rooms[code] = Room(code, org_name.strip())
+        return room
+
+
+def get_room(code: str | None) -> Room | None:
+    if not code:
+        return None
+    with _rooms_lock:
+        room = _rooms.get(code.strip().upper())
+    if room is not None:
+        room.last_activity = time.monotonic()
+    return room
+
+
+def open_rooms() -> list[Room]:
+    with _rooms_lock:
+        _expire_rooms()
+        return sorted(_rooms.values(), key=lambda room: room.created, reverse=True)
+
+
+def close_room(code: str):
+    with _rooms_lock:
+        _rooms.pop(code, None)
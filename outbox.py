@@ -0,0 +1,279 @@
+"""
+House of Cards Assessment™
+Completion Events - transactional outbox with a batched background dispatcher
+
+storage.save_assessment writes an `assessment.completed` event per configured
+destination in the same transaction as the assessment, so an event exists
+exactly when the assessment does. A daemon thread drains the outbox: it
+claims due events under a short lease (safe with several processes), POSTs
+them in batches per destination with bounded concurrency, and reschedules
+failures with exponential backoff and jitter. After MAX_ATTEMPTS failures an
+event is dead-lettered (dead_at set) and left for `python outbox.py
+retry-dead`. Delivery is at-least-once; receivers should de-duplicate on the
+event `id`.
+
+    SIA_OUTBOX_ENDPOINTS   comma-separated URLs (CRM, notifications, ...)
+
+Nothing is enqueued when no endpoint is configured. The Streamlit request
+path only inserts rows and, once its transaction has committed, nudges the
+dispatcher (wake_dispatcher); it never waits on HTTP.
+"""
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_, select
+
+from schema import outbox_events
+from storage import get_engine
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_CONCURRENCY = 4
+POLL_INTERVAL = 5.0
+LEASE_SECONDS = 60
+REQUEST_TIMEOUT = 10
+BASE_BACKOFF = 2.0
+MAX_BACKOFF = 600.0
+MAX_ATTEMPTS = 15  # then the event is dead-lettered (about a day of retries)
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def endpoints() -> list[str]:
+    return [url.strip() for url in os.environ.get("SIA_OUTBOX_ENDPOINTS", "").split(",") if url.strip()]
+
+
+def enqueue(conn, event_type: str, payload: dict, destinations: list[str] | None = None) -> int:
+    """Write an event for each destination inside the caller's transaction"""
+    destinations = endpoints() if destinations is None else destinations
+    if not destinations:
+        return 0
+
+    now = _now()
+    event_id = str(uuid.uuid4())
+    body = json.dumps(payload, default=str)
+    conn.execute(outbox_events.insert(), [
+        {
+            "event_id": event_id,
+            "event_type": event_type,
+            "destination": url,
+            "payload": body,
+            "created_at": now,
+            "attempts": 0,
+            "next_attempt_at": now,
+        }
+        for url in destinations
+    ])
+    return len(destinations)
+
+
+def wake_dispatcher():
+    """Nudge this process's dispatcher; call after the enqueuing transaction commits"""
+    if _dispatcher is not None:
+        _dispatcher.wake()
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempts))
+
+
+def post_json(url: str, body: dict, timeout: float = REQUEST_TIMEOUT):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        if response.status >= 300:
+            raise RuntimeError(f"HTTP {response.status}")
+
+
+class Dispatcher:
+    """Background drainer for the outbox (one per process)"""
+
+    def __init__(self, engine=None, batch_size: int = BATCH_SIZE, max_concurrency: int = MAX_CONCURRENCY,
+                 poll_interval: float = POLL_INTERVAL, send=post_json, max_attempts: int = MAX_ATTEMPTS):
+        self.engine = engine or get_engine()
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.send = send
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="outbox")
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def claim(self) -> list[dict]:
+        """Lease up to batch_size due events for this process"""
+        now = _now()
+        token = str(uuid.uuid4())
+        due = (
+            select(outbox_events.c.id)
+            .where(
+                outbox_events.c.delivered_at.is_(None),
+                outbox_events.c.dead_at.is_(None),
+                outbox_events.c.next_attempt_at <= now,
+                or_(outbox_events.c.locked_until.is_(None), outbox_events.c.locked_until < now),
+            )
+            .order_by(outbox_events.c.id)
+            .limit(self.batch_size)
+        )
+        with self.engine.begin() as conn:
+            ids = conn.execute(due).scalars().all()
+            if not ids:
+                return []
+            # Re-check the lease in the UPDATE so a concurrent claimer cannot take the same rows
+            conn.execute(
+                outbox_events.update()
+                .where(
+                    outbox_events.c.id.in_(ids),
+                    or_(outbox_events.c.locked_until.is_(None), outbox_events.c.locked_until < now),
+                )
+                .values(claim_token=token, locked_until=now + timedelta(seconds=LEASE_SECONDS))
+            )
+            rows = conn.execute(
+                select(outbox_events).where(outbox_events.c.claim_token == token).order_by(outbox_events.c.id)
+            ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def _deliver(self, destination: str, rows: list[dict]):
+        body = {
+            "events": [
+                {"id": row["event_id"], "type": row["event_type"], "created_at": str(row["created_at"]),
+                 "payload": json.loads(row["payload"])}
+                for row in rows
+            ]
+        }
+        try:
+            self.send(destination, body)
+            error = None
+        except Exception as exc:
+            error = repr(exc)
+
+        ids = [row["id"] for row in rows]
+        now = _now()
+        with self.engine.begin() as conn:
+            if error is None:
+                conn.execute(
+                    outbox_events.update().where(outbox_events.c.id.in_(ids))
+                    .values(delivered_at=now, locked_until=None, claim_token=None, last_error=None)
+                )
+                return len(rows)
+
+            logger.warning("Outbox delivery to %s failed: %s", destination, error)
+            for row in rows:
+                attempts = row["attempts"] + 1
+                dead = attempts >= self.max_attempts
+                if dead:
+                    logger.error("Outbox event %s to %s dead-lettered after %d attempts",
+                                 row["event_id"], destination, attempts)
+                conn.execute(
+                    outbox_events.update().where(outbox_events.c.id == row["id"]).values(
+                        attempts=attempts,
+                        next_attempt_at=now + timedelta(seconds=backoff_seconds(attempts)),
+                        locked_until=None,
+                        claim_token=None,
+                        last_error=error,
+                        dead_at=now if dead else None,
+                    )
+                )
+        return 0
+
+    def run_once(self) -> int:
+        """Claim one batch and deliver it, one request per destination; returns events delivered"""
+        rows = self.claim()
+        by_destination: dict[str, list[dict]] = {}
+        for row in rows:
+            by_destination.setdefault(row["destination"], []).append(row)
+
+        futures = [self._pool.submit(self._deliver, dest, batch) for dest, batch in by_destination.items()]
+        return sum(f.result() for f in futures)
+
+    def wake(self):
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                delivered = self.run_once()
+            except Exception:
+                logger.exception("Outbox dispatcher pass failed")
+                delivered = 0
+            if delivered < self.batch_size:
+                # Nothing (more) due right now: sleep until nudged or the next poll
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="outbox-dispatcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._pool.shutdown(wait=False)
+
+
+_dispatcher: Dispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def ensure_dispatcher() -> Dispatcher | None:
+    """Start this process's dispatcher if any endpoint is configured"""
+    global _dispatcher
+    if not endpoints():
+        return None
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = Dispatcher().start()
+    return _dispatcher
+
+
+def retry_dead(engine=None) -> int:
+    """Put dead-lettered events back in the queue; returns how many"""
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        return conn.execute(
+            outbox_events.update()
+            .where(outbox_events.c.dead_at.is_not(None), outbox_events.c.delivered_at.is_(None))
+            .values(dead_at=None, attempts=0, next_attempt_at=_now())
+        ).rowcount
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["retry-dead"]:
+        print(f"Requeued {retry_dead()} dead-lettered event(s)")
+        return 0
+    if argv[:1] != ["drain"]:
+        print("usage: python outbox.py drain | retry-dead")
+        return 2
+    dispatcher = Dispatcher()
+    total = 0
+    while True:
+        delivered = dispatcher.run_once()
+        total += delivered
+        if delivered == 0:
+            break
+    print(f"Delivered {total} event(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
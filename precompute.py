@@ -0,0 +1,121 @@
+"""
+House of Cards Assessment™
+Speculative Precompute - start on the results while the last lifeline is open
+
+On the final lifeline the next step is almost always "Generate Assessment",
+so once the answers have stayed unchanged for STABLE_SECONDS a background
+job computes what the results page and brief will need:
+
+    analysis and stability   -> the session's artifacts (session_memory)
+    map PNG and brief HTML   -> the shared artifact cache
+
+Every new set of answers cancels the session's previous job. Cancellation
+is checked between stages, and stale results never reach the session because
+session artifacts are keyed by the answers they were computed from. Nothing
+with side effects (storage, outbox) runs speculatively.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from session_memory import fingerprint, session_artifact
+
+logger = logging.getLogger(__name__)
+
+STABLE_SECONDS = 1.0
+MAX_WORKERS = 2
+MAX_TRACKED = 1000  # finished jobs remembered so identical answers are not redone
+
+_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="precompute")
+_lock = threading.Lock()
+_jobs: dict[str, "_Job"] = {}
+_counters = {"started": 0, "completed": 0, "cancelled": 0}
+
+
+class Cancelled(Exception):
+    pass
+
+
+class _Job:
+    def __init__(self, digest: str):
+        self.digest = digest
+        self.cancel = threading.Event()
+        self.done = False
+
+    def checkpoint(self, seconds: float = 0):
+        """Raise Cancelled if superseded (optionally waiting first)"""
+        if self.cancel.wait(seconds) if seconds else self.cancel.is_set():
+            raise Cancelled
+
+
+def _run(job: _Job, session_id: str, org_name: str, assessment_date: str, responses: dict):
+    from results import (
+        analyze_signal_responses,
+        build_executive_brief_html,
+        fig_to_png_base64,
+        network_signal_map_spec,
+    )
+    from stability import status_stability
+
+    try:
+        job.checkpoint(STABLE_SECONDS)  # wait for the answers to settle
+
+        analysis = session_artifact(
+            "analysis", responses, lambda: analyze_signal_responses(responses), session_id=session_id
+        )
+        if not analysis:
+            return
+        job.checkpoint()
+        stability = session_artifact(
+            "stability", responses, lambda: status_stability(analysis), session_id=session_id
+        )
+        job.checkpoint()
+        map_png_b64 = fig_to_png_base64(network_signal_map_spec(analysis))
+        job.checkpoint()
+        build_executive_brief_html(org_name, assessment_date, analysis, map_png_b64, stability)
+        job.done = True
+        _count("completed")
+    except Cancelled:
+        _count("cancelled")
+    except Exception:
+        logger.warning("Speculative precompute failed", exc_info=True)
+    finally:
+        if not job.done:
+            with _lock:
+                if _jobs.get(session_id) is job:
+                    del _jobs[session_id]
+
+
+def _count(name: str):
+    with _lock:
+        _counters[name] += 1
+
+
+def speculate_results(session_id: str, org_name: str, assessment_date, responses: dict):
+    """(Re)start precomputing results for these answers; no-op if already underway"""
+    responses = dict(responses)
+    digest = fingerprint([org_name, str(assessment_date), responses])
+    with _lock:
+        current = _jobs.get(session_id)
+        if current is not None:
+            if current.digest == digest:
+                return
+            current.cancel.set()
+        if len(_jobs) >= MAX_TRACKED:
+            for sid in [sid for sid, j in _jobs.items() if j.done]:
+                del _jobs[sid]
+        job = _jobs[session_id] = _Job(digest)
+        _counters["started"] += 1
+    _pool.submit(_run, job, session_id, org_name, str(assessment_date), responses)
+
+
+def cancel_speculation(session_id: str):
+    with _lock:
+        job = _jobs.pop(session_id, None)
+    if job is not None:
+        job.cancel.set()
+
+
+def precompute_stats() -> dict:
+    with _lock:
+        return {**_counters, "running": sum(not job.done for job in _jobs.values())}
@@ -0,0 +1,221 @@
+"""
+House of Cards Assessment™
+On-Demand Profiler - sampled stacks and tracemalloc snapshots for slow reruns
+
+Off by default. Either switch arms it for the next N script runs:
+
+    SIA_PROFILE_RUNS=5             the next 5 runs in this process (any session)
+    ?operator=<token>&profile=5    the next 5 runs of this operator's session
+
+While a run is profiled, a sampler thread records the script thread's stack
+every SAMPLE_INTERVAL seconds and tracemalloc traces allocations. Each run
+writes to SIA_PROFILE_DIR (default data/profiles):
+
+    <stamp>-<label>.folded         stacks in folded format (flamegraph.pl, speedscope)
+    <stamp>-<label>.tracemalloc    tracemalloc.Snapshot.load()-able snapshot
+    <stamp>-<label>.<phase>.tracemalloc   snapshot at the end of a phase
+    <stamp>-<label>.txt            duration, sample count and top allocations
+
+Phases such as the brief build appear as their own frame ("brief") in the
+stacks and get their own snapshot. Only the newest SIA_PROFILE_KEEP runs
+(default 50) are kept; SIA_PROFILE_TRACE_FRAMES deepens allocation
+tracebacks (default 1). When nothing is armed, each run costs one lookup.
+"""
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL = 0.005
+# Frames kept per allocation; deeper tracebacks make tracing much slower
+TRACEMALLOC_FRAMES = 1
+MAX_RUNS = 20
+DEFAULT_PROFILE_DIR = Path("data/profiles")
+
+_lock = threading.Lock()
+_active: dict[int, "_Profile"] = {}  # script thread id -> profile
+_sampler: threading.Thread | None = None
+_tracing_users = 0
+_process_runs = None  # remaining runs armed by SIA_PROFILE_RUNS (read once)
+
+
+def profile_dir() -> Path:
+    return Path(os.environ.get("SIA_PROFILE_DIR", DEFAULT_PROFILE_DIR))
+
+
+def keep_runs() -> int:
+    try:
+        return int(os.environ.get("SIA_PROFILE_KEEP", 50))
+    except ValueError:
+        return 50
+
+
+class _Profile:
+    def __init__(self, label: str):
+        self.label = label
+        self.phases = [label]
+        self.stacks = Counter()
+        self.snapshots: list[tuple[str, tracemalloc.Snapshot]] = []
+        self.started = time.perf_counter()
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _sample_loop():
+    global _sampler
+    while True:
+        with _lock:
+            if not _active:
+                _sampler = None
+                return
+            profiles = list(_active.items())
+        frames = sys._current_frames()
+        for thread_id, profile in profiles:
+            frame = frames.get(thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame))
+                frame = frame.f_back
+            stack.reverse()
+            profile.stacks[";".join(profile.phases + stack)] += 1
+        time.sleep(SAMPLE_INTERVAL)
+
+
+def _start_tracing():
+    global _tracing_users
+    with _lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(int(os.environ.get("SIA_PROFILE_TRACE_FRAMES", TRACEMALLOC_FRAMES)))
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    global _tracing_users
+    with _lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _claim_run() -> bool:
+    """True if this run should be profiled (consumes one armed run)"""
+    global _process_runs
+    if _process_runs is None:
+        try:
+            _process_runs = max(0, int(os.environ.get("SIA_PROFILE_RUNS", 0)))
+        except ValueError:
+            _process_runs = 0
+    if _process_runs:
+        with _lock:
+            if _process_runs:
+                _process_runs -= 1
+                return True
+
+    import streamlit as st
+
+    requested = st.query_params.get("profile")
+    if requested:
+        from core import is_operator
+
+        del st.query_params["profile"]  # arm once, not on every rerun
+        if is_operator():
+            try:
+                st.session_state.profile_runs = min(MAX_RUNS, max(0, int(requested)))
+            except ValueError:
+                pass
+    if st.session_state.get("profile_runs"):
+        st.session_state.profile_runs -= 1
+        return True
+    return False
+
+
+def _prune(directory: Path):
+    runs = {}
+    for path in directory.iterdir():
+        if path.suffix in (".folded", ".tracemalloc", ".txt"):
+            stem = path.name.split(".")[0]
+            runs.setdefault(stem, []).append(path)
+    stale = sorted(runs, reverse=True)[keep_runs():]  # stems start with a sortable stamp
+    for stem in stale:
+        for path in runs[stem]:
+            path.unlink(missing_ok=True)
+
+
+def _write(profile: _Profile, elapsed: float):
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{profile.label}"
+
+    with open(directory / f"{stem}.folded", "w", encoding="utf-8") as fh:
+        for stack, count in profile.stacks.most_common():
+            fh.write(f"{stack} {count}\n")
+
+    lines = [f"{profile.label}: {elapsed * 1000:.1f} ms, {sum(profile.stacks.values())} samples", ""]
+    for name, snapshot in profile.snapshots:
+        suffix = "" if name == profile.label else f".{name}"
+        snapshot.dump(str(directory / f"{stem}{suffix}.tracemalloc"))
+        stats = [s for s in snapshot.statistics("lineno") if s.traceback[0].filename != __file__]
+        lines.append(f"Top allocations at end of {name} ({sum(s.size for s in stats) / 1024:.0f} KiB traced):")
+        lines += [f"  {stat}" for stat in stats[:15]]
+        lines.append("")
+    (directory / f"{stem}.txt").write_text("\n".join(lines), encoding="utf-8")
+
+    _prune(directory)
+    logger.info("Profile written: %s", directory / stem)
+
+
+@contextmanager
+def profile_run(label: str = "run"):
+    """Profile this script run if the switch is armed (otherwise a no-op)"""
+    global _sampler
+    if threading.get_ident() in _active or not _claim_run():
+        yield
+        return
+
+    profile = _Profile(label)
+    _start_tracing()
+    with _lock:
+        _active[threading.get_ident()] = profile
+        if _sampler is None:
+            _sampler = threading.Thread(target=_sample_loop, name="profiler-sampler", daemon=True)
+            _sampler.start()
+    try:
+        yield
+    finally:
+        with _lock:
+            _active.pop(threading.get_ident(), None)
+        elapsed = time.perf_counter() - profile.started
+        try:
+            profile.snapshots.append((label, tracemalloc.take_snapshot()))
+        finally:
+            _stop_tracing()
+        try:
+            _write(profile, elapsed)
+        except Exception:
+            logger.exception("Could not write profile")
+
+
+@contextmanager
+def profile_phase(name: str):
+    """Mark a phase (e.g. the brief build) inside a profiled run; free otherwise"""
+    profile = _active.get(threading.get_ident())
+    if profile is None:
+        yield
+        return
+
+    profile.phases.append(name)
+    try:
+        yield
+    finally:
+        profile.phases.pop()
+        profile.snapshots.append((name, tracemalloc.take_snapshot()))
@@ -4,66 +4,70 @@ Results Page with Signal Map Visualization
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
-import plotly.graph_objects as go
 from collections import Counter
+from functools import lru_cache
 import json
+import hashlib
+import logging
+import math
 from pathlib import Path
 import base64
-from jinja2 import Template
 
-def scroll_to_top():
-    """Injects JavaScript to scroll the main content area to the top."""
-    components.html(
-        """
-        <script>
-            var mainSection = window.parent.document.querySelector('section.main');
-            if (mainSection) {
-                mainSection.scrollTo({ top: 0, behavior: 'auto' });
-            }
-        </script>
-        """,
-        height=0,
-    )
-    
+from artifact_cache import cached
+from core import APP_VERSION, LIFELINES, go_to, is_lite_mode, is_operator
+from rules import active_rules, classify
+from stability import N_REPLICATES, describe_stability, status_stability
+from profiler import profile_phase
+from session_memory import discard_session, has_artifact, session_artifact
+from storage import SignalStoreError, compute_trend, load_history, record_completed_assessment
+
+logger = logging.getLogger(__name__)
+
+# plotly, numpy and jinja2 are imported where they are used so that importing
+# this module stays cheap; warmup.py pulls them in before the first session.
+
 LOGO_COLOR_PATH = Path("assets/southwind_logo_color_tuned.png")
 TAGLINE = "Readiness Is Not a Plan. It’s a Capability."
 CONTACT_LINE = "Southwind Planning • mike@southwindplanning.com • " + TAGLINE
 
+@lru_cache(maxsize=8)
 def file_to_base64(path: Path) -> str | None:
     if not path.exists():
         return None
     return base64.b64encode(path.read_bytes()).decode("utf-8")
 
-def fig_to_png_base64(fig) -> str | None:
+PNG_EXPORT = dict(format="png", width=1400, height=820, scale=2)
+
+def _render_png_base64(fig) -> str | None:
     try:
         import plotly.io as pio
-        png_bytes = pio.to_image(fig, format="png", width=1400, height=820, scale=2)
+        png_bytes = pio.to_image(fig, validate=False, **PNG_EXPORT)
         return base64.b64encode(png_bytes).decode("utf-8")
     except Exception:
         return None
 
+def fig_to_png_base64(fig) -> str | None:
+    """PNG of a figure (or spec) as base64, shared across processes via the artifact cache"""
+    return cached("map_png", [figure_to_json(fig), PNG_EXPORT], lambda: _render_png_base64(fig))
+
 def analyze_responses():
     """Analyze responses and generate insights"""
+    return analyze_signal_responses(st.session_state.responses)
+
+
+def analyze_signal_responses(responses: dict):
+    """Analyze a responses dict (as kept in st.session_state.responses)"""
     lifeline_analysis = {}
     
-    # Define lifeline names
-    lifelines = {
-        0: 'Leadership Awareness',
-        1: 'Operational Dependencies',
-        2: 'Decision Clarity',
-        3: 'Resource Resilience',
-        4: 'Information Flow'
-    }
-    
-    for lifeline_idx, lifeline_name in lifelines.items():
+    for lifeline_idx, lifeline in LIFELINES.items():
+        lifeline_name = lifeline['name']
         signals = []
         
         # Count each signal type for this lifeline
-        for q_idx in range(5):  # 5 questions per lifeline
+        for q_idx in range(len(lifeline['questions'])):
             key = f'{lifeline_idx}_{q_idx}_signal'
-            if key in st.session_state.responses:
-                signal = st.session_state.responses[key].split(' - ')[0]  # Get just "Observed", etc.
+            if key in responses:
+                signal = responses[key].split(' - ')[0]  # Get just "Observed", etc.
                 signals.append(signal)
         
         if signals:
@@ -75,19 +79,8 @@ def analyze_responses():
             compensated_pct = (signal_counts.get('Compensated', 0) / total) * 100
             fragile_pct = ((signal_counts.get('Assumed', 0) + signal_counts.get('Historical', 0)) / total) * 100
             
-            # Determine status
-            if observed_pct >= 60:
-                status = 'SOLID'
-                description = 'Largely supported by observed signals with current evidence.'
-            elif compensated_pct >= 40:
-                status = 'FRAGILE'
-                description = 'Stability depends on individual effort and informal fixes.'
-            elif fragile_pct >= 60:
-                status = 'CONDITIONAL'
-                description = 'Confidence appears to rest on belief or outdated verification.'
-            else:
-                status = 'MIXED'
-                description = 'Shows varied signal patterns requiring attention.'
+            # Determine status (see rules.STATUS_RULES)
+            status, description = classify(observed_pct, compensated_pct, fragile_pct)
             
             lifeline_analysis[lifeline_name] = {
                 'signals': signal_counts,
@@ -101,32 +94,133 @@ def analyze_responses():
     return lifeline_analysis
 
 
-def create_signal_map(analysis):
-    """Create Plotly signal map visualization"""
-    
-    # Prepare data for radial chart
-    lifelines = list(analysis.keys())
-    
-    # Map status to numeric strength (for visualization)
-    status_strength = {
-        'SOLID': 100,
-        'CONDITIONAL': 60,
-        'MIXED': 40,
-        'FRAGILE': 20
-    }
-    
-    # Map status to colors
-    status_colors = {
-        'SOLID': '#10b981',      # Green
-        'CONDITIONAL': '#f59e0b', # Amber
-        'MIXED': '#6b7280',       # Gray
-        'FRAGILE': '#ef4444'      # Red
+# Map status to numeric strength (for visualization)
+STATUS_STRENGTH = {
+    'SOLID': 100,
+    'CONDITIONAL': 60,
+    'MIXED': 40,
+    'FRAGILE': 20
+}
+
+# Map status to colors
+STATUS_COLORS = {
+    'SOLID': '#10b981',      # Green
+    'CONDITIONAL': '#f59e0b', # Amber
+    'MIXED': '#6b7280',       # Gray
+    'FRAGILE': '#ef4444'      # Red
+}
+
+# Map status to line styles
+NETWORK_STATUS_STYLES = {
+    'SOLID': dict(width=4, dash='solid', color='#10b981'),
+    'CONDITIONAL': dict(width=3, dash='dot', color='#f59e0b'),
+    'MIXED': dict(width=2, dash='dash', color='#6b7280'),
+    'FRAGILE': dict(width=2, dash='dash', color='#ef4444')
+}
+
+RADAR_LAYOUT = {
+    'polar': dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 100],
+            showticklabels=False,
+            ticks='',
+            showline=False
+        ),
+        angularaxis=dict(
+            direction='clockwise',
+            rotation=90
+        )
+    ),
+    'showlegend': False,
+    'title': {
+        'text': 'Signal Integrity Map',
+        'x': 0.5,
+        'xanchor': 'center',
+        'font': {'size': 20, 'family': 'Arial, sans-serif'}
+    },
+    'height': 500,
+    'margin': dict(l=80, r=80, t=80, b=80),
+    'paper_bgcolor': 'white',
+    'plot_bgcolor': 'white',
+    'hovermode': 'closest',
+    'dragmode': 'pan'
+}
+
+RADAR_TRACE = {
+    'type': 'scatterpolar',
+    'fill': 'toself',
+    'fillcolor': 'rgba(99, 102, 241, 0.2)',
+    'line': dict(color='rgb(99, 102, 241)', width=2),
+    'marker': dict(size=12, line=dict(color='white', width=2)),
+    'name': 'Signal Strength',
+    'hovertemplate': '%{text}<extra></extra>'
+}
+
+NETWORK_LAYOUT = {
+    'title': {
+        'text': 'Signal Network Map',
+        'x': 0.5,
+        'xanchor': 'center',
+        'font': {'size': 20}
+    },
+    'xaxis': dict(visible=False, range=[-3, 3]),
+    'yaxis': dict(visible=False, range=[-3, 3]),
+    'height': 600,
+    'showlegend': False,
+    'hovermode': 'closest',
+    'paper_bgcolor': 'white',
+    'plot_bgcolor': 'white',
+    'margin': dict(l=20, r=20, t=60, b=20)
+}
+
+NETWORK_CENTER_TRACE = {
+    'type': 'scatter',
+    'x': [0],
+    'y': [0],
+    'mode': 'markers+text',
+    'marker': dict(size=30, color='#1e293b', line=dict(width=2, color='white')),
+    'text': ['Leadership<br>Confidence'],
+    'textposition': 'middle center',
+    'textfont': dict(color='white', size=10),
+    'showlegend': False,
+    'hoverinfo': 'skip'
+}
+
+
+@lru_cache(maxsize=1)
+def _figure_templates() -> dict[str, str]:
+    """
+    Prebuilt figure skeletons, serialized once per process.
+
+    The plotly theme is resolved into the layout here so the specs render the
+    same as validated go.Figure objects; callers get a private copy by parsing
+    the (immutable) JSON string and only fill in data arrays and hover text.
+    """
+    import plotly.io as pio
+
+    theme = pio.templates[pio.templates.default].to_plotly_json()
+    return {
+        'radar': json.dumps({'data': [RADAR_TRACE], 'layout': {**RADAR_LAYOUT, 'template': theme}}),
+        'network': json.dumps({'data': [], 'layout': {**NETWORK_LAYOUT, 'template': theme}}),
     }
-    
-    # Get values and colors for each lifeline
-    values = [status_strength[analysis[lf]['status']] for lf in lifelines]
-    colors = [status_colors[analysis[lf]['status']] for lf in lifelines]
-    
+
+
+@lru_cache(maxsize=8)
+def _network_positions(n: int) -> tuple[tuple[float, float], ...]:
+    """Lifeline node positions on a circle around the central node"""
+    radius = 2
+    return tuple(
+        (radius * math.cos(2 * math.pi * i / n), radius * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    )
+
+
+def signal_map_spec(analysis) -> dict:
+    """Radar signal map as a plain Plotly figure dict (no validation)"""
+    spec = json.loads(_figure_templates()['radar'])
+    lifelines = list(analysis.keys())
+
     # Prepare hover text with detailed information
     hover_texts = []
     for lf in lifelines:
@@ -143,118 +237,38 @@ def create_signal_map(analysis):
             f"<br>{data['description']}"
         )
         hover_texts.append(hover_text)
-    
-    # Create radar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=lifelines,
-        fill='toself',
-        fillcolor='rgba(99, 102, 241, 0.2)',
-        line=dict(color='rgb(99, 102, 241)', width=2),
-        marker=dict(
-            size=12,
-            color=colors,
-            line=dict(color='white', width=2)
-        ),
-        name='Signal Strength',
-        text=hover_texts,
-        hovertemplate='%{text}<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                showticklabels=False,
-                ticks='',
-                showline=False
-            ),
-            angularaxis=dict(
-                direction='clockwise',
-                rotation=90
-            )
-        ),
-        showlegend=False,
-        title={
-            'text': 'Signal Integrity Map',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'family': 'Arial, sans-serif'}
-        },
-        height=500,
-        margin=dict(l=80, r=80, t=80, b=80),
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        hovermode='closest',
-        dragmode='pan'
-    )
-    
-    return fig
 
+    trace = spec['data'][0]
+    trace['r'] = [STATUS_STRENGTH[analysis[lf]['status']] for lf in lifelines]
+    trace['theta'] = lifelines
+    trace['marker']['color'] = [STATUS_COLORS[analysis[lf]['status']] for lf in lifelines]
+    trace['text'] = hover_texts
+    return spec
 
-def create_network_signal_map(analysis):
-    """Create network-style signal map (alternative visualization)"""
-    import numpy as np
-    
-    # Central node at origin
-    center_x, center_y = 0, 0
-    
-    # Calculate positions for lifeline nodes in a circle
+
+def network_signal_map_spec(analysis) -> dict:
+    """Network signal map as a plain Plotly figure dict (no validation)"""
+    spec = json.loads(_figure_templates()['network'])
     lifelines = list(analysis.keys())
-    n = len(lifelines)
-    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
-    radius = 2
-    
-    node_x = [center_x] + [radius * np.cos(angle) for angle in angles]
-    node_y = [center_y] + [radius * np.sin(angle) for angle in angles]
-    
-    # Map status to line styles
-    status_styles = {
-        'SOLID': dict(width=4, dash='solid', color='#10b981'),
-        'CONDITIONAL': dict(width=3, dash='dot', color='#f59e0b'),
-        'MIXED': dict(width=2, dash='dash', color='#6b7280'),
-        'FRAGILE': dict(width=2, dash='dash', color='#ef4444')
-    }
-    
-    # Create figure
-    fig = go.Figure()
-    
-    # Add edges (lines from center to each lifeline)
-    for i, lifeline in enumerate(lifelines, 1):
-        status = analysis[lifeline]['status']
-        style = status_styles[status]
-        
-        fig.add_trace(go.Scatter(
-            x=[center_x, node_x[i]],
-            y=[center_y, node_y[i]],
-            mode='lines',
-            line=style,
-            showlegend=False,
-            hoverinfo='skip'
-        ))
-    
-    # Add central node
-    fig.add_trace(go.Scatter(
-        x=[center_x],
-        y=[center_y],
-        mode='markers+text',
-        marker=dict(size=30, color='#1e293b', line=dict(width=2, color='white')),
-        text=['Leadership<br>Confidence'],
-        textposition='middle center',
-        textfont=dict(color='white', size=10),
-        showlegend=False,
-        hoverinfo='skip'
-    ))
-    
-    # Add lifeline nodes with enhanced hover
-    for i, lifeline in enumerate(lifelines, 1):
+    positions = _network_positions(len(lifelines))
+
+    edges, nodes = [], []
+    for lifeline, (x, y) in zip(lifelines, positions):
         status = analysis[lifeline]['status']
-        style = status_styles[status]
+        style = NETWORK_STATUS_STYLES[status]
         signals = analysis[lifeline]['signals']
-        
+
+        # Edge from the center to the lifeline
+        edges.append({
+            'type': 'scatter',
+            'x': [0, x],
+            'y': [0, y],
+            'mode': 'lines',
+            'line': dict(style),
+            'showlegend': False,
+            'hoverinfo': 'skip'
+        })
+
         # Create detailed hover text
         hover_text = (
             f"<b>{lifeline}</b><br>"
@@ -265,68 +279,134 @@ def create_network_signal_map(analysis):
             f"Historical: {signals.get('Historical', 0)}<br>"
             f"Compensated: {signals.get('Compensated', 0)}"
         )
-        
-        fig.add_trace(go.Scatter(
-            x=[node_x[i]],
-            y=[node_y[i]],
-            mode='markers+text',
-            marker=dict(
-                size=25,
-                color=style['color'],
-                line=dict(width=2, color='white')
-            ),
-            text=[lifeline.replace(' ', '<br>')],
-            textposition='top center',
-            textfont=dict(size=9),
-            showlegend=False,
-            hovertext=hover_text,
-            hoverinfo='text'
-        ))
-    
-    # Update layout
-    fig.update_layout(
-        title={
-            'text': 'Signal Network Map',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20}
-        },
-        xaxis=dict(visible=False, range=[-3, 3]),
-        yaxis=dict(visible=False, range=[-3, 3]),
-        height=600,
-        showlegend=False,
-        hovermode='closest',
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        margin=dict(l=20, r=20, t=60, b=20)
-    )
-    
-    return fig
-def build_executive_brief_html(org_name: str, assessment_date: str, analysis: dict, map_png_b64: str | None):
-    logo_b64 = file_to_base64(LOGO_COLOR_PATH)
 
-    strength = {"SOLID": 4, "CONDITIONAL": 3, "MIXED": 2, "FRAGILE": 1}
-    strongest = max(analysis.items(), key=lambda kv: strength.get(kv[1]["status"], 0))
-    weakest = min(analysis.items(), key=lambda kv: strength.get(kv[1]["status"], 9))
-    strong_name, strong_data = strongest
-    weak_name, weak_data = weakest
+        nodes.append({
+            'type': 'scatter',
+            'x': [x],
+            'y': [y],
+            'mode': 'markers+text',
+            'marker': dict(size=25, color=style['color'], line=dict(width=2, color='white')),
+            'text': [lifeline.replace(' ', '<br>')],
+            'textposition': 'top center',
+            'textfont': dict(size=9),
+            'showlegend': False,
+            'hovertext': hover_text,
+            'hoverinfo': 'text'
+        })
 
-    framing = (
-        f"In this assessment for <b>{org_name}</b>, the strongest signal integrity appears in "
-        f"<b>{strong_name}</b> (<b>{strong_data['status']}</b>), while <b>{weak_name}</b> shows the highest fragility "
-        f"(<b>{weak_data['status']}</b>)."
-    )
+    spec['data'] = edges + [dict(NETWORK_CENTER_TRACE)] + nodes
+    return spec
 
-    grid_rows = []
-    for lf, data in analysis.items():
-        sig = data["signals"]
-        grid_rows.append({
-            "lifeline": lf,
-            "status": data["status"],
-            "pattern": f"Observed {sig.get('Observed',0)} • Assumed {sig.get('Assumed',0)} • Historical {sig.get('Historical',0)} • Compensated {sig.get('Compensated',0)}"
+
+def figure_from_spec(spec: dict):
+    """Wrap a prebuilt spec in a go.Figure without re-running property validation"""
+    import plotly.graph_objects as go
+    return go.Figure(spec, _validate=False)
+
+
+def figure_to_json(fig_or_spec) -> str:
+    """Serialize a figure (or spec) with orjson when available"""
+    spec = fig_or_spec if isinstance(fig_or_spec, dict) else fig_or_spec.to_dict()
+    try:
+        import orjson
+        return orjson.dumps(spec).decode("utf-8")
+    except ImportError:
+        return json.dumps(spec, separators=(",", ":"))
+
+
+def trend_chart_spec(history: list[dict]) -> dict:
+    """Observed-signal share per lifeline across an organization's assessments"""
+    spec = json.loads(_figure_templates()['network'])
+    spec['layout'].update({
+        'title': {'text': 'Observed Signals Over Time', 'x': 0.5, 'xanchor': 'center', 'font': {'size': 18}},
+        'xaxis': dict(visible=True, type='category', title='Assessment Date'),
+        'yaxis': dict(visible=True, range=[0, 100], title='Observed (%)'),
+        'height': 420,
+        'showlegend': True,
+        'margin': dict(l=60, r=20, t=60, b=60),
+    })
+
+    dates = [str(entry['assessment_date']) for entry in history]
+    names = list(history[-1]['lifelines']) if history else []
+    for name in names:
+        shares = []
+        for entry in history:
+            data = entry['lifelines'].get(name)
+            total = sum(data['signals'].values()) if data else 0
+            shares.append(round(data['signals'].get('Observed', 0) / total * 100, 1) if total else None)
+        spec['data'].append({
+            'type': 'scatter',
+            'x': dates,
+            'y': shares,
+            'mode': 'lines+markers',
+            'name': name,
         })
+    return spec
+
+
+def create_trend_chart(history: list[dict]):
+    """Create the per-organization trend chart"""
+    return figure_from_spec(trend_chart_spec(history))
+
+
+def record_assessment(analysis: dict) -> list[dict]:
+    """
+    Store this session's assessment once and return the history to compare with.
+
+    Organization names are typed freely, so the full history of an
+    organization is only shown to operators; everyone else sees the
+    assessments this session created.
+    """
+    responses = st.session_state.get("responses", {})
+    fingerprint = hashlib.sha256(json.dumps(
+        [st.session_state.org_name, str(st.session_state.assessment_date), responses], sort_keys=True
+    ).encode("utf-8")).hexdigest()
+
+    try:
+        saved = st.session_state.get("saved_fingerprint") == fingerprint
+        if not saved or st.session_state.get("signals_appended_id") != st.session_state.get("saved_assessment_id"):
+            try:
+                assessment_id = record_completed_assessment(
+                    org_name=st.session_state.org_name,
+                    assessment_date=st.session_state.assessment_date,
+                    analysis=analysis,
+                    responses=responses,
+                    ruleset_version=active_rules()["version"],
+                    # Already saved: only the signal-store append is retried
+                    assessment_id=st.session_state.get("saved_assessment_id") if saved else None,
+                )
+            except SignalStoreError as exc:
+                logger.exception("Could not append assessment to the signal store")
+                assessment_id = exc.assessment_id
+            else:
+                st.session_state["signals_appended_id"] = assessment_id
+            if not saved:
+                st.session_state["saved_assessment_id"] = assessment_id
+                st.session_state["saved_fingerprint"] = fingerprint
+                st.session_state.setdefault("own_assessment_ids", []).append(assessment_id)
+        if is_operator():
+            return load_history(st.session_state.org_name)
+        return load_history(st.session_state.org_name, assessment_ids=st.session_state.get("own_assessment_ids", []))
+    except Exception:
+        # History is a convenience; never let storage problems break the results page
+        logger.exception("Could not store or load assessment history")
+        return []
+
+
+def create_signal_map(analysis):
+    """Create Plotly signal map visualization"""
+    return figure_from_spec(signal_map_spec(analysis))
+
+
+def create_network_signal_map(analysis):
+    """Create network-style signal map (alternative visualization)"""
+    return figure_from_spec(network_signal_map_spec(analysis))
 
-    template = Template(r"""
+
+# Bump when the brief rendering code changes (part of the artifact cache key)
+BRIEF_RENDER_VERSION = 2
+
+BRIEF_TEMPLATE = r"""
 <!doctype html>
 <html>
 <head>
@@ -345,6 +425,7 @@ def build_executive_brief_html(org_name: str, assessment_date: str, analysis: di
   th, td { border: 1px solid #e5e7eb; padding: 7px; font-size: 11px; vertical-align: top; }
   th { background: #f9fafb; }
   .badge { font-weight: 700; }
+  .note { font-size: 9.5px; color: #6b7280; margin-top: 4px; }
   .SOLID { color: #065f46; }
   .CONDITIONAL { color: #92400e; }
   .MIXED { color: #374151; }
@@ -379,18 +460,20 @@ def build_executive_brief_html(org_name: str, assessment_date: str, analysis: di
   <div class="section-title">Lifeline Integrity Grid</div>
   <table>
     <thead>
-      <tr><th>Lifeline</th><th>Status</th><th>Signal Pattern</th></tr>
+      <tr><th>Lifeline</th><th>Status</th><th>Stability</th><th>Signal Pattern</th></tr>
     </thead>
     <tbody>
     {% for r in grid_rows %}
       <tr>
         <td>{{ r.lifeline }}</td>
         <td class="badge {{ r.status }}">{{ r.status }}</td>
+        <td>{{ r.stability }}</td>
         <td>{{ r.pattern }}</td>
       </tr>
     {% endfor %}
     </tbody>
   </table>
+  <div class="note">Stability: share of {{ n_replicates }} bootstrap resamples of each lifeline's answers that reproduce its status.</div>
 
   {% if map_png_b64 %}
     <div class="section-title">Signal Map</div>
@@ -413,7 +496,71 @@ def build_executive_brief_html(org_name: str, assessment_date: str, analysis: di
   </div>
 </body>
 </html>
-""")
+"""
+
+
+@lru_cache(maxsize=1)
+def _brief_template():
+    """Compile the executive brief template once per process"""
+    from jinja2 import Template
+    return Template(BRIEF_TEMPLATE, autoescape=True)
+
+
+@lru_cache(maxsize=1)
+def brief_template_version() -> str:
+    """Changes whenever the template, its rendering or the app release changes (artifact cache key)"""
+    key = f"{APP_VERSION}\0{BRIEF_RENDER_VERSION}\0{BRIEF_TEMPLATE}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def build_executive_brief_html(org_name: str, assessment_date: str, analysis: dict, map_png_b64: str | None,
+                               stability: dict | None = None):
+    """Executive brief HTML, shared across processes via the artifact cache"""
+    inputs = [
+        org_name,
+        str(assessment_date),
+        analysis,
+        hashlib.sha256(map_png_b64.encode("ascii")).hexdigest() if map_png_b64 else None,
+        stability,
+        active_rules()["version"],
+        brief_template_version(),
+    ]
+    return cached("brief", inputs, lambda: _render_executive_brief_html(
+        org_name, assessment_date, analysis, map_png_b64, stability
+    ))
+
+
+def _render_executive_brief_html(org_name: str, assessment_date: str, analysis: dict, map_png_b64: str | None,
+                                 stability: dict | None = None):
+    from markupsafe import Markup, escape
+
+    logo_b64 = file_to_base64(LOGO_COLOR_PATH)
+    if stability is None:
+        stability = status_stability(analysis)
+
+    strength = {"SOLID": 4, "CONDITIONAL": 3, "MIXED": 2, "FRAGILE": 1}
+    strongest = max(analysis.items(), key=lambda kv: strength.get(kv[1]["status"], 0))
+    weakest = min(analysis.items(), key=lambda kv: strength.get(kv[1]["status"], 9))
+    strong_name, strong_data = strongest
+    weak_name, weak_data = weakest
+
+    # Organization names are typed by respondents and API partners
+    framing = Markup(
+        "In this assessment for <b>{}</b>, the strongest signal integrity appears in "
+        "<b>{}</b> (<b>{}</b>), while <b>{}</b> shows the highest fragility (<b>{}</b>)."
+    ).format(escape(org_name), strong_name, strong_data['status'], weak_name, weak_data['status'])
+
+    grid_rows = []
+    for lf, data in analysis.items():
+        sig = data["signals"]
+        grid_rows.append({
+            "lifeline": lf,
+            "status": data["status"],
+            "stability": f"{stability[lf]['stability']:.0%}" if lf in stability else "",
+            "pattern": f"Observed {sig.get('Observed',0)} • Assumed {sig.get('Assumed',0)} • Historical {sig.get('Historical',0)} • Compensated {sig.get('Compensated',0)}"
+        })
+
+    template = _brief_template()
 
     return template.render(
         logo_b64=logo_b64,
@@ -422,31 +569,49 @@ def build_executive_brief_html(org_name: str, assessment_date: str, analysis: di
         framing=framing,
         grid_rows=grid_rows,
         map_png_b64=map_png_b64,
+        n_replicates=f"{N_REPLICATES:,}",
         contact_line=CONTACT_LINE
     )
+
+
+def build_export_data(org_name: str, assessment_date, analysis: dict, stability: dict | None = None) -> dict:
+    """The JSON data export for one analysis"""
+    if stability is None:
+        stability = status_stability(analysis)
+    return {
+        "organization": org_name,
+        "assessment_date": str(assessment_date),
+        "ruleset_version": active_rules()["version"],
+        "analysis": {
+            k: {
+                "status": v.get("status"),
+                "description": v.get("description"),
+                "signals": dict(v.get("signals", {})),
+                "stability": stability.get(k, {}).get("shares", {}),
+            }
+            for k, v in analysis.items()
+        },
+    }
+
 def show_results_page():
     responses = st.session_state.get("responses", {})
     if not responses:
         st.error("No responses found. Please complete the assessment first.")
         return
 
-    # Force scroll to top upon loading results
-    scroll_to_top()
-
     st.title("Signal Integrity Assessment™")
     st.markdown(
         f"**{st.session_state.org_name}** | Assessment Date: {st.session_state.assessment_date}"
     )
     st.markdown("---")
 
-    # Analyze responses
-    analysis = analyze_responses()
+    # Analyze responses (derived artifacts live in the session memory governor)
+    analysis = session_artifact("analysis", responses, lambda: analyze_signal_responses(responses))
     if not isinstance(analysis, dict) or not analysis:
         st.error("Assessment analysis could not be generated. Please complete all questions.")
         return
 
-    # Store for later export / other pages
-    st.session_state["analysis"] = analysis
+    stability = session_artifact("stability", responses, lambda: status_stability(analysis))
 
     # Section 1: Executive Observations
     st.header("Executive Observations")
@@ -467,6 +632,8 @@ def show_results_page():
 
         if desc:
             st.write(desc)
+        if lifeline_name in stability:
+            st.caption(f"Status stability: {describe_stability(stability[lifeline_name])}")
 
     # Section 2: Signal Map Visualization
     st.header("Signal Integrity Map")
@@ -474,18 +641,34 @@ def show_results_page():
         "Node colors indicate status, and distance from center represents signal integrity."
     )
 
+    lite = st.toggle(
+        "Lite charts",
+        value=is_lite_mode(),
+        key="lite_toggle",
+        help="Static images instead of interactive charts; faster on slow connections.",
+        on_change=lambda: st.session_state.update(lite_mode=st.session_state.lite_toggle),
+    )
     viz_type = st.radio(
         "Visualization Style",
         ["Radar Chart", "Network Map"],
         horizontal=True,
     )
 
-    if viz_type == "Radar Chart":
-        fig = create_signal_map(analysis)
+    if lite:
+        # Server-rendered SVG: no plotly.js download, hover details as a table
+        from svg_charts import details_table_html, network_svg, radar_svg
+
+        svg = radar_svg(analysis) if viz_type == "Radar Chart" else network_svg(analysis)
+        st.markdown(f"<div style='max-width:560px;margin:auto'>{svg}</div>", unsafe_allow_html=True)
+        with st.expander("Map details"):
+            st.markdown(details_table_html(analysis), unsafe_allow_html=True)
     else:
-        fig = create_network_signal_map(analysis)
+        if viz_type == "Radar Chart":
+            fig = create_signal_map(analysis)
+        else:
+            fig = create_network_signal_map(analysis)
 
-    st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True)
 
     # Section 3: Lifeline Integrity Grid
     st.header("Lifeline Integrity Grid")
@@ -497,11 +680,36 @@ def show_results_page():
             {
                 "Lifeline": lifeline_name,
                 "Status": data.get("status", ""),
+                "Stability": f"{stability[lifeline_name]['stability']:.0%}" if lifeline_name in stability else "",
                 "Signal Pattern": signal_pattern,
             }
         )
     st.table(table_data)
 
+    # Movement since the previous assessment of the same organization.
+    # Mirror-session participants are combined in the room, not stored one by one.
+    if st.session_state.get("mirror_room"):
+        st.caption("Your answers are included in the live mirror session for this organization.")
+        history = []
+    else:
+        history = record_assessment(analysis)
+    if len(history) >= 2:
+        st.header("Movement Since Last Assessment")
+        latest = compute_trend(history)[-1]
+        st.caption(f"Compared with the assessment of {latest['from_date']}")
+        st.table([
+            {
+                "Lifeline": name,
+                "Status": f"{change['from_status']} → {change['to_status']}" if change["changed"] else change["to_status"],
+                "Observed": f"{change['mix_delta']['Observed']:+.0f} pts",
+                "Compensated": f"{change['mix_delta']['Compensated']:+.0f} pts",
+                "Assumed + Historical": f"{change['mix_delta']['Assumed'] + change['mix_delta']['Historical']:+.0f} pts",
+            }
+            for name, change in latest["lifelines"].items()
+        ])
+        if not lite:
+            st.plotly_chart(create_trend_chart(history), use_container_width=True)
+
     # Section 4: Key Distinctions
     st.header("Key Distinctions")
     st.info(
@@ -529,9 +737,13 @@ def show_results_page():
 
     # Section 6: Restart Option (quick)
     if st.button("Start New Assessment", use_container_width=False):
+        discard_session()
+        # Keep which assessments this session stored, for the next comparison
+        own_assessments = st.session_state.get("own_assessment_ids", [])
         for key in list(st.session_state.keys()):
             del st.session_state[key]
-        st.rerun()
+        st.session_state.own_assessment_ids = own_assessments
+        go_to("metadata")
 
     # Closing Statement
     st.info(
@@ -588,19 +800,25 @@ For shared organizational clarity, this assessment is often reviewed in a facili
     with col1:
         st.caption("Generate a board-ready brief (HTML). Download and print to PDF.")
 
-        brief_html = None
-        if st.button("📄 Build Executive Brief", use_container_width=True):
-            with st.spinner("Building your executive brief..."):
-                fig = create_network_signal_map(analysis)
-                map_png_b64 = fig_to_png_base64(fig)
-
-                brief_html = build_executive_brief_html(
+        def build_brief():
+            with profile_phase("brief"):
+                return build_executive_brief_html(
                     org_name=st.session_state.org_name,
                     assessment_date=str(st.session_state.assessment_date),
                     analysis=analysis,
-                    map_png_b64=map_png_b64,
+                    map_png_b64=fig_to_png_base64(network_signal_map_spec(analysis)),
+                    stability=stability,
                 )
 
+        # Kept until the inputs change; rebuilt transparently if it was evicted
+        brief_inputs = [st.session_state.org_name, str(st.session_state.assessment_date), responses]
+        brief_html = None
+        if st.button("📄 Build Executive Brief", use_container_width=True):
+            with st.spinner("Building your executive brief..."):
+                brief_html = session_artifact("brief", brief_inputs, build_brief)
+        elif has_artifact("brief", brief_inputs):
+            brief_html = session_artifact("brief", brief_inputs, build_brief)
+
         if brief_html:
             safe_org = st.session_state.org_name.replace(" ", "_")
             st.download_button(
@@ -617,23 +835,19 @@ For shared organizational clarity, this assessment is often reviewed in a facili
     with col2:
         st.caption("Confidential diagnostic • Prepared for internal leadership use")
 
-        export_data = {
-            "organization": st.session_state.org_name,
-            "assessment_date": str(st.session_state.assessment_date),
-            "analysis": {
-                k: {
-                    "status": v.get("status"),
-                    "description": v.get("description"),
-                    "signals": dict(v.get("signals", {})),
-                }
-                for k, v in analysis.items()
-            },
-        }
+        export_json = cached(
+            "export",
+            [st.session_state.org_name, str(st.session_state.assessment_date), analysis, stability,
+             active_rules()["version"]],
+            lambda: json.dumps(build_export_data(
+                st.session_state.org_name, st.session_state.assessment_date, analysis, stability
+            ), indent=2),
+        )
 
         safe_org = st.session_state.org_name.replace(" ", "_")
         st.download_button(
             label="📥 Download Data (JSON)",
-            data=json.dumps(export_data, indent=2),
+            data=export_json,
             file_name=f"Signal_Integrity_Data_{safe_org}_{st.session_state.assessment_date}.json",
             mime="application/json",
             use_container_width=True,
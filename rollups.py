@@ -0,0 +1,151 @@
+"""
+House of Cards Assessment™
+Operator Roll-ups - incrementally maintained aggregates for the dashboard
+
+Every stored assessment bumps the weekly aggregates in the same transaction
+(storage.save_assessment), so the dashboard reads a few rows per week rather
+than scanning raw results. reconcile() rebuilds the aggregates from the raw
+tables and is meant to run periodically:
+
+    python rollups.py reconcile
+"""
+import sys
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, select
+
+from schema import SIGNAL_COLUMNS, SIGNALS, assessments, lifeline_results, rollup_assessments, rollup_status
+from storage import get_engine
+
+
+def week_start(moment) -> date:
+    """Monday of the week a completion falls in"""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return day - timedelta(days=day.weekday())
+
+
+def _increment(conn, table, key: dict, amounts: dict):
+    """Add `amounts` to the row at `key`, creating it if needed"""
+    dialect = conn.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table).values(**key, **amounts)
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=list(key),
+            set_={col: table.c[col] + stmt.excluded[col] for col in amounts},
+        ))
+        return
+
+    # Other databases: update, and insert if the row does not exist yet
+    where = [table.c[col] == value for col, value in key.items()]
+    updated = conn.execute(
+        table.update().where(*where).values({col: table.c[col] + n for col, n in amounts.items()})
+    ).rowcount
+    if not updated:
+        conn.execute(table.insert().values(**key, **amounts))
+
+
+def apply_assessment(conn, completed_at, analysis: dict):
+    """Fold one completed assessment into the roll-ups (inside the caller's transaction)"""
+    week = week_start(completed_at)
+    _increment(conn, rollup_assessments, {"week_start": week}, {"assessments": 1})
+    for lifeline, data in analysis.items():
+        _increment(
+            conn,
+            rollup_status,
+            {"week_start": week, "lifeline": lifeline, "status": data["status"]},
+            {"lifelines": 1, **{c: int(data["signals"].get(s, 0)) for s, c in zip(SIGNALS, SIGNAL_COLUMNS)}},
+        )
+
+
+def reconcile(engine=None) -> dict:
+    """Rebuild the roll-ups from the raw tables; returns the number of rows written"""
+    engine = engine or get_engine()
+    weekly = defaultdict(int)
+    by_status = defaultdict(lambda: defaultdict(int))
+
+    query = (
+        select(assessments.c.id, assessments.c.created_at, lifeline_results)
+        .join(lifeline_results, lifeline_results.c.assessment_id == assessments.c.id)
+        .order_by(assessments.c.id)
+    )
+
+    with engine.begin() as conn:
+        seen = set()
+        for row in conn.execute(query).mappings():
+            week = week_start(row["created_at"])
+            if row["id"] not in seen:
+                seen.add(row["id"])
+                weekly[week] += 1
+            bucket = by_status[(week, row["lifeline"], row["status"])]
+            bucket["lifelines"] += 1
+            for c in SIGNAL_COLUMNS:
+                bucket[c] += row[c]
+
+        conn.execute(delete(rollup_status))
+        conn.execute(delete(rollup_assessments))
+        if weekly:
+            conn.execute(rollup_assessments.insert(), [
+                {"week_start": week, "assessments": n} for week, n in weekly.items()
+            ])
+        if by_status:
+            conn.execute(rollup_status.insert(), [
+                {"week_start": week, "lifeline": lifeline, "status": status, **amounts}
+                for (week, lifeline, status), amounts in by_status.items()
+            ])
+
+    return {"weeks": len(weekly), "status_rows": len(by_status)}
+
+
+def load_dashboard(engine=None, since=None) -> dict:
+    """
+    Dashboard series straight from the roll-up tables:
+    assessments per week, status distribution per lifeline and the weekly
+    share of Compensated signals.
+    """
+    engine = engine or get_engine()
+    weekly_query = select(rollup_assessments).order_by(rollup_assessments.c.week_start)
+    status_query = select(rollup_status).order_by(rollup_status.c.week_start)
+    if since is not None:
+        weekly_query = weekly_query.where(rollup_assessments.c.week_start >= week_start(since))
+        status_query = status_query.where(rollup_status.c.week_start >= week_start(since))
+
+    with engine.connect() as conn:
+        weekly = [(row.week_start, row.assessments) for row in conn.execute(weekly_query)]
+        status_rows = conn.execute(status_query).mappings().all()
+
+    distribution = defaultdict(lambda: defaultdict(int))
+    signal_totals = defaultdict(lambda: defaultdict(int))
+    for row in status_rows:
+        distribution[row["lifeline"]][row["status"]] += row["lifelines"]
+        for c in SIGNAL_COLUMNS:
+            signal_totals[row["week_start"]][c] += row[c]
+
+    compensated_share = []
+    for week in sorted(signal_totals):
+        totals = signal_totals[week]
+        all_signals = sum(totals.values())
+        compensated_share.append((week, totals["compensated"] / all_signals * 100 if all_signals else 0.0))
+
+    return {
+        "assessments_per_week": weekly,
+        "status_distribution": {lf: dict(counts) for lf, counts in distribution.items()},
+        "compensated_share": compensated_share,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] != ["reconcile"]:
+        print("usage: python rollups.py reconcile")
+        return 2
+    print(f"Roll-ups rebuilt: {reconcile()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
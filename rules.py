@@ -0,0 +1,248 @@
+"""
+House of Cards Assessment™
+Status Rules - declarative, versioned rule table and threshold sensitivity
+
+A lifeline's status is the first rule whose metric reaches its threshold,
+falling back to the default. The table is compiled into arrays so the same
+rules classify a single lifeline, a whole cohort, or a cohort under a grid of
+alternative thresholds in one NumPy pass.
+
+Set SIA_STATUS_RULES to a JSON file with the same shape as STATUS_RULES to
+review a methodology change without editing code. To see how stored
+assessments would shift under other thresholds:
+
+    python rules.py sensitivity --since 2026-01-01 --vary SOLID=50:80:5 --vary FRAGILE=30,40,50
+
+The cohort is every stored lifeline result in range (--org, --since,
+--until); the CSV has one row per threshold combination.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+METRICS = ('observed_pct', 'compensated_pct', 'fragile_pct')
+
+STATUS_RULES = {
+    'version': '2026.1',
+    # (status, metric, threshold, description) - first match wins, metric >= threshold
+    'rules': [
+        ('SOLID', 'observed_pct', 60,
+         'Largely supported by observed signals with current evidence.'),
+        ('FRAGILE', 'compensated_pct', 40,
+         'Stability depends on individual effort and informal fixes.'),
+        ('CONDITIONAL', 'fragile_pct', 60,
+         'Confidence appears to rest on belief or outdated verification.'),
+    ],
+    'default': ('MIXED', 'Shows varied signal patterns requiring attention.'),
+}
+
+
+def compile_rules(table: dict) -> dict:
+    """Turn a rule table into arrays: metric column and threshold per rule"""
+    rules = [tuple(r) for r in table['rules']]
+    for status, metric, _, _ in rules:
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r} in rule for {status}")
+
+    default_status, default_description = table['default']
+    return {
+        'version': str(table['version']),
+        'statuses': tuple(r[0] for r in rules) + (default_status,),
+        'descriptions': tuple(r[3] for r in rules) + (default_description,),
+        'metric_index': np.array([METRICS.index(r[1]) for r in rules], dtype=np.intp),
+        'thresholds': np.array([r[2] for r in rules], dtype=float),
+    }
+
+
+@lru_cache(maxsize=1)
+def active_rules() -> dict:
+    """The compiled rule table in use (STATUS_RULES unless SIA_STATUS_RULES points elsewhere)"""
+    path = os.environ.get('SIA_STATUS_RULES')
+    if path:
+        with open(path, encoding='utf-8') as fh:
+            return compile_rules(json.load(fh))
+    return compile_rules(STATUS_RULES)
+
+
+def classify(observed_pct: float, compensated_pct: float, fragile_pct: float,
+             compiled: dict | None = None) -> tuple[str, str]:
+    """Status and description for one lifeline"""
+    compiled = compiled or active_rules()
+    values = (observed_pct, compensated_pct, fragile_pct)
+    for i, (metric, threshold) in enumerate(zip(compiled['metric_index'], compiled['thresholds'])):
+        if values[metric] >= threshold:
+            return compiled['statuses'][i], compiled['descriptions'][i]
+    return compiled['statuses'][-1], compiled['descriptions'][-1]
+
+
+def classify_array(metrics: np.ndarray, thresholds: np.ndarray | None = None,
+                   compiled: dict | None = None) -> np.ndarray:
+    """
+    Status codes (indices into compiled['statuses']) for an array of lifelines.
+
+    `metrics` has shape (..., 3) in METRICS order. `thresholds` defaults to the
+    table's own and may carry leading dimensions, e.g. (G, 1, R) against
+    metrics of shape (N, 3) gives codes of shape (G, N).
+    """
+    compiled = compiled or active_rules()
+    if thresholds is None:
+        thresholds = compiled['thresholds']
+
+    hits = np.asarray(metrics)[..., compiled['metric_index']] >= thresholds
+    n_rules = hits.shape[-1]
+    return np.where(hits.any(axis=-1), hits.argmax(axis=-1), n_rules)
+
+
+def cohort_metrics(analyses) -> np.ndarray:
+    """Stack every lifeline of every analysis dict into an (N, 3) metrics array"""
+    rows = [
+        [data[m] for m in METRICS]
+        for analysis in analyses
+        for data in analysis.values()
+    ]
+    return np.array(rows, dtype=float).reshape(-1, len(METRICS))
+
+
+def metrics_from_counts(counts: np.ndarray) -> np.ndarray:
+    """(N, 3) metrics from (N, 4) signal counts in storage.SIGNALS order"""
+    counts = np.asarray(counts, dtype=float).reshape(-1, 4)
+    totals = counts.sum(axis=1, keepdims=True)
+    pct = np.divide(counts * 100, totals, out=np.zeros_like(counts), where=totals > 0)
+    observed, assumed, historical, compensated = pct.T
+    return np.stack([observed, compensated, assumed + historical], axis=1)
+
+
+def stored_metrics(orgs=None, since=None, until=None, engine=None) -> np.ndarray:
+    """Cohort metrics (N, 3) for the stored lifeline results in range"""
+    from sqlalchemy import select
+
+    from storage import SIGNALS, get_engine, history_filters, lifeline_results
+
+    engine = engine or get_engine()
+    query = select(*(lifeline_results.c[s.lower()] for s in SIGNALS)).where(
+        *history_filters(orgs, since, until, table=lifeline_results)
+    )
+    with engine.connect() as conn:
+        counts = np.array(conn.execute(query).all(), dtype=float)
+    return metrics_from_counts(counts)
+
+
+def threshold_grid(compiled: dict | None = None, **ranges) -> np.ndarray:
+    """
+    Cartesian product of candidate thresholds, one column per rule.
+
+    Keyword arguments are keyed by status, e.g.
+    threshold_grid(SOLID=range(50, 81, 5), FRAGILE=[30, 40, 50]); rules not
+    mentioned keep their current threshold.
+    """
+    compiled = compiled or active_rules()
+    rule_statuses = compiled['statuses'][:-1]
+    unknown = set(ranges) - set(rule_statuses)
+    if unknown:
+        raise ValueError(f"No rule for status {', '.join(sorted(unknown))}")
+
+    axes = [
+        list(ranges.get(status, [compiled['thresholds'][i]]))
+        for i, status in enumerate(rule_statuses)
+    ]
+    return np.array(list(itertools.product(*axes)), dtype=float).reshape(-1, len(rule_statuses))
+
+
+def sensitivity(metrics: np.ndarray, grid: np.ndarray, compiled: dict | None = None,
+                chunk_size: int = 256) -> dict:
+    """
+    Evaluate every threshold combination in `grid` (G, R) against a cohort
+    `metrics` (N, 3).
+
+    Returns status counts per combination (G, S), the share of the cohort
+    whose status differs from the current thresholds, and the grid itself.
+    The grid is processed in chunks only to bound memory.
+    """
+    compiled = compiled or active_rules()
+    metrics = np.asarray(metrics, dtype=float).reshape(-1, len(METRICS))
+    grid = np.asarray(grid, dtype=float)
+    n_statuses = len(compiled['statuses'])
+
+    # Lifelines with identical metrics always share a status, and a handful of
+    # questions per lifeline allows only a few distinct rows, so classify those
+    # once and weight by how often they occur.
+    unique, weights = np.unique(metrics, axis=0, return_counts=True)
+    baseline = classify_array(unique, compiled=compiled)
+    counts = np.zeros((len(grid), n_statuses), dtype=np.int64)
+    changed = np.zeros(len(grid), dtype=float)
+
+    for start in range(0, len(grid), chunk_size):
+        block = grid[start:start + chunk_size]
+        codes = classify_array(unique, block[:, None, :], compiled)  # (g, U)
+        offsets = codes + np.arange(len(block))[:, None] * n_statuses
+        counts[start:start + len(block)] = np.bincount(
+            offsets.ravel(),
+            weights=np.broadcast_to(weights, codes.shape).ravel(),
+            minlength=len(block) * n_statuses,
+        ).reshape(len(block), n_statuses)
+        if len(metrics):
+            changed[start:start + len(block)] = (codes != baseline) @ weights / len(metrics)
+
+    return {
+        'version': compiled['version'],
+        'statuses': compiled['statuses'],
+        'grid': grid,
+        'counts': counts,
+        'changed_share': changed,
+    }
+
+
+def _thresholds(spec: str) -> list[float]:
+    """'50:80:5' (inclusive range), '30,40,50' or a single value"""
+    if ":" in spec:
+        start, stop, step = (float(part) for part in spec.split(":"))
+        if step <= 0:
+            raise ValueError("step must be positive")
+        return list(np.arange(start, stop + step / 2, step))
+    return [float(part) for part in spec.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Status shifts of stored assessments under alternative thresholds.")
+    parser.add_argument("command", choices=["sensitivity"])
+    parser.add_argument("--vary", action="append", default=[], metavar="STATUS=SPEC",
+                        help="thresholds to try for a rule, e.g. SOLID=50:80:5 or FRAGILE=30,40 (repeatable)")
+    parser.add_argument("--org", action="append", help="organization name (repeatable; default all)")
+    parser.add_argument("--since", help="first assessment date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="last assessment date (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    ranges = {}
+    for item in args.vary:
+        status, _, spec = item.partition("=")
+        try:
+            ranges[status.strip().upper()] = _thresholds(spec)
+        except ValueError:
+            parser.error(f"Bad --vary {item!r}; use STATUS=start:stop:step or STATUS=a,b,c")
+
+    compiled = active_rules()
+    try:
+        grid = threshold_grid(compiled, **ranges)
+    except ValueError as exc:
+        parser.error(str(exc))
+    metrics = stored_metrics(args.org, args.since, args.until)
+    report = sensitivity(metrics, grid, compiled)
+
+    rule_statuses = compiled['statuses'][:-1]
+    writer = csv.writer(sys.stdout)
+    writer.writerow([f"{s}_threshold" for s in rule_statuses] + list(compiled['statuses']) + ["changed_share"])
+    for thresholds, counts, changed in zip(report['grid'], report['counts'], report['changed_share']):
+        writer.writerow([f"{t:g}" for t in thresholds] + counts.tolist() + [f"{changed:.4f}"])
+    print(f"{len(metrics)} lifeline result(s), {len(grid)} combination(s), rules {compiled['version']}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
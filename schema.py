@@ -0,0 +1,109 @@
+"""
+House of Cards Assessment™
+Database Schema - every table on one shared MetaData
+
+Tables live here rather than in the modules that use them, so storage can
+create the whole schema without importing its own dependents (rollups,
+outbox), and those modules can also run as scripts. Columns added to an
+existing table later must be nullable; add_missing_columns() applies them.
+"""
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    inspect,
+    text,
+)
+
+SIGNALS = ('Observed', 'Assumed', 'Historical', 'Compensated')
+SIGNAL_COLUMNS = tuple(s.lower() for s in SIGNALS)
+
+metadata = MetaData()
+
+assessments = Table(
+    "assessments",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("org_key", String(200), nullable=False),
+    Column("org_name", String(200), nullable=False),
+    Column("assessment_date", Date, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("ruleset_version", String(32)),
+    Column("responses", Text),  # JSON, as kept in st.session_state.responses
+    Index("ix_assessments_org_date", "org_key", "assessment_date"),
+)
+
+lifeline_results = Table(
+    "lifeline_results",
+    metadata,
+    Column("assessment_id", Integer, ForeignKey("assessments.id", ondelete="CASCADE"), primary_key=True),
+    Column("lifeline", String(64), primary_key=True),
+    # Denormalized from assessments so trend reads never need the join
+    Column("org_key", String(200), nullable=False),
+    Column("assessment_date", Date, nullable=False),
+    Column("status", String(16), nullable=False),
+    Column("observed", Integer, nullable=False, default=0),
+    Column("assumed", Integer, nullable=False, default=0),
+    Column("historical", Integer, nullable=False, default=0),
+    Column("compensated", Integer, nullable=False, default=0),
+    Index("ix_lifeline_results_org_date", "org_key", "assessment_date", "assessment_id"),
+)
+
+# Operator roll-ups (rollups.py): time bucket x lifeline x status
+rollup_status = Table(
+    "rollup_weekly_status",
+    metadata,
+    Column("week_start", Date, primary_key=True),
+    Column("lifeline", String(64), primary_key=True),
+    Column("status", String(16), primary_key=True),
+    Column("lifelines", Integer, nullable=False, default=0),
+    *(Column(c, Integer, nullable=False, default=0) for c in SIGNAL_COLUMNS),
+)
+
+rollup_assessments = Table(
+    "rollup_weekly_assessments",
+    metadata,
+    Column("week_start", Date, primary_key=True),
+    Column("assessments", Integer, nullable=False, default=0),
+)
+
+# Completion events (outbox.py)
+outbox_events = Table(
+    "outbox_events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("event_id", String(36), nullable=False),
+    Column("event_type", String(64), nullable=False),
+    Column("destination", String(500), nullable=False),
+    Column("payload", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("next_attempt_at", DateTime(timezone=True), nullable=False),
+    Column("claim_token", String(36)),
+    Column("locked_until", DateTime(timezone=True)),
+    Column("delivered_at", DateTime(timezone=True)),
+    Column("dead_at", DateTime(timezone=True)),  # gave up after MAX_ATTEMPTS
+    Column("last_error", Text),
+    Index("ix_outbox_due", "delivered_at", "next_attempt_at"),
+)
+
+
+def add_missing_columns(engine):
+    """Add nullable columns introduced after a table was first created (create_all skips them)"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
@@ -0,0 +1,42 @@
+"""
+House of Cards Assessment™
+Scroll Reset - one inline (iframe-free) component shared by every page
+
+app.py mounts the component once per run at a fixed position, so the same
+element is reused across reruns and page switches. Pages call
+request_scroll_top() before navigating; the component scrolls the main
+area only when the request counter changes.
+"""
+import streamlit as st
+
+_SCROLL_JS = """
+export default function(component) {
+    const nonce = (component.data || {}).nonce;
+    const previous = window.__siaScrollNonce;
+    window.__siaScrollNonce = nonce;
+    if (previous === undefined || previous === nonce) {
+        return;
+    }
+    const selectors = ['section[data-testid="stMain"]', 'section.main', '[data-testid="stAppViewContainer"]'];
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) {
+            element.scrollTo({top: 0, left: 0, behavior: 'instant'});
+        }
+    }
+    window.scrollTo({top: 0, left: 0, behavior: 'instant'});
+}
+"""
+
+# Registered once per process (re-registering on every run is discouraged)
+_scroll_component = st.components.v2.component("scroll_reset", js=_SCROLL_JS)
+
+
+def request_scroll_top():
+    """Ask the next run to reset the scroll position"""
+    st.session_state.scroll_nonce = st.session_state.get("scroll_nonce", 0) + 1
+
+
+def render_scroll_reset():
+    """Mount the scroll-reset component (call once per run, before page content)"""
+    _scroll_component(data={"nonce": st.session_state.get("scroll_nonce", 0)}, key="scroll_reset")
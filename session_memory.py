@@ -0,0 +1,282 @@
+"""
+House of Cards Assessment™
+Session Memory Governor - bounded per-session storage for heavy derived artifacts
+
+Derived objects (analysis, stability, the executive brief with its embedded
+map) are kept here instead of in st.session_state. Each one is keyed by a
+fingerprint of its inputs, and every access passes the function that builds
+it, so it can always be recomputed:
+
+    brief = session_artifact("brief", [org, date, responses], build_brief)
+
+Each session's in-memory artifacts are measured and capped at a budget.
+When a session goes over budget, its least recently used artifacts are
+spilled to disk. A background sweep (every SWEEP_INTERVAL seconds, and on
+any access) spills sessions that have been idle in full and drops sessions
+that have been gone for a long time. A spilled
+artifact is read back on its next use, or rebuilt if the spill file is
+missing. memory_stats() reports the totals (operator dashboard).
+
+    SIA_SESSION_BUDGET_MB      in-memory budget per session (default 4)
+    SIA_SESSION_IDLE_SECONDS   idle time before a session is spilled (default 300)
+    SIA_SESSION_TTL_SECONDS    time before an abandoned session is dropped (default 86400)
+    SIA_SESSION_SPILL          spill directory (default data/session_spill)
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SWEEP_INTERVAL = 30.0
+DEFAULT_SPILL_DIR = Path("data/session_spill")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def budget_bytes() -> int:
+    return int(_env_float("SIA_SESSION_BUDGET_MB", 4) * 1024 * 1024)
+
+
+def idle_seconds() -> float:
+    return _env_float("SIA_SESSION_IDLE_SECONDS", 300)
+
+
+def ttl_seconds() -> float:
+    return _env_float("SIA_SESSION_TTL_SECONDS", 86400)
+
+
+def spill_dir() -> Path:
+    return Path(os.environ.get("SIA_SESSION_SPILL", DEFAULT_SPILL_DIR))
+
+
+class _Entry:
+    """One stored artifact: its input fingerprint, value (when resident) and spill file"""
+
+    __slots__ = ("digest", "value", "size", "resident", "path")
+
+    def __init__(self, digest: str, value, size: int):
+        self.digest = digest
+        self.value = value
+        self.size = size
+        self.resident = True
+        self.path = None
+
+
+class _Session:
+    def __init__(self):
+        self.entries: OrderedDict[str, _Entry] = OrderedDict()  # name -> entry, LRU first
+        self.last_seen = time.monotonic()
+
+    def resident_bytes(self) -> int:
+        return sum(e.size for e in self.entries.values() if e.resident)
+
+
+_sessions: dict[str, _Session] = {}
+_lock = threading.RLock()
+_last_sweep = 0.0
+_sweeper: threading.Thread | None = None
+_counters = {"builds": 0, "rebuilds": 0, "spills": 0, "disk_loads": 0, "dropped_sessions": 0}
+
+
+def current_session_id() -> str:
+    """Streamlit session id of the running script ('local' outside a session)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        ctx = None
+    return ctx.session_id if ctx is not None else "local"
+
+
+def fingerprint(inputs) -> str:
+    return hashlib.sha1(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _measure(value) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+def _spill(session_id: str, name: str, entry: _Entry) -> bool:
+    """Move one artifact to disk; unpicklable artifacts are evicted instead"""
+    path = spill_dir() / session_id / f"{name}-{entry.digest}.pkl"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump(entry.value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        entry.path = path
+    except Exception:
+        logger.warning("Could not spill %s for session %s; evicting", name, session_id, exc_info=True)
+        entry.path = None
+    entry.value = None
+    entry.resident = False
+    _counters["spills"] += 1
+    return entry.path is not None
+
+
+def _load(entry: _Entry):
+    if entry.path is None:
+        return None
+    try:
+        with open(entry.path, "rb") as fh:
+            return pickle.load(fh)
+    except Exception as exc:
+        logger.warning("Spilled artifact %s unreadable (%s); rebuilding", entry.path, exc)
+        return None
+
+
+def _drop_session(session_id: str):
+    _sessions.pop(session_id, None)
+    shutil.rmtree(spill_dir() / session_id, ignore_errors=True)
+
+
+def _enforce_budget(session_id: str, session: _Session, keep: str | None = None):
+    budget = budget_bytes()
+    used = session.resident_bytes()
+    for name, entry in list(session.entries.items()):
+        if used <= budget:
+            break
+        if entry.resident and name != keep:
+            _spill(session_id, name, entry)
+            used -= entry.size
+
+
+def sweep(force: bool = False):
+    """Spill idle sessions and drop abandoned ones (throttled unless forced)"""
+    global _last_sweep
+    now = time.monotonic()
+    with _lock:
+        if not force and now - _last_sweep < SWEEP_INTERVAL:
+            return
+        _last_sweep = now
+        idle, ttl = idle_seconds(), ttl_seconds()
+        for session_id, session in list(_sessions.items()):
+            age = now - session.last_seen
+            if age > ttl:
+                _drop_session(session_id)
+                _counters["dropped_sessions"] += 1
+            elif age > idle:
+                for name, entry in session.entries.items():
+                    if entry.resident:
+                        _spill(session_id, name, entry)
+
+
+def _sweep_forever():
+    while True:
+        time.sleep(SWEEP_INTERVAL)
+        try:
+            sweep(force=True)
+        except Exception:
+            logger.exception("Session memory sweep failed")
+
+
+def _ensure_sweeper():
+    """Start the background sweep once per process, so idle sessions spill without new requests"""
+    global _sweeper
+    with _lock:
+        if _sweeper is None:
+            _sweeper = threading.Thread(target=_sweep_forever, name="session-sweeper", daemon=True)
+            _sweeper.start()
+
+
+def session_artifact(name: str, inputs, build, session_id: str | None = None):
+    """
+    The session's artifact `name` for these inputs.
+
+    Returned from memory, read back from a spill, or built with `build()`;
+    building a new version replaces the old one.
+    """
+    session_id = session_id or current_session_id()
+    digest = fingerprint(inputs)
+
+    with _lock:
+        _sessions.setdefault(session_id, _Session()).last_seen = time.monotonic()
+    _ensure_sweeper()
+    sweep()
+
+    with _lock:
+        session = _sessions.setdefault(session_id, _Session())
+        session.last_seen = time.monotonic()
+        entry = session.entries.get(name)
+        if entry is not None and entry.digest == digest:
+            session.entries.move_to_end(name)
+            if entry.resident:
+                return entry.value
+            value = _load(entry)
+            if value is not None:
+                _counters["disk_loads"] += 1
+                entry.value, entry.resident = value, True
+                _enforce_budget(session_id, session, keep=name)
+                return value
+            rebuilding = True
+        else:
+            rebuilding = False
+
+    # Build outside the lock; other sessions keep running meanwhile
+    value = build()
+
+    with _lock:
+        _counters["rebuilds" if rebuilding else "builds"] += 1
+        session = _sessions.setdefault(session_id, _Session())
+        old = session.entries.pop(name, None)
+        if old is not None and old.path is not None:
+            old.path.unlink(missing_ok=True)
+        session.entries[name] = _Entry(digest, value, _measure(value))
+        _enforce_budget(session_id, session, keep=name)
+
+    return value
+
+
+def has_artifact(name: str, inputs, session_id: str | None = None) -> bool:
+    """True if the artifact exists for these inputs (in memory or spilled)"""
+    session_id = session_id or current_session_id()
+    with _lock:
+        session = _sessions.get(session_id)
+        entry = session.entries.get(name) if session else None
+        return entry is not None and entry.digest == fingerprint(inputs)
+
+
+def discard_session(session_id: str | None = None):
+    """Forget every artifact of a session (e.g. when it starts over)"""
+    with _lock:
+        _drop_session(session_id or current_session_id())
+
+
+def memory_stats() -> dict:
+    """Process-wide totals for monitoring"""
+    with _lock:
+        resident = spilled = 0
+        for session in _sessions.values():
+            for entry in session.entries.values():
+                if entry.resident:
+                    resident += entry.size
+                elif entry.path is not None:
+                    spilled += entry.size
+        return {
+            "sessions": len(_sessions),
+            "resident_bytes": resident,
+            "spilled_bytes": spilled,
+            "budget_bytes": budget_bytes(),
+            **_counters,
+        }
@@ -0,0 +1,245 @@
+"""
+House of Cards Assessment™
+Signal Hints - suggest a signal classification from the response wording
+
+Each signal type has a lexicon of tell-tale phrases ("we assume", "used to",
+"workaround", ...). All phrases are compiled into one Aho-Corasick automaton,
+so a response is scanned in a single pass however large the lexicon is.
+Matches must sit on word boundaries; each distinct phrase scores its word
+count, and the signal with the highest score is suggested (none on a tie).
+
+    python signal_hints.py scan > mismatches.csv
+    python signal_hints.py scan --org "Acme" --since 2026-01-01
+
+The scan streams stored assessments and lists answers whose wording
+suggests a different signal than the one chosen.
+
+Set SIA_SIGNAL_LEXICON to a JSON file {"Assumed": ["we assume", ...], ...}
+to replace the built-in lexicon.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import NamedTuple
+
+from core import SIGNAL_TYPES
+
+SIGNALS = tuple(label.split(" - ")[0] for label in SIGNAL_TYPES)
+
+LEXICON = {
+    'Observed': [
+        "we verified", "verified", "we tested", "tested last", "we measured", "measured",
+        "we monitor", "monitored", "we track", "tracked weekly", "dashboard shows", "we saw",
+        "confirmed", "audited", "last week", "last month", "this quarter", "this week",
+        "real-time", "live data", "drill last", "checked yesterday",
+    ],
+    'Assumed': [
+        "we assume", "assume", "assumed", "assuming", "we believe", "believe", "probably",
+        "should be", "should work", "i think", "we think", "presumably", "hopefully",
+        "not verified", "never verified", "never tested", "not tested", "not confirmed",
+        "haven't checked", "have not checked", "supposed to", "likely", "we expect", "in theory",
+    ],
+    'Historical': [
+        "used to", "used to be", "years ago", "last year", "in the past", "previously",
+        "at one point", "back in", "was tested", "was verified", "historically", "originally",
+        "not since", "since then", "a while ago", "long time ago", "at the time", "once worked",
+    ],
+    'Compensated': [
+        "workaround", "workarounds", "work around", "manual", "manually", "spreadsheet",
+        "depends on", "relies on", "rely on", "heroics", "hero", "one person", "only person",
+        "only one who", "knows how", "overtime", "patched", "duct tape", "held together",
+        "tribal knowledge", "informal", "informally", "firefighting", "stepping in",
+    ],
+}
+
+# Shorter responses are too little text to judge
+MIN_TEXT_LENGTH = 8
+
+
+class Hint(NamedTuple):
+    signal: str
+    phrases: tuple[str, ...]
+    score: int
+
+
+class Automaton:
+    """Aho-Corasick automaton over lower-cased phrases"""
+
+    def __init__(self, phrases: list[str]):
+        self.phrases = phrases
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[tuple[int, ...]] = [()]
+        for idx, phrase in enumerate(phrases):
+            state = 0
+            for ch in phrase:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = self._goto[state][ch] = len(self._goto)
+                    self._goto.append({})
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (idx,)
+
+        # Breadth-first failure links; outputs of the fallback state are merged in
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def find(self, text: str):
+        """Yield (end index, phrase index) for every occurrence in `text`"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for idx in out[state]:
+                    yield i, idx
+
+
+def _normalize(text: str) -> str:
+    return text.lower().replace("’", "'")
+
+
+@lru_cache(maxsize=1)
+def active_lexicon() -> tuple[Automaton, tuple[str, ...]]:
+    """Compiled automaton and the signal of each phrase (SIA_SIGNAL_LEXICON or LEXICON)"""
+    lexicon = LEXICON
+    path = os.environ.get('SIA_SIGNAL_LEXICON')
+    if path:
+        with open(path, encoding='utf-8') as fh:
+            lexicon = json.load(fh)
+        unknown = set(lexicon) - set(SIGNALS)
+        if unknown:
+            raise ValueError(f"Unknown signal(s) in lexicon: {', '.join(sorted(unknown))}")
+
+    phrases, owners = [], []
+    for signal, words in lexicon.items():
+        for phrase in words:
+            phrase = _normalize(phrase).strip()
+            if phrase:
+                phrases.append(phrase)
+                owners.append(signal)
+    return Automaton(phrases), tuple(owners)
+
+
+@lru_cache(maxsize=4096)
+def suggest_signal(text: str) -> Hint | None:
+    """Suggested signal for a response, or None when the wording is neutral or split"""
+    if not text or len(text) < MIN_TEXT_LENGTH:
+        return None
+    automaton, owners = active_lexicon()
+    text = _normalize(text)
+
+    found = {}
+    for end, idx in automaton.find(text):
+        phrase = automaton.phrases[idx]
+        start = end - len(phrase) + 1
+        if (start > 0 and text[start - 1].isalnum()) or (end + 1 < len(text) and text[end + 1].isalnum()):
+            continue  # inside a longer word
+        found.setdefault(idx, phrase)
+    if not found:
+        return None
+
+    scores = {}
+    for idx, phrase in found.items():
+        scores[owners[idx]] = scores.get(owners[idx], 0) + len(phrase.split())
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    if len(ranked) > 1 and ranked[0][1] == ranked[1][1]:
+        return None
+    signal, score = ranked[0]
+    phrases = tuple(sorted({p for idx, p in found.items() if owners[idx] == signal}, key=len, reverse=True))
+    return Hint(signal, phrases, score)
+
+
+def chosen_signal(label: str | None) -> str | None:
+    """Short signal name from a SIGNAL_TYPES label"""
+    return label.split(" - ")[0] if label else None
+
+
+def response_mismatches(responses: dict) -> list[dict]:
+    """Answers whose wording suggests a different signal than the one chosen"""
+    result = []
+    for key, text in responses.items():
+        if not key.endswith("_response"):
+            continue
+        base = key[: -len("_response")]
+        chosen = chosen_signal(responses.get(f"{base}_signal"))
+        hint = suggest_signal(text or "")
+        if chosen and hint and hint.signal != chosen:
+            result.append({
+                "question": base,
+                "chosen": chosen,
+                "suggested": hint.signal,
+                "phrases": "; ".join(hint.phrases),
+                "response": text,
+            })
+    return result
+
+
+def scan_history(orgs=None, since=None, until=None, engine=None):
+    """Yield a mismatch row per flagged answer across stored assessments (streamed)"""
+    from sqlalchemy import select
+
+    from storage import assessments, get_engine, history_filters
+
+    engine = engine or get_engine()
+    query = (
+        select(assessments.c.id, assessments.c.org_name, assessments.c.assessment_date, assessments.c.responses)
+        .where(assessments.c.responses.is_not(None), *history_filters(orgs, since, until))
+        .order_by(assessments.c.id)
+    )
+    with engine.connect() as conn:
+        rows = conn.execution_options(stream_results=True, yield_per=1000).execute(query)
+        for row in rows:
+            try:
+                responses = json.loads(row.responses)
+            except ValueError:
+                continue
+            for mismatch in response_mismatches(responses):
+                yield {
+                    "assessment_id": row.id,
+                    "org_name": row.org_name,
+                    "assessment_date": str(row.assessment_date),
+                    **mismatch,
+                }
+
+
+SCAN_FIELDS = ["assessment_id", "org_name", "assessment_date", "question", "chosen", "suggested",
+               "phrases", "response"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List stored answers whose wording suggests another signal.")
+    parser.add_argument("command", choices=["scan"])
+    parser.add_argument("--org", action="append", help="organization name (repeatable; default all)")
+    parser.add_argument("--since", help="first assessment date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="last assessment date (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    writer = csv.DictWriter(sys.stdout, fieldnames=SCAN_FIELDS)
+    writer.writeheader()
+    count = 0
+    for row in scan_history(args.org, args.since, args.until):
+        writer.writerow(row)
+        count += 1
+    print(f"{count} possible misclassification(s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
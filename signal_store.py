@@ -0,0 +1,203 @@
+"""
+House of Cards Assessment™
+Question-Level Signal Store - append-only, columnar, memory-mapped
+
+One row per stored assessment, kept as separate column files:
+
+    assessment_id.i8   int64
+    cohort.u2          uint16 code into cohorts.json
+    q_<key>.u1         uint8 signal code, one file per question (QUESTION_KEYS)
+
+Signal codes follow SIGNALS; UNANSWERED marks a question without a signal.
+Appends take an exclusive file lock; readers memory-map the files and only
+trust rows present in every column. Each append first truncates every column
+back to that common row count, so the leftovers of a torn append are dropped
+instead of shifting later rows out of line.
+The query helpers are plain NumPy over the maps, e.g.
+
+    store = open_store()
+    top_questions(store, "Compensated")
+    crosstab(store)            # cohorts x questions x signals
+"""
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from core import LIFELINES
+
+SIGNALS = ('Observed', 'Assumed', 'Historical', 'Compensated')
+UNANSWERED = 255
+
+QUESTION_KEYS = tuple(
+    f"{lifeline_idx}_{q_idx}"
+    for lifeline_idx, lifeline in LIFELINES.items()
+    for q_idx in range(len(lifeline['questions']))
+)
+
+DEFAULT_STORE_DIR = Path("data/signal_store")
+
+
+def store_dir() -> Path:
+    return Path(os.environ.get("SIA_SIGNAL_STORE", DEFAULT_STORE_DIR))
+
+
+def quarter_cohort(assessment_date) -> str:
+    """Default cohort label: the assessment's calendar quarter, e.g. '2026-Q1'"""
+    if not isinstance(assessment_date, date):
+        assessment_date = date.fromisoformat(str(assessment_date))
+    return f"{assessment_date.year}-Q{(assessment_date.month - 1) // 3 + 1}"
+
+
+def encode_signals(responses: dict) -> np.ndarray:
+    """Signal codes for one responses dict, in QUESTION_KEYS order"""
+    codes = np.full(len(QUESTION_KEYS), UNANSWERED, dtype=np.uint8)
+    for i, key in enumerate(QUESTION_KEYS):
+        value = responses.get(f"{key}_signal")
+        if value:
+            name = value.split(' - ')[0]
+            if name in SIGNALS:
+                codes[i] = SIGNALS.index(name)
+    return codes
+
+
+@contextmanager
+def _locked(directory: Path):
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / ".lock", "a+") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _load_cohorts(directory: Path) -> list[str]:
+    path = directory / "cohorts.json"
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def append_rows(assessment_ids, cohorts, signals, directory: Path | None = None):
+    """Append many rows at once; `signals` is (n, len(QUESTION_KEYS)) uint8 codes"""
+    directory = directory or store_dir()
+    signals = np.ascontiguousarray(signals, dtype=np.uint8).reshape(-1, len(QUESTION_KEYS))
+    assessment_ids = np.asarray(assessment_ids, dtype=np.int64)
+
+    with _locked(directory):
+        labels = _load_cohorts(directory)
+        index = {label: i for i, label in enumerate(labels)}
+        codes = np.empty(len(cohorts), dtype=np.uint16)
+        for i, label in enumerate(cohorts):
+            if label not in index:
+                index[label] = len(labels)
+                labels.append(label)
+            codes[i] = index[label]
+
+        tmp = directory / "cohorts.json.tmp"
+        tmp.write_text(json.dumps(labels))
+        os.replace(tmp, directory / "cohorts.json")
+
+        columns = [("assessment_id.i8", assessment_ids), ("cohort.u2", codes)]
+        columns += [(f"q_{key}.u1", signals[:, i]) for i, key in enumerate(QUESTION_KEYS)]
+        rows = _committed_rows(directory)
+        for name, column in columns:
+            with open(directory / name, "ab") as fh:
+                fh.truncate(rows * column.itemsize)  # drop a torn append's leftovers
+                fh.write(np.ascontiguousarray(column).tobytes())
+
+
+def append_assessment(assessment_id: int, responses: dict, cohort: str, directory: Path | None = None):
+    """Append one stored assessment's question-level signals"""
+    append_rows([assessment_id], [cohort], encode_signals(responses)[None, :], directory)
+
+
+def _committed_rows(directory: Path) -> int:
+    """Rows present in every column file"""
+    def rows_in(name, itemsize):
+        path = directory / name
+        return path.stat().st_size // itemsize if path.exists() else 0
+
+    return min([rows_in("assessment_id.i8", 8), rows_in("cohort.u2", 2)]
+               + [rows_in(f"q_{key}.u1", 1) for key in QUESTION_KEYS])
+
+
+def _map(path: Path, dtype, rows: int) -> np.ndarray:
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+
+
+def open_store(directory: Path | None = None) -> dict:
+    """Memory-map the store read-only; `questions` maps question key -> column"""
+    directory = directory or store_dir()
+    question_files = [f"q_{key}.u1" for key in QUESTION_KEYS]
+    rows = _committed_rows(directory)
+    return {
+        "assessment_id": _map(directory / "assessment_id.i8", np.int64, rows),
+        "cohort": _map(directory / "cohort.u2", np.uint16, rows),
+        "questions": {
+            key: _map(directory / name, np.uint8, rows) for key, name in zip(QUESTION_KEYS, question_files)
+        },
+        "cohorts": _load_cohorts(directory),
+        "rows": rows,
+    }
+
+
+def cohort_mask(store: dict, cohort: str) -> np.ndarray:
+    if cohort not in store["cohorts"]:
+        return np.zeros(store["rows"], dtype=bool)
+    return store["cohort"] == store["cohorts"].index(cohort)
+
+
+def question_counts(store: dict, mask: np.ndarray | None = None) -> np.ndarray:
+    """Counts per question and signal, shape (questions, signals)"""
+    counts = np.zeros((len(QUESTION_KEYS), len(SIGNALS)), dtype=np.int64)
+    for i, key in enumerate(QUESTION_KEYS):
+        column = store["questions"][key] if mask is None else store["questions"][key][mask]
+        for code in range(len(SIGNALS)):
+            counts[i, code] = np.count_nonzero(column == code)
+    return counts
+
+
+def heatmap(store: dict, mask: np.ndarray | None = None) -> np.ndarray:
+    """Share of answered responses per question and signal, shape (questions, signals)"""
+    counts = question_counts(store, mask).astype(float)
+    answered = counts.sum(axis=1, keepdims=True)
+    return np.divide(counts, answered, out=np.zeros_like(counts), where=answered > 0)
+
+
+def crosstab(store: dict) -> np.ndarray:
+    """Counts per cohort, question and signal, shape (cohorts, questions, signals)"""
+    n_cohorts = len(store["cohorts"])
+    counts = np.zeros((n_cohorts, len(QUESTION_KEYS), len(SIGNALS)), dtype=np.int64)
+    if not store["rows"]:
+        return counts
+
+    # One bincount per question over (cohort, code) cells; codes fit in a byte
+    base = store["cohort"].astype(np.intp) * 256
+    for i, key in enumerate(QUESTION_KEYS):
+        cells = np.bincount(base + store["questions"][key], minlength=n_cohorts * 256)
+        counts[:, i, :] = cells.reshape(n_cohorts, 256)[:, :len(SIGNALS)]
+    return counts
+
+
+def top_questions(store: dict, signal: str, n: int = 5, cohort: str | None = None) -> list[dict]:
+    """Questions most often answered with `signal`, by share of answered responses"""
+    mask = cohort_mask(store, cohort) if cohort is not None else None
+    shares = heatmap(store, mask)[:, SIGNALS.index(signal)]
+    ranked = np.argsort(-shares, kind="stable")[:n]
+    result = []
+    for i in ranked:
+        lifeline_idx, q_idx = map(int, QUESTION_KEYS[i].split("_"))
+        lifeline = LIFELINES[lifeline_idx]
+        result.append({
+            "question": QUESTION_KEYS[i],
+            "lifeline": lifeline["name"],
+            "text": lifeline["questions"][q_idx],
+            "share": float(shares[i]),
+        })
+    return result
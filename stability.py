@@ -0,0 +1,79 @@
+"""
+House of Cards Assessment™
+Status Stability - bootstrap confidence for lifeline statuses
+
+With five questions per lifeline a single reclassified answer can move a
+status, so each lifeline's signal mix is resampled many times and the status
+rules are applied to every replicate at once. Resampling n answers with
+replacement from a lifeline's own answers is a multinomial draw over its
+signal counts, so all replicates for all lifelines come from one call.
+"""
+import numpy as np
+
+from rules import active_rules, classify_array
+
+SIGNALS = ('Observed', 'Assumed', 'Historical', 'Compensated')
+N_REPLICATES = 10_000
+
+# Fixed seed so the same answers always show the same stability figures
+DEFAULT_SEED = 20260128
+
+
+def status_stability(analysis: dict, n_replicates: int = N_REPLICATES,
+                     seed: int = DEFAULT_SEED, compiled: dict | None = None) -> dict:
+    """
+    How often each status results across bootstrap replicates, per lifeline.
+
+    Returns {lifeline: {'status', 'stability', 'shares'}} where `stability` is
+    the share of replicates that reproduce the lifeline's reported status and
+    `shares` maps every status to its share. Lifelines without a single known
+    signal have nothing to resample and are left out (stability None).
+    """
+    compiled = compiled or active_rules()
+    counts = np.array(
+        [[analysis[name]['signals'].get(s, 0) for s in SIGNALS] for name in analysis],
+        dtype=np.int64,
+    ).reshape(-1, len(SIGNALS))
+    known = counts.sum(axis=1) > 0
+    names = [name for name, keep in zip(analysis, known) if keep]
+    if not names:
+        return {}
+    counts = counts[known]
+    totals = counts.sum(axis=1)
+
+    rng = np.random.default_rng(seed)
+    draws = rng.multinomial(totals, counts / totals[:, None], size=(n_replicates, len(names)))
+
+    pct = draws * (100.0 / totals[:, None])
+    metrics = np.stack(
+        [pct[..., 0], pct[..., 3], pct[..., 1] + pct[..., 2]],  # rules.METRICS order
+        axis=-1,
+    )
+    codes = classify_array(metrics, compiled=compiled)  # (R, L)
+
+    n_statuses = len(compiled['statuses'])
+    offsets = codes + np.arange(len(names)) * n_statuses
+    shares = np.bincount(offsets.ravel(), minlength=len(names) * n_statuses)
+    shares = shares.reshape(len(names), n_statuses) / n_replicates
+
+    result = {}
+    for i, name in enumerate(names):
+        by_status = dict(zip(compiled['statuses'], shares[i].round(4).tolist()))
+        status = analysis[name]['status']
+        result[name] = {
+            'status': status,
+            'stability': by_status.get(status, 0.0),
+            'shares': by_status,
+        }
+    return result
+
+
+def describe_stability(entry: dict) -> str:
+    """One-line summary, e.g. '78% of resamples SOLID (MIXED 22%)'"""
+    others = [
+        f"{status} {share:.0%}"
+        for status, share in sorted(entry['shares'].items(), key=lambda kv: -kv[1])
+        if status != entry['status'] and share >= 0.05
+    ]
+    text = f"{entry['stability']:.0%} of resamples {entry['status']}"
+    return f"{text} ({', '.join(others)})" if others else text
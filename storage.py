@@ -0,0 +1,242 @@
+"""
+House of Cards Assessment™
+Assessment History - stored assessments and per-organization trends
+
+Assessments are keyed by organization and date. Per-lifeline results carry
+the organization key and date as well, so an organization's whole history is
+one range scan over the (org_key, assessment_date) index.
+
+DATABASE_URL selects the database (PostgreSQL on Render); without it a
+local SQLite file is used.
+"""
+import json
+import os
+import re
+from collections import Counter
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+
+# Re-exported: most modules take the tables from here
+from schema import SIGNALS, add_missing_columns, assessments, lifeline_results, metadata  # noqa: F401
+
+DEFAULT_DATABASE_URL = "sqlite:///data/assessments.db"
+
+
+def org_key(org_name: str) -> str:
+    """Normalized organization key (case- and whitespace-insensitive)"""
+    return re.sub(r"\s+", " ", org_name or "").strip().casefold()
+
+
+def database_url() -> str:
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    url = os.environ.get("DATABASE_URL", DEFAULT_DATABASE_URL)
+    # Render and Heroku hand out postgres:// URLs, SQLAlchemy wants postgresql://
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+@lru_cache(maxsize=None)
+def get_engine(url: str | None = None):
+    """Process-wide engine; creates the tables on first use"""
+    url = url or database_url()
+    if url.startswith("sqlite:///"):
+        Path(url[len("sqlite:///"):]).parent.mkdir(parents=True, exist_ok=True)
+
+    engine = create_engine(url, pool_pre_ping=True, future=True)
+    metadata.create_all(engine)
+    add_missing_columns(engine)
+    return engine
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def lifeline_rows(assessment_id: int, key: str, assessment_date: date, analysis: dict) -> list[dict]:
+    """lifeline_results rows for one analysis dict"""
+    return [
+        {
+            "assessment_id": assessment_id,
+            "lifeline": lifeline,
+            "org_key": key,
+            "assessment_date": assessment_date,
+            "status": data["status"],
+            **{s.lower(): int(data["signals"].get(s, 0)) for s in SIGNALS},
+        }
+        for lifeline, data in analysis.items()
+    ]
+
+
+def save_assessment(org_name: str, assessment_date, analysis: dict, responses: dict | None = None,
+                    ruleset_version: str | None = None, engine=None) -> int:
+    """
+    Store one completed assessment; returns its id.
+
+    The roll-ups and the outbox completion event are written in the same
+    transaction.
+    """
+    from outbox import enqueue, wake_dispatcher
+    from rollups import apply_assessment
+
+    engine = engine or get_engine()
+    key = org_key(org_name)
+    assessment_date = _as_date(assessment_date)
+    created_at = datetime.now(timezone.utc)
+
+    with engine.begin() as conn:
+        assessment_id = conn.execute(
+            assessments.insert().values(
+                org_key=key,
+                org_name=org_name.strip(),
+                assessment_date=assessment_date,
+                created_at=created_at,
+                ruleset_version=ruleset_version,
+                responses=json.dumps(responses) if responses is not None else None,
+            )
+        ).inserted_primary_key[0]
+        conn.execute(lifeline_results.insert(), lifeline_rows(assessment_id, key, assessment_date, analysis))
+        apply_assessment(conn, created_at, analysis)
+        enqueue(conn, "assessment.completed", {
+            "assessment_id": assessment_id,
+            "organization": org_name.strip(),
+            "assessment_date": assessment_date.isoformat(),
+            "completed_at": created_at.isoformat(),
+            "ruleset_version": ruleset_version,
+            "lifelines": {
+                lifeline: {"status": data["status"], "signals": dict(data["signals"])}
+                for lifeline, data in analysis.items()
+            },
+        })
+
+    # Only now is the event visible to the dispatcher's own connection
+    wake_dispatcher()
+    return assessment_id
+
+
+class SignalStoreError(RuntimeError):
+    """The assessment was saved, but appending it to the signal store failed"""
+
+    def __init__(self, assessment_id: int):
+        super().__init__(f"Assessment {assessment_id} was not appended to the signal store")
+        self.assessment_id = assessment_id
+
+
+def record_completed_assessment(org_name: str, assessment_date, analysis: dict, responses: dict,
+                                ruleset_version: str | None = None, assessment_id: int | None = None) -> int:
+    """
+    Record a completed assessment wherever it belongs; returns its id.
+
+    The results page and the API both go through here: the database rows
+    (history, roll-ups, outbox event), the outbox dispatcher and the
+    question-level signal store. If only the signal-store append fails,
+    SignalStoreError carries the saved id; calling again with that
+    `assessment_id` retries just the append.
+    """
+    from outbox import ensure_dispatcher
+    from signal_store import append_assessment, quarter_cohort
+
+    if assessment_id is None:
+        assessment_id = save_assessment(org_name, assessment_date, analysis, responses, ruleset_version)
+        ensure_dispatcher()
+    try:
+        append_assessment(assessment_id, responses, quarter_cohort(_as_date(assessment_date)))
+    except Exception as exc:
+        raise SignalStoreError(assessment_id) from exc
+    return assessment_id
+
+
+def history_filters(orgs=None, since=None, until=None, table=assessments) -> list:
+    """
+    WHERE clauses selecting stored assessments by organization name and date
+    range; `table` is assessments or lifeline_results (both carry the keys).
+    """
+    where = []
+    if orgs:
+        where.append(table.c.org_key.in_([org_key(o) for o in orgs]))
+    if since is not None:
+        where.append(table.c.assessment_date >= _as_date(since))
+    if until is not None:
+        where.append(table.c.assessment_date <= _as_date(until))
+    return where
+
+
+def load_history(org_name: str, start=None, end=None, engine=None, assessment_ids=None) -> list[dict]:
+    """
+    An organization's assessments in date order, from one indexed range query.
+
+    Each entry is {'assessment_id', 'assessment_date', 'lifelines'} where
+    lifelines maps name -> {'status', 'signals': Counter}. `assessment_ids`
+    limits the history to those assessments.
+    """
+    engine = engine or get_engine()
+    query = (
+        select(lifeline_results)
+        .where(lifeline_results.c.org_key == org_key(org_name))
+        .order_by(lifeline_results.c.assessment_date, lifeline_results.c.assessment_id)
+    )
+    if start is not None:
+        query = query.where(lifeline_results.c.assessment_date >= _as_date(start))
+    if end is not None:
+        query = query.where(lifeline_results.c.assessment_date <= _as_date(end))
+    if assessment_ids is not None:
+        query = query.where(lifeline_results.c.assessment_id.in_(list(assessment_ids)))
+
+    history: list[dict] = []
+    with engine.connect() as conn:
+        for row in conn.execute(query).mappings():
+            if not history or history[-1]["assessment_id"] != row["assessment_id"]:
+                history.append({
+                    "assessment_id": row["assessment_id"],
+                    "assessment_date": row["assessment_date"],
+                    "lifelines": {},
+                })
+            history[-1]["lifelines"][row["lifeline"]] = {
+                "status": row["status"],
+                "signals": Counter({s: row[s.lower()] for s in SIGNALS if row[s.lower()]}),
+            }
+    return history
+
+
+def _shares(signals: Counter) -> dict:
+    total = sum(signals.values()) or 1
+    return {s: signals.get(s, 0) / total * 100 for s in SIGNALS}
+
+
+def compute_trend(history: list[dict]) -> list[dict]:
+    """
+    Status changes and signal-mix deltas (percentage points) between
+    consecutive assessments.
+    """
+    trend = []
+    for previous, current in zip(history, history[1:]):
+        lifelines = {}
+        for name, now in current["lifelines"].items():
+            before = previous["lifelines"].get(name)
+            if before is None:
+                continue
+            before_mix, now_mix = _shares(before["signals"]), _shares(now["signals"])
+            lifelines[name] = {
+                "from_status": before["status"],
+                "to_status": now["status"],
+                "changed": before["status"] != now["status"],
+                "mix_delta": {s: round(now_mix[s] - before_mix[s], 1) for s in SIGNALS},
+            }
+        trend.append({
+            "from_date": previous["assessment_date"],
+            "to_date": current["assessment_date"],
+            "lifelines": lifelines,
+        })
+    return trend
@@ -0,0 +1,148 @@
+"""
+House of Cards Assessment™
+Static Signal Maps - server-rendered SVG for lite mode
+
+The radar and network maps drawn as small inline SVG (a few KB) with the
+same geometry and colors as the Plotly versions in results.py, so slow or
+locked-down clients never download plotly.js or figure JSON. Hovering a
+node shows its native tooltip; the full hover details are rendered as a
+plain HTML table. The SVGs are stored in the artifact cache.
+"""
+import math
+from html import escape
+
+from artifact_cache import cached
+from results import NETWORK_STATUS_STYLES, STATUS_COLORS, STATUS_STRENGTH, _network_positions
+
+# Bump when the drawing code changes (part of the cache key)
+SVG_VERSION = 1
+
+SIGNALS = ('Observed', 'Assumed', 'Historical', 'Compensated')
+DASHES = {'solid': None, 'dot': '2,5', 'dash': '9,6'}
+FONT = "font-family='Arial, sans-serif'"
+
+
+def _key(analysis: dict) -> list:
+    return [SVG_VERSION, {name: [data['status'], dict(data['signals'])] for name, data in analysis.items()}]
+
+
+def _tooltip(name: str, data: dict) -> str:
+    signals = data['signals']
+    counts = ", ".join(f"{s}: {signals.get(s, 0)}" for s in SIGNALS)
+    return escape(f"{name} — {data['status']}\n{counts}")
+
+
+def _render_radar(analysis: dict) -> str:
+    width, height = 560, 500
+    cx, cy, radius = width / 2, 260, 170
+    names = list(analysis)
+    n = len(names)
+    angles = [-math.pi / 2 + 2 * math.pi * i / n for i in range(n)]  # clockwise from the top
+
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {width} {height}' width='100%' "
+        f"role='img' aria-label='Signal Integrity Map'>",
+        f"<text x='{cx}' y='32' text-anchor='middle' font-size='20' {FONT} fill='#1e293b'>Signal Integrity Map</text>",
+    ]
+    for share in (0.25, 0.5, 0.75, 1.0):
+        parts.append(f"<circle cx='{cx}' cy='{cy}' r='{radius * share:.1f}' fill='none' stroke='#e2e8f0'/>")
+    for name, angle in zip(names, angles):
+        x, y = cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+        lx, ly = cx + (radius + 22) * math.cos(angle), cy + (radius + 22) * math.sin(angle)
+        anchor = "middle" if abs(math.cos(angle)) < 0.3 else ("start" if math.cos(angle) > 0 else "end")
+        parts.append(f"<line x1='{cx}' y1='{cy}' x2='{x:.1f}' y2='{y:.1f}' stroke='#e2e8f0'/>")
+        parts.append(
+            f"<text x='{lx:.1f}' y='{ly + 4:.1f}' text-anchor='{anchor}' font-size='12' {FONT} "
+            f"fill='#334155'>{escape(name)}</text>"
+        )
+
+    points = []
+    for name, angle in zip(names, angles):
+        r = radius * STATUS_STRENGTH[analysis[name]['status']] / 100
+        points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    parts.append(
+        "<polygon points='" + " ".join(f"{x:.1f},{y:.1f}" for x, y in points) + "' "
+        "fill='rgba(99, 102, 241, 0.2)' stroke='rgb(99, 102, 241)' stroke-width='2'/>"
+    )
+    for name, (x, y) in zip(names, points):
+        parts.append(
+            f"<circle cx='{x:.1f}' cy='{y:.1f}' r='6' fill='{STATUS_COLORS[analysis[name]['status']]}' "
+            f"stroke='white' stroke-width='2'><title>{_tooltip(name, analysis[name])}</title></circle>"
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _render_network(analysis: dict) -> str:
+    size, margin, top = 520, 20, 50
+    scale = (size - 2 * margin) / 6  # plotly axes span -3..3
+
+    def to_px(x, y):
+        return margin + (x + 3) * scale, top + margin + (3 - y) * scale
+
+    names = list(analysis)
+    cx, cy = to_px(0, 0)
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {size} {size + top}' width='100%' "
+        f"role='img' aria-label='Signal Network Map'>",
+        f"<text x='{size / 2}' y='32' text-anchor='middle' font-size='20' {FONT} fill='#1e293b'>Signal Network Map</text>",
+    ]
+    nodes = []
+    for name, (x, y) in zip(names, _network_positions(len(names))):
+        style = NETWORK_STATUS_STYLES[analysis[name]['status']]
+        px, py = to_px(x, y)
+        dash = DASHES.get(style['dash'])
+        dash_attr = f" stroke-dasharray='{dash}'" if dash else ""
+        parts.append(
+            f"<line x1='{cx:.1f}' y1='{cy:.1f}' x2='{px:.1f}' y2='{py:.1f}' stroke='{style['color']}' "
+            f"stroke-width='{style['width']}'{dash_attr}/>"
+        )
+        nodes.append((name, px, py, style['color']))
+
+    parts.append(f"<circle cx='{cx:.1f}' cy='{cy:.1f}' r='15' fill='#1e293b' stroke='white' stroke-width='2'/>")
+    parts.append(
+        f"<text x='{cx:.1f}' y='{cy + 48:.1f}' text-anchor='middle' font-size='10' {FONT} fill='#1e293b'>"
+        "Leadership Confidence</text>"
+    )
+    for name, px, py, color in nodes:
+        parts.append(
+            f"<circle cx='{px:.1f}' cy='{py:.1f}' r='12.5' fill='{color}' stroke='white' stroke-width='2'>"
+            f"<title>{_tooltip(name, analysis[name])}</title></circle>"
+        )
+        lines = name.split(" ")
+        for i, word in enumerate(lines):
+            y = py - 18 - 11 * (len(lines) - 1 - i)
+            parts.append(
+                f"<text x='{px:.1f}' y='{y:.1f}' text-anchor='middle' font-size='9' {FONT} "
+                f"fill='#334155'>{escape(word)}</text>"
+            )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def radar_svg(analysis: dict) -> str:
+    return cached("radar_svg", _key(analysis), lambda: _render_radar(analysis))
+
+
+def network_svg(analysis: dict) -> str:
+    return cached("network_svg", _key(analysis), lambda: _render_network(analysis))
+
+
+def details_table_html(analysis: dict) -> str:
+    """The maps' hover details as a plain HTML table"""
+    header = "".join(f"<th>{h}</th>" for h in ("Lifeline", "Status", *SIGNALS, "Reading"))
+    rows = []
+    for name, data in analysis.items():
+        signals = data['signals']
+        color = STATUS_COLORS.get(data['status'], '#6b7280')
+        cells = [
+            f"<td><b>{escape(name)}</b></td>",
+            f"<td style='color:{color};font-weight:600'>{escape(data['status'])}</td>",
+            *(f"<td style='text-align:center'>{signals.get(s, 0)}</td>" for s in SIGNALS),
+            f"<td>{escape(data.get('description', ''))}</td>",
+        ]
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    return (
+        "<table style='width:100%;border-collapse:collapse;font-size:0.9rem'>"
+        f"<thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+    )
@@ -0,0 +1,272 @@
+"""
+House of Cards Assessment™
+Synthetic Assessments - reproducible fake data for scale and load testing
+
+    python synthetic.py jsonl 100000 --seed 7 > synthetic.jsonl
+    python synthetic.py sql 1000000 --seed 7 --orgs 5000
+
+Assessments follow the instrument (LIFELINES, SIGNAL_TYPES). Each
+organization has a latent maturity that drifts upward over time; each
+lifeline's latent score mixes the assessment's maturity with lifeline noise
+(--correlation), and signal probabilities per question follow from it, so
+strong and weak lifelines cluster the way real ones do. Response text is
+filler of variable length, sometimes containing the signal_hints phrases for
+its signal (and occasionally another signal's, to exercise mismatches).
+
+Records are drawn in NumPy batches. JSONL lines have the same shape as a
+POST /v1/assessments body. The sql target bulk-inserts assessments and
+lifeline results into the store (DATABASE_URL) with statuses from the active
+rule table; roll-ups, the outbox and the signal store are not touched, so run
+`python rollups.py reconcile` afterwards. The same arguments always produce
+the same data.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from core import LIFELINES, SIGNAL_TYPES
+
+BATCH_SIZE = 2000
+
+# Logits for Observed, Assumed, Historical, Compensated at latent 0, and how
+# each moves as the latent (lifeline health) rises by one
+BASE_LOGITS = np.array([0.5, 0.1, -0.3, -0.2])
+LATENT_WEIGHTS = np.array([1.1, -0.2, -0.4, -0.8])
+
+BLANK_SHARE = 0.1          # answers left without text
+WORDS_MEDIAN = 14          # log-normal length of the others
+HINT_SHARE = 0.35          # answers that use a phrase typical of their signal
+CROSS_HINT_SHARE = 0.05    # ... or of another signal
+
+FILLER = (
+    "the team process system review data report leadership quarterly plan risk owner "
+    "vendor customer handoff backup metric dashboard escalation approval budget forecast "
+    "policy control access incident recovery capacity staff schedule regional finance "
+    "operations and for with on in of to a is are it we our this that when not all some"
+).split()
+
+LIFELINE_NAMES = tuple(lifeline['name'] for lifeline in LIFELINES.values())
+QUESTION_KEYS = tuple(
+    f"{lifeline_idx}_{q_idx}"
+    for lifeline_idx, lifeline in LIFELINES.items()
+    for q_idx in range(len(lifeline['questions']))
+)
+# Lifeline of each question, and where each lifeline's questions start
+QUESTION_LIFELINE = np.repeat(np.arange(len(LIFELINES)), [len(l['questions']) for l in LIFELINES.values()])
+LIFELINE_STARTS = np.flatnonzero(np.r_[True, np.diff(QUESTION_LIFELINE) != 0])
+
+
+def org_names(n: int) -> list[str]:
+    width = len(str(n))
+    return [f"Synthetic Org {i:0{width}d}" for i in range(1, n + 1)]
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    e = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+def _texts(rng, codes: np.ndarray) -> list[str]:
+    """Response text for every answer in a (batch, questions) code array, row-major"""
+    from signal_hints import LEXICON
+
+    phrases = [LEXICON.get(signal.split(" - ")[0], []) for signal in SIGNAL_TYPES]
+    flat = codes.ravel()
+    n = flat.size
+    lengths = np.where(
+        rng.random(n) < BLANK_SHARE, 0,
+        np.maximum(1, rng.lognormal(math.log(WORDS_MEDIAN), 0.6, n).astype(int)),
+    )
+    words = list(map(FILLER.__getitem__, rng.integers(0, len(FILLER), int(lengths.sum())).tolist()))
+    roll = rng.random(n)
+    other = (flat + rng.integers(1, len(SIGNAL_TYPES), n)) % len(SIGNAL_TYPES)
+    source = np.where(roll < HINT_SHARE, flat, np.where(roll < HINT_SHARE + CROSS_HINT_SHARE, other, -1))
+    picks = rng.random(n)
+
+    texts = []
+    offset = 0
+    for length, src, pick in zip(lengths.tolist(), source.tolist(), picks.tolist()):
+        if not length:
+            texts.append("")
+            continue
+        text = " ".join(words[offset:offset + length])
+        offset += length
+        if src >= 0 and phrases[src]:
+            text = f"{phrases[src][int(pick * len(phrases[src]))]}, {text}"
+        texts.append(text[0].upper() + text[1:] + ".")
+    return texts
+
+
+def generate_batches(count: int, seed: int = 0, orgs: int | None = None, since: date | None = None,
+                     days: int = 730, correlation: float = 0.6, text: bool = True, batch_size: int = BATCH_SIZE):
+    """
+    Yield batches of synthetic assessments as arrays:
+    {'org': (B,) org index, 'dates': list[date], 'codes': (B, Q) signal codes,
+     'texts': list[str] | None (B*Q, row-major), 'org_names': list[str]}
+    """
+    rng = np.random.default_rng(seed)
+    n_orgs = orgs or max(1, count // 4)
+    names = org_names(n_orgs)
+    since = since or date(2024, 1, 1)
+    maturity = rng.normal(0, 1, n_orgs)
+    lifeline_bias = rng.normal(0, 0.4, len(LIFELINES))
+
+    for start in range(0, count, batch_size):
+        b = min(batch_size, count - start)
+        org = rng.integers(0, n_orgs, b)
+        day = rng.integers(0, days, b)
+        assessment_level = maturity[org] + 0.4 * day / days + rng.normal(0, 0.5, b)
+        latent = (
+            correlation * assessment_level[:, None]
+            + math.sqrt(1 - correlation ** 2) * rng.normal(0, 1, (b, len(LIFELINES)))
+            + lifeline_bias
+        )
+        probs = _softmax(BASE_LOGITS + latent[..., None] * LATENT_WEIGHTS)  # (B, L, 4)
+        cumulative = probs.cumsum(axis=-1)[:, QUESTION_LIFELINE]            # (B, Q, 4)
+        codes = (cumulative < rng.random((b, len(QUESTION_KEYS), 1))).sum(axis=-1)
+        codes = np.minimum(codes, len(SIGNAL_TYPES) - 1).astype(np.uint8)
+
+        yield {
+            "org": org,
+            "dates": [since + timedelta(days=int(d)) for d in day],
+            "codes": codes,
+            "texts": _texts(rng, codes) if text else None,
+            "org_names": names,
+        }
+
+
+def batch_records(batch: dict):
+    """Yield one submission dict per assessment in a batch"""
+    q = len(QUESTION_KEYS)
+    codes = batch["codes"].tolist()
+    for i, org in enumerate(batch["org"].tolist()):
+        responses = {}
+        for j, key in enumerate(QUESTION_KEYS):
+            if batch["texts"] is not None:
+                responses[f"{key}_response"] = batch["texts"][i * q + j]
+            responses[f"{key}_signal"] = SIGNAL_TYPES[codes[i][j]]
+        yield {
+            "organization": batch["org_names"][org],
+            "assessment_date": batch["dates"][i].isoformat(),
+            "responses": responses,
+        }
+
+
+def generate(count: int, **options):
+    """Yield synthetic submissions ({'organization', 'assessment_date', 'responses'})"""
+    for batch in generate_batches(count, **options):
+        yield from batch_records(batch)
+
+
+def batch_statuses(codes: np.ndarray, compiled: dict | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Per-lifeline signal counts (B, L, 4) and status names (B, L) for a code array"""
+    from rules import active_rules, classify_array
+
+    compiled = compiled or active_rules()
+    onehot = (codes[..., None] == np.arange(len(SIGNAL_TYPES))).astype(np.int64)
+    counts = np.add.reduceat(onehot, LIFELINE_STARTS, axis=1)
+    totals = counts.sum(axis=-1)
+    pct = counts / totals[..., None] * 100
+    metrics = np.stack([pct[..., 0], pct[..., 3], pct[..., 1] + pct[..., 2]], axis=-1)
+    statuses = np.array(compiled['statuses'])[classify_array(metrics, compiled=compiled)]
+    return counts, statuses
+
+
+def write_jsonl(batches, out) -> int:
+    count = 0
+    for batch in batches:
+        out.write("".join(json.dumps(record) + "\n" for record in batch_records(batch)))
+        count += len(batch["org"])
+    return count
+
+
+def write_sql(batches, engine=None) -> int:
+    """Bulk-insert assessments and lifeline results, one transaction per batch"""
+    from rules import active_rules
+    from storage import SIGNALS, assessments, get_engine, lifeline_results, org_key
+
+    engine = engine or get_engine()
+    compiled = active_rules()
+    insert_assessments = assessments.insert().returning(assessments.c.id, sort_by_parameter_order=True)
+    keys = None
+    count = 0
+
+    for batch in batches:
+        if keys is None:
+            keys = [org_key(name) for name in batch["org_names"]]
+        counts, statuses = batch_statuses(batch["codes"], compiled)
+        records = list(batch_records(batch))
+        org = batch["org"].tolist()
+        rows = [
+            {
+                "org_key": keys[org[i]],
+                "org_name": record["organization"],
+                "assessment_date": batch["dates"][i],
+                "created_at": datetime.combine(batch["dates"][i], datetime.min.time(), timezone.utc)
+                + timedelta(hours=12),
+                "ruleset_version": compiled['version'],
+                "responses": json.dumps(record["responses"]),
+            }
+            for i, record in enumerate(records)
+        ]
+        counts_list, statuses_list = counts.tolist(), statuses.tolist()
+        with engine.begin() as conn:
+            ids = conn.execute(insert_assessments, rows).scalars().all()
+            conn.execute(lifeline_results.insert(), [
+                {
+                    "assessment_id": assessment_id,
+                    "lifeline": name,
+                    "org_key": rows[i]["org_key"],
+                    "assessment_date": rows[i]["assessment_date"],
+                    "status": statuses_list[i][l],
+                    **{s.lower(): counts_list[i][l][k] for k, s in enumerate(SIGNALS)},
+                }
+                for i, assessment_id in enumerate(ids)
+                for l, name in enumerate(LIFELINE_NAMES)
+            ])
+        count += len(ids)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate reproducible synthetic assessments.")
+    parser.add_argument("target", choices=["jsonl", "sql"], help="JSON lines on stdout (or --output), or the SQL store")
+    parser.add_argument("count", type=int, help="number of assessments")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--orgs", type=int, default=None, help="number of organizations (default count/4)")
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="first assessment date (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=730, help="span of assessment dates")
+    parser.add_argument("--correlation", type=float, default=0.6, help="between lifelines of one assessment (0-1)")
+    parser.add_argument("--no-text", action="store_true", help="signals only, no response text")
+    parser.add_argument("--output", "-o", help="JSONL file (default stdout)")
+    args = parser.parse_args(argv)
+    if not 0 <= args.correlation <= 1:
+        parser.error("--correlation must be between 0 and 1")
+
+    batches = generate_batches(
+        args.count, seed=args.seed, orgs=args.orgs, since=args.since, days=args.days,
+        correlation=args.correlation, text=not args.no_text,
+    )
+    started = time.perf_counter()
+    if args.target == "sql":
+        count = write_sql(batches)
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            count = write_jsonl(batches, out)
+    else:
+        count = write_jsonl(batches, sys.stdout)
+
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {count} assessment(s) in {elapsed:.1f}s ({count / max(elapsed, 1e-9):,.0f}/s)", file=sys.stderr)
+    if args.target == "sql":
+        print("Run `python rollups.py reconcile` to refresh the dashboard roll-ups.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
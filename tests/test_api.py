@@ -0,0 +1,52 @@
+"""Headless API requests through the WSGI entry point"""
+import io
+import json
+
+import pytest
+
+import api
+
+SCRIPT = "<script>alert('x')</script>"
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setenv("SIA_ARTIFACT_CACHE", str(tmp_path / "artifacts"))
+    monkeypatch.delenv("SIA_API_TOKEN", raising=False)
+
+
+def post(path: str, payload: dict):
+    body = json.dumps(payload).encode("utf-8")
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": path,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    status = []
+    response = b"".join(api.app(environ, lambda s, headers: status.append(s)))
+    return status[0], response.decode("utf-8")
+
+
+def submission(organization: str) -> dict:
+    return {
+        "organization": organization,
+        "assessment_date": "2026-01-28",
+        "responses": {"0_0_signal": "Observed", "1_0_signal": "Compensated", "2_0_signal": "Assumed"},
+    }
+
+
+def test_brief_escapes_organization():
+    status, html = post("/v1/brief", submission(SCRIPT))
+    assert status.startswith("200")
+    assert SCRIPT not in html
+    assert "&lt;script&gt;" in html
+
+
+def test_assessment_brief_html_escapes_organization():
+    status, body = post("/v1/assessments", {**submission(SCRIPT), "include_brief": True})
+    assert status.startswith("200")
+    result = json.loads(body)
+    assert SCRIPT not in result["brief_html"]
+    assert "&lt;script&gt;" in result["brief_html"]
+    assert result["export"]["organization"] == SCRIPT  # JSON is data, not markup
@@ -0,0 +1,33 @@
+"""Batch briefs rendered from stored assessments"""
+import io
+import zipfile
+
+import pytest
+
+from batch_briefs import iter_stored_assessments, write_briefs_zip
+from results import analyze_signal_responses
+from storage import get_engine, save_assessment
+
+SCRIPT_ORG = "<script>alert('x')</script>/../Acme"
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setenv("SIA_ARTIFACT_CACHE", str(tmp_path / "artifacts"))
+    engine = get_engine(f"sqlite:///{tmp_path}/briefs.db")
+    responses = {"0_0_signal": "Observed", "1_0_signal": "Compensated", "2_0_signal": "Assumed"}
+    save_assessment(SCRIPT_ORG, "2026-01-28", analyze_signal_responses(responses), responses, engine=engine)
+    return engine
+
+
+def test_stored_organization_names_are_escaped(engine):
+    out = io.BytesIO()
+    count = write_briefs_zip(iter_stored_assessments(engine=engine), out, workers=1, with_map=False)
+    assert count == 1
+
+    with zipfile.ZipFile(out) as archive:
+        [name] = archive.namelist()
+        html = archive.read(name).decode("utf-8")
+    assert "/" not in name and ".." not in name
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
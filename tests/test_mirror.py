@@ -0,0 +1,106 @@
+"""Mirror rooms: incremental counts, replaced contributions and idle expiry"""
+import time
+
+import numpy as np
+import pytest
+
+import mirror
+from signal_store import QUESTION_KEYS, SIGNALS, encode_signals
+
+rng = np.random.default_rng(7)
+
+
+def random_responses(answered: float = 0.8) -> dict:
+    return {
+        f"{key}_signal": SIGNALS[rng.integers(len(SIGNALS))]
+        for key in QUESTION_KEYS
+        if rng.random() < answered
+    }
+
+
+def recount(contributions) -> np.ndarray:
+    """Room counts rebuilt from scratch"""
+    counts = np.zeros((len(QUESTION_KEYS), len(SIGNALS)), dtype=np.int64)
+    for responses in contributions:
+        for i, code in enumerate(encode_signals(responses)):
+            if code != mirror.UNANSWERED:
+                counts[i, code] += 1
+    return counts
+
+
+@pytest.fixture
+def room():
+    return mirror.Room("TEST01", "Acme")
+
+
+def test_incremental_counts_match_recount(room):
+    current = {}
+    for step in range(200):
+        participant = f"p{rng.integers(12)}"
+        if step % 7 == 6:
+            room.leave(participant)
+            current.pop(participant, None)
+        else:
+            current[participant] = random_responses()
+            room.submit(participant, current[participant])
+        np.testing.assert_array_equal(room.counts, recount(current.values()))
+    assert room.snapshot["participants"] == len(current)
+
+
+def test_resubmission_replaces_contribution(room):
+    room.submit("a", {"0_0_signal": "Observed"})
+    version = room.submit("a", {"0_0_signal": "Compensated", "0_1_signal": "Assumed"})
+    assert room.snapshot["participants"] == 1
+    assert room.counts.sum() == 2
+    assert room.counts[0, SIGNALS.index("Observed")] == 0
+    assert room.counts[0, SIGNALS.index("Compensated")] == 1
+
+    # An unchanged resubmission publishes nothing
+    assert room.submit("a", {"0_0_signal": "Compensated", "0_1_signal": "Assumed"}) == version
+
+
+def test_subscribers_get_latest_snapshot(room):
+    mailbox = room.subscribe("facilitator")
+    room.submit("a", {"0_0_signal": "Observed"})
+    room.submit("b", {"0_0_signal": "Assumed"})
+    assert mailbox["latest"]["version"] == room.version
+    assert mailbox["latest"]["participants"] == 2
+
+
+def test_expire_idle_drops_unread_mailboxes_and_unfinished_answers(room):
+    room.submit("finished", {"0_0_signal": "Observed"}, finished=True)
+    room.submit("abandoned", {"0_0_signal": "Compensated"})
+    room.subscribe("gone")
+    watching = room.subscribe("watching")
+
+    later = time.monotonic() + mirror.PARTICIPANT_IDLE_SECONDS + 1
+    watching["seen"] = later
+    room.expire_idle(later)
+
+    assert set(room.contributions) == {"finished"}
+    np.testing.assert_array_equal(room.counts, recount([{"0_0_signal": "Observed"}]))
+    assert set(room._subscribers) == {"watching"}
+    assert watching["latest"]["participants"] == 1
+
+
+def test_recent_entries_survive_expiry(room):
+    room.submit("typing", {"0_0_signal": "Observed"})
+    room.subscribe("facilitator")
+    version = room.version
+    room.expire_idle(time.monotonic() + mirror.SUBSCRIBER_IDLE_SECONDS / 2)
+    assert set(room.contributions) == {"typing"}
+    assert set(room._subscribers) == {"facilitator"}
+    assert room.version == version
+
+
+def test_written_answers_follow_contributions(room):
+    room.submit("a", {"1_2_signal": "Compensated", "1_2_response": " Spreadsheets "})
+    version = room.submit("b", {"1_2_signal": "Compensated", "1_2_response": ""})
+    assert room.question_answers("1_2") == ["Spreadsheets"]
+
+    # Same signals, new text: the answer is replaced and a snapshot published
+    assert room.submit("b", {"1_2_signal": "Compensated", "1_2_response": "Manual fixes"}) > version
+    assert room.question_answers("1_2") == ["Spreadsheets", "Manual fixes"]
+
+    room.leave("a")
+    assert room.question_answers("1_2") == ["Manual fixes"]
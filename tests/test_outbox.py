@@ -0,0 +1,147 @@
+"""Outbox dispatcher against a local HTTP stand-in"""
+import json
+import threading
+from datetime import timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import select
+
+import outbox
+from schema import outbox_events
+from storage import get_engine
+
+
+class StubReceiver:
+    """HTTP server that records POSTed batches and answers with queued status codes"""
+
+    def __init__(self):
+        self.batches = []
+        self.statuses = []
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                receiver.batches.append(body)
+                status = receiver.statuses.pop(0) if receiver.statuses else 200
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/events"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def receiver():
+    stub = StubReceiver()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return get_engine(f"sqlite:///{tmp_path}/outbox.db")
+
+
+def enqueue_events(engine, n, destination):
+    with engine.begin() as conn:
+        for i in range(n):
+            outbox.enqueue(conn, "assessment.completed", {"n": i}, destinations=[destination])
+
+
+def rows(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(outbox_events).order_by(outbox_events.c.id)).mappings().all()
+
+
+def aware(moment):
+    """SQLite hands datetimes back without their UTC offset"""
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def expire(engine, **values):
+    """Move every undelivered event's timestamps into the past"""
+    past = outbox._now() - timedelta(seconds=1)
+    with engine.begin() as conn:
+        conn.execute(outbox_events.update().values({name: past for name in values}))
+
+
+def test_batches_per_destination(engine, receiver):
+    enqueue_events(engine, 120, receiver.url)
+    dispatcher = outbox.Dispatcher(engine, batch_size=50)
+
+    assert dispatcher.run_once() == 50
+    assert len(receiver.batches) == 1
+    assert [e["payload"]["n"] for e in receiver.batches[0]["events"]] == list(range(50))
+
+    assert dispatcher.run_once() == 50
+    assert dispatcher.run_once() == 20
+    assert dispatcher.run_once() == 0
+    assert [len(b["events"]) for b in receiver.batches] == [50, 50, 20]
+    assert all(row["delivered_at"] is not None for row in rows(engine))
+
+
+def test_failure_is_retried_after_backoff(engine, receiver, monkeypatch):
+    monkeypatch.setattr(outbox, "backoff_seconds", lambda attempts: 30.0 * attempts)
+    enqueue_events(engine, 3, receiver.url)
+    receiver.statuses = [500]
+    dispatcher = outbox.Dispatcher(engine)
+
+    assert dispatcher.run_once() == 0
+    failed = rows(engine)
+    assert all(row["attempts"] == 1 and row["delivered_at"] is None for row in failed)
+    assert all(aware(row["next_attempt_at"]) > outbox._now() + timedelta(seconds=20) for row in failed)
+    assert all("500" in row["last_error"] for row in failed)
+
+    # Not due during the backoff
+    assert dispatcher.run_once() == 0
+    assert len(receiver.batches) == 1
+
+    expire(engine, next_attempt_at=True)
+    assert dispatcher.run_once() == 3
+    assert len(receiver.batches) == 2
+    assert receiver.batches[0]["events"] == receiver.batches[1]["events"]  # same event ids again
+
+
+def test_expired_lease_is_reclaimed(engine, receiver):
+    enqueue_events(engine, 5, receiver.url)
+    crashed = outbox.Dispatcher(engine)
+    assert len(crashed.claim()) == 5  # leased, never delivered
+
+    survivor = outbox.Dispatcher(engine)
+    assert survivor.run_once() == 0  # lease still held
+    assert receiver.batches == []
+
+    expire(engine, locked_until=True)
+    assert survivor.run_once() == 5
+    assert len(receiver.batches) == 1
+
+
+def test_dead_letter_after_max_attempts(engine, receiver, monkeypatch):
+    monkeypatch.setattr(outbox, "backoff_seconds", lambda attempts: 0.0)
+    enqueue_events(engine, 1, receiver.url)
+    receiver.statuses = [500, 500, 500]
+    dispatcher = outbox.Dispatcher(engine, max_attempts=3)
+
+    for _ in range(3):
+        expire(engine, next_attempt_at=True)
+        assert dispatcher.run_once() == 0
+    (row,) = rows(engine)
+    assert row["attempts"] == 3 and row["dead_at"] is not None
+
+    expire(engine, next_attempt_at=True)
+    assert dispatcher.run_once() == 0
+    assert len(receiver.batches) == 3  # no longer attempted
+
+    assert outbox.retry_dead(engine) == 1
+    assert dispatcher.run_once() == 1
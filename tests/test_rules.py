@@ -0,0 +1,38 @@
+"""The status rule table against the thresholds it replaced"""
+import itertools
+
+import numpy as np
+
+from rules import STATUS_RULES, classify, classify_array, compile_rules, metrics_from_counts
+
+
+def legacy_status(observed_pct, compensated_pct, fragile_pct):
+    """analyze_signal_responses' if/elif chain before the rule table"""
+    if observed_pct >= 60:
+        return 'SOLID', 'Largely supported by observed signals with current evidence.'
+    elif compensated_pct >= 40:
+        return 'FRAGILE', 'Stability depends on individual effort and informal fixes.'
+    elif fragile_pct >= 60:
+        return 'CONDITIONAL', 'Confidence appears to rest on belief or outdated verification.'
+    return 'MIXED', 'Shows varied signal patterns requiring attention.'
+
+
+# Every reachable split of up to 10 answers, plus values on and beside each threshold
+COUNTS = np.array([
+    counts for n in range(1, 11)
+    for counts in itertools.product(range(n + 1), repeat=4) if sum(counts) == n
+])
+EDGES = [0, 39.999, 40, 40.001, 59.999, 60, 60.001, 100]
+METRICS = np.vstack([metrics_from_counts(COUNTS), list(itertools.product(EDGES, repeat=3))])
+
+
+def test_classify_matches_legacy_thresholds():
+    compiled = compile_rules(STATUS_RULES)
+    for observed, compensated, fragile in METRICS:
+        assert classify(observed, compensated, fragile, compiled) == legacy_status(observed, compensated, fragile)
+
+
+def test_classify_array_matches_classify():
+    compiled = compile_rules(STATUS_RULES)
+    codes = classify_array(METRICS, compiled=compiled)
+    assert [compiled['statuses'][c] for c in codes] == [legacy_status(*row)[0] for row in METRICS]
@@ -0,0 +1,45 @@
+"""Session memory governor: idle sessions spill without building again"""
+import time
+
+import pytest
+
+import session_memory
+
+
+@pytest.fixture(autouse=True)
+def governor(tmp_path, monkeypatch):
+    monkeypatch.setenv("SIA_SESSION_SPILL", str(tmp_path / "spill"))
+    monkeypatch.setenv("SIA_SESSION_IDLE_SECONDS", "60")
+    monkeypatch.setattr(session_memory, "_sessions", {})
+    monkeypatch.setattr(session_memory, "_last_sweep", 0.0)
+    yield
+    session_memory._sessions.clear()
+
+
+def resident(session_id: str) -> bool:
+    return session_memory._sessions[session_id].entries["brief"].resident
+
+
+def test_cache_hits_sweep_idle_sessions():
+    session_memory.session_artifact("brief", [1], lambda: "idle brief", session_id="idle")
+    session_memory.session_artifact("brief", [1], lambda: "busy brief", session_id="busy")
+    session_memory._sessions["idle"].last_seen -= 120
+    session_memory._last_sweep = 0.0
+
+    # A hit for another session builds nothing, but still sweeps
+    assert session_memory.session_artifact("brief", [1], pytest.fail, session_id="busy") == "busy brief"
+    assert not resident("idle")
+    assert resident("busy")
+    assert session_memory.session_artifact("brief", [1], pytest.fail, session_id="idle") == "idle brief"
+
+
+def test_background_sweeper_runs(monkeypatch):
+    monkeypatch.setattr(session_memory, "SWEEP_INTERVAL", 0.05)
+    monkeypatch.setattr(session_memory, "_sweeper", None)  # start one with the short interval
+    session_memory.session_artifact("brief", [1], lambda: "brief", session_id="idle")
+    session_memory._sessions["idle"].last_seen -= 120
+
+    deadline = time.monotonic() + 5
+    while resident("idle") and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not resident("idle")
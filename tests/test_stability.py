@@ -0,0 +1,20 @@
+"""Bootstrap stability of lifeline statuses"""
+from results import analyze_signal_responses
+from stability import status_stability
+
+
+def test_lifeline_without_known_signals_has_no_stability():
+    analysis = analyze_signal_responses({
+        '0_0_signal': 'Weird - x',
+        '1_0_signal': 'Observed - y',
+        '1_1_signal': 'Observed - z',
+    })
+    assert set(analysis) == {'Leadership Awareness', 'Operational Dependencies'}
+
+    stability = status_stability(analysis, n_replicates=200)
+    assert 'Leadership Awareness' not in stability
+    assert stability['Operational Dependencies']['stability'] == 1.0
+
+
+def test_only_unknown_signals():
+    assert status_stability(analyze_signal_responses({'0_0_signal': 'Weird - x'})) == {}
@@ -0,0 +1,51 @@
+"""Theme and near-duplicate clustering of written answers"""
+import numpy as np
+
+from themes import find_near_duplicates, group_themes, hash_vectors, themes_by_question
+
+
+def test_similar_answers_share_a_theme():
+    texts = [
+        "We rely on spreadsheets and manual work",
+        "Vendor backups have never been tested",
+        "Manual work and spreadsheets we rely on",
+        "Our vendor backups have never been tested",
+        "Nobody owns the incident escalation process",
+    ]
+    themes = group_themes(texts)
+    assert [sorted(t["members"]) for t in themes] == [[0, 2], [1, 3], [4]]
+    assert themes[0]["representative"] == texts[0]
+
+
+def test_stopword_only_answers_are_left_out():
+    texts = ["It is what it is", "we were", "Spreadsheets everywhere", "", "it is"]
+    assert not hash_vectors(texts)[[0, 1, 3, 4]].any()
+    themes = group_themes(texts)
+    assert [t["members"] for t in themes] == [[2]]
+    assert group_themes(["it is", "so"]) == []
+
+
+def test_near_duplicates():
+    texts = ["Backups are tested every quarter.", "backups are tested every quarter", "Backups are never tested"]
+    assert [t["members"] for t in find_near_duplicates(texts)] == [[0, 1]]
+
+
+def test_blocks_cluster_like_one_pass():
+    rng = np.random.default_rng(3)
+    phrases = ["manual spreadsheet workaround", "vendor backup untested", "single expert knows system"]
+    texts = [f"{phrases[i % 3]} {rng.integers(5)}" for i in range(300)]
+    X = hash_vectors(texts, block_size=64)
+    np.testing.assert_allclose(X, hash_vectors(texts))
+    assert [t["size"] for t in group_themes(texts)][:3] == [100, 100, 100]
+
+
+def test_themes_by_question_maps_members_to_respondents():
+    response_sets = [
+        {"1_2_response": "We rely on spreadsheets and manual work", "1_2_signal": "Compensated"},
+        {"1_2_response": "   "},
+        {"1_2_response": "Manual work and spreadsheets we rely on", "0_0_response": "Dashboards"},
+    ]
+    result = themes_by_question(response_sets)
+    assert sorted(result) == ["0_0", "1_2"]
+    assert result["1_2"][0]["members"] == [0, 2]
+    assert result["0_0"][0]["members"] == [2]
@@ -0,0 +1,165 @@
+"""
+House of Cards Assessment™
+Near-Duplicate and Theme Clustering of Responses
+
+Answers are hashed into signed unigram/bigram vectors and grouped by blocked
+cosine similarity, with no model or network service. The mirror facilitator
+view groups a room's answers to one question with group_themes().
+"""
+
+import re
+import zlib
+
+import numpy as np
+
+# Hashed feature space (power of two so the bucket is a bit mask)
+N_FEATURES = 1024
+BLOCK_SIZE = 1024
+
+DUPLICATE_THRESHOLD = 0.9
+THEME_THRESHOLD = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_STOPWORDS = frozenset("""
+a an and are as at be been but by do does for from has have if in into is it its
+of on or our so that the their there these they this to was we were what when where
+which who will with you your
+""".split())
+
+
+def _features(text: str) -> list[str]:
+    """Unigrams and bigrams of the normalized, stopword-free tokens"""
+    tokens = [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def hash_vectors(texts, n_features: int = N_FEATURES, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """Turn texts into L2-normalized signed hashed feature vectors (rows of a float32 matrix)"""
+    if n_features & (n_features - 1):
+        raise ValueError("n_features must be a power of two")
+
+    texts = list(texts)
+    X = np.zeros((len(texts), n_features), dtype=np.float32)
+    mask = n_features - 1
+
+    for start in range(0, len(texts), block_size):
+        chunk = texts[start:start + block_size]
+        hashes, lengths = [], []
+        for text in chunk:
+            grams = _features(text or "")
+            hashes.extend(zlib.crc32(g.encode("utf-8")) for g in grams)
+            lengths.append(len(grams))
+
+        h = np.fromiter(hashes, dtype=np.uint32, count=len(hashes))
+        rows = np.repeat(np.arange(len(chunk)), lengths)
+        signs = np.where(h >> 31, -1.0, 1.0)
+        flat = np.bincount(rows * n_features + (h & mask), weights=signs,
+                           minlength=len(chunk) * n_features)
+        X[start:start + len(chunk)] = flat.reshape(len(chunk), n_features)
+
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    np.divide(X, norms, out=X, where=norms > 0)
+    return X
+
+
+def cluster_vectors(X: np.ndarray, threshold: float, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """
+    Leader clustering with blocked cosine similarity.
+
+    Rows are processed in blocks: each block is compared against all existing
+    leaders in one matrix product, and rows that match none are grouped among
+    themselves, the first unmatched row of each group becoming a new leader.
+    Returns a cluster label per row (labels are leader order).
+    """
+    n = X.shape[0]
+    labels = np.full(n, -1, dtype=np.int64)
+    leader_rows: list[int] = []
+    leaders = np.empty((0, X.shape[1]), dtype=X.dtype)
+
+    for start in range(0, n, block_size):
+        block = X[start:start + block_size]
+        block_labels = np.full(len(block), -1, dtype=np.int64)
+
+        if leader_rows:
+            sims = block @ leaders.T
+            best = sims.argmax(axis=1)
+            hit = sims[np.arange(len(block)), best] >= threshold
+            block_labels[hit] = best[hit]
+
+        pending = np.flatnonzero(block_labels < 0)
+        if pending.size:
+            inner = block[pending] @ block[pending].T
+            unassigned = np.ones(pending.size, dtype=bool)
+            new_rows = []
+            for j in range(pending.size):
+                if not unassigned[j]:
+                    continue
+                members = unassigned & (inner[j] >= threshold)
+                members[j] = True
+                block_labels[pending[members]] = len(leader_rows) + len(new_rows)
+                unassigned &= ~members
+                new_rows.append(start + pending[j])
+
+            leader_rows.extend(new_rows)
+            leaders = np.vstack([leaders, X[new_rows]])
+
+        labels[start:start + len(block)] = block_labels
+
+    return labels
+
+
+def group_themes(texts, threshold: float = THEME_THRESHOLD) -> list[dict]:
+    """
+    Group texts into themes, largest first; members are indices into texts.
+    Texts without a single content word (only stopwords) are left out.
+    """
+    texts = list(texts)
+    X = hash_vectors(texts)
+    content = np.flatnonzero(X.any(axis=1))
+    if not content.size:
+        return []
+
+    labels = cluster_vectors(X[content], threshold)
+    order = content[np.argsort(labels, kind="stable")]
+    bounds = np.flatnonzero(np.diff(np.sort(labels, kind="stable"))) + 1
+
+    themes = []
+    for members in np.split(order, bounds):
+        themes.append({
+            "representative": texts[members[0]],
+            "size": int(members.size),
+            "members": members.tolist(),
+        })
+    themes.sort(key=lambda t: t["size"], reverse=True)
+    return themes
+
+
+def find_near_duplicates(texts, threshold: float = DUPLICATE_THRESHOLD) -> list[dict]:
+    """Groups of nearly identical texts (only groups with more than one member)"""
+    return [t for t in group_themes(texts, threshold) if t["size"] > 1]
+
+
+def themes_by_question(response_sets, threshold: float = THEME_THRESHOLD) -> dict:
+    """
+    Group many respondents' answers into themes per question.
+
+    `response_sets` is a sequence of responses dicts as kept in
+    st.session_state.responses. Blank answers are skipped; theme members are
+    indices into `response_sets`.
+    """
+    by_question: dict[str, tuple[list, list]] = {}
+    for idx, responses in enumerate(response_sets):
+        for key, text in responses.items():
+            if not key.endswith("_response") or not (text or "").strip():
+                continue
+            texts, owners = by_question.setdefault(key[:-len("_response")], ([], []))
+            texts.append(text)
+            owners.append(idx)
+
+    result = {}
+    for question_key, (texts, owners) in sorted(by_question.items()):
+        themes = group_themes(texts, threshold)
+        for theme in themes:
+            theme["members"] = [owners[i] for i in theme["members"]]
+        result[question_key] = themes
+    return result
@@ -0,0 +1,134 @@
+"""
+House of Cards Assessment™
+Assessment Page - one business lifeline at a time
+"""
+import streamlit as st
+
+from core import LIFELINES, SIGNAL_TYPES, go_to, render_brand_header, render_footer
+from draft_cache import mark_draft_complete
+from mirror import get_room
+from precompute import cancel_speculation, speculate_results
+from scroll_reset import request_scroll_top
+from session_memory import current_session_id
+from signal_hints import chosen_signal, suggest_signal
+
+
+def share_with_room(finished: bool = False):
+    """Send this participant's answers so far to their mirror session, if any"""
+    room = get_room(st.session_state.get("mirror_room"))
+    if room is not None:
+        room.submit(current_session_id(), st.session_state.responses, finished=finished)
+
+
+def show_assessment_page():
+    if not st.session_state.get("org_name", "").strip():
+        go_to("metadata")
+
+    if st.session_state.pop("draft_restored", False):
+        st.toast("Your answers were restored from this browser.")
+
+    lifeline_idx = st.session_state.get("current_lifeline", 0)
+    
+    # Keep index in range
+    if lifeline_idx < 0:
+        lifeline_idx = 0
+        st.session_state.current_lifeline = 0
+    if lifeline_idx >= len(LIFELINES):
+        lifeline_idx = len(LIFELINES) - 1
+        st.session_state.current_lifeline = lifeline_idx
+
+    # Header section
+    render_brand_header("Signal Integrity Assessment™", "A structured executive diagnostic on decision information reliability.")
+    st.markdown(f"**Organization:** {st.session_state.org_name} | **Date:** {st.session_state.assessment_date}")
+
+    # Progress indicator
+    progress = (lifeline_idx + 1) / len(LIFELINES)
+    st.progress(progress)
+    st.markdown(f"**Business Lifeline {lifeline_idx + 1} of {len(LIFELINES)}** ({int(progress * 100)}% Complete)")
+    st.markdown("---")
+
+    # Current Lifeline content
+    lifeline = LIFELINES[lifeline_idx]
+    st.subheader(lifeline.get('name', 'Business Lifeline'))
+    
+    questions = lifeline.get("questions", [])
+
+    # Render Questions
+    for q_idx, question in enumerate(questions):
+        key_base = f"{lifeline_idx}_{q_idx}"
+        
+        with st.container():
+            st.markdown(f"**Question {q_idx + 1} of {len(questions)}**")
+            st.markdown(f"*{question}*")
+            
+            # Text area for response
+            response = st.text_area(
+                "Your Response",
+                value=st.session_state.responses.get(f"{key_base}_response", ""),
+                key=f"{key_base}_response_input",
+                height=110
+            )
+            
+            # Selectbox for signal classification
+            signal_type = st.selectbox(
+                "Signal Classification",
+                options=SIGNAL_TYPES,
+                index=SIGNAL_TYPES.index(
+                    st.session_state.responses.get(f"{key_base}_signal", SIGNAL_TYPES[0])
+                ),
+                key=f"{key_base}_signal_input"
+            )
+
+            # Wording that points at another classification (cached per text)
+            hint = suggest_signal(response)
+            if hint and hint.signal != chosen_signal(signal_type):
+                quoted = ", ".join(f"“{p}”" for p in hint.phrases[:3])
+                st.caption(f"💡 Your wording ({quoted}) suggests **{hint.signal}**.")
+            
+            # Save to session state
+            st.session_state.responses[f"{key_base}_response"] = response
+            st.session_state.responses[f"{key_base}_signal"] = signal_type
+            st.markdown("---")
+
+    # Navigation buttons
+    col1, col2, col3 = st.columns([1, 1, 1])
+
+    with col1:
+        if st.session_state.current_lifeline > 0:
+            if st.button("← Previous Lifeline", use_container_width=True):
+                cancel_speculation(current_session_id())
+                st.session_state.current_lifeline -= 1
+                request_scroll_top()
+                st.rerun()
+
+    with col2:
+        if st.button("Save Progress", use_container_width=True):
+            share_with_room()
+            st.success("Progress saved!")
+
+    with col3:
+        is_last = st.session_state.current_lifeline >= len(LIFELINES) - 1
+        if is_last:
+            # Results are the likely next step: start on them in the background
+            speculate_results(
+                current_session_id(),
+                st.session_state.org_name,
+                st.session_state.assessment_date,
+                st.session_state.responses,
+            )
+
+        if st.button("Generate Assessment →" if is_last else "Next Lifeline →",
+                     use_container_width=True,
+                     type="primary" if is_last else "secondary"):
+
+            share_with_room(finished=is_last)
+            request_scroll_top()
+            if is_last:
+                mark_draft_complete()
+                go_to("results")
+            else:
+                st.session_state.current_lifeline += 1
+                st.rerun()
+
+
+    render_footer(show_prepared_by=True)
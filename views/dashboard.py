@@ -0,0 +1,62 @@
+"""
+House of Cards Assessment™
+Operator Dashboard - weekly volume, status mix and Compensated share
+
+Reads only the roll-up tables maintained by rollups.py, plus this process's
+session memory and artifact cache totals.
+"""
+import streamlit as st
+
+from artifact_cache import cache_stats
+from core import render_brand_header
+from precompute import precompute_stats
+from rollups import load_dashboard
+from session_memory import memory_stats
+
+
+def show_dashboard_page():
+    """Internal operator dashboard"""
+    render_brand_header("Operator Dashboard", "Assessment roll-ups (internal)")
+
+    memory = memory_stats()
+    st.header("Session Memory (this worker)")
+    cols = st.columns(4)
+    cols[0].metric("Sessions", memory["sessions"])
+    cols[1].metric("Resident", f"{memory['resident_bytes'] / 1e6:.1f} MB")
+    cols[2].metric("Spilled to disk", f"{memory['spilled_bytes'] / 1e6:.1f} MB")
+    cols[3].metric("Rebuilds", memory["rebuilds"], help=f"{memory['spills']} spills, {memory['disk_loads']} reloads")
+    speculative = precompute_stats()
+    st.caption(
+        f"Speculative precompute: {speculative['completed']} completed, "
+        f"{speculative['cancelled']} cancelled, {speculative['running']} running"
+    )
+
+    cache = cache_stats()
+    st.header("Artifact Cache (this worker)")
+    cols = st.columns(4)
+    cols[0].metric("Hits", cache["hits"])
+    cols[1].metric("Misses", cache["misses"])
+    cols[2].metric("Hit rate", f"{cache['hit_rate']:.0%}")
+    size = "—" if cache["size_bytes"] is None else f"{cache['size_bytes'] / 1e6:.1f} MB"
+    cols[3].metric("On disk", size, help=f"cap {cache['cap_bytes'] / 1e6:.0f} MB, {cache['evicted']} evicted")
+
+    data = load_dashboard()
+    if not data["assessments_per_week"]:
+        st.info("No completed assessments yet.")
+        return
+
+    st.header("Assessments per Week")
+    st.bar_chart(
+        {"Assessments": {str(week): n for week, n in data["assessments_per_week"]}},
+    )
+
+    st.header("Status Distribution per Lifeline")
+    st.table([
+        {"Lifeline": lifeline, **{s: counts.get(s, 0) for s in ("SOLID", "CONDITIONAL", "MIXED", "FRAGILE")}}
+        for lifeline, counts in data["status_distribution"].items()
+    ])
+
+    st.header("Share of Compensated Signals")
+    st.line_chart(
+        {"Compensated (%)": {str(week): round(share, 1) for week, share in data["compensated_share"]}},
+    )
@@ -0,0 +1,97 @@
+"""
+House of Cards Assessment™
+Metadata Page - organization and assessment date
+"""
+import streamlit as st
+
+from core import go_to, render_brand_header, render_footer
+from mirror import get_room
+from scroll_reset import request_scroll_top
+
+
+def show_metadata_page():
+    """Metadata collection page"""
+    # A reconnected respondent whose browser handed back their draft
+    if st.session_state.get("draft_restored") and st.session_state.get("org_name", "").strip():
+        go_to("assessment")
+
+    render_brand_header(
+        "Signal Integrity Assessment™",
+        "A structured executive diagnostic on decision information reliability."
+    )
+    render_footer(show_prepared_by=False)
+
+    st.markdown(
+        "*A structured executive diagnostic that reveals where leadership decisions are supported by verified information—and where they depend on assumptions, workarounds, or individual effort.*"
+    )
+
+    # Joining a facilitated mirror session (?room=<code>)
+    room_code = st.query_params.get("room")
+    if room_code:
+        room = get_room(room_code)
+        if room is None:
+            st.warning("That mirror session has ended or the room code is not valid.")
+        else:
+            st.session_state.mirror_room = room.code
+            if not st.session_state.get("org_name"):
+                st.session_state.org_name = room.org_name
+    room = get_room(st.session_state.get("mirror_room"))
+    if room is not None:
+        st.info(
+            f"You are joining the mirror session for **{room.org_name}**. "
+            "Your answers are combined with everyone else's in the room."
+        )
+
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        org_name = st.text_input(
+            "Organization Name",
+            value=st.session_state.get("org_name", ""),
+            help="Enter your organization or company name"
+        )
+
+    with col2:
+        # Adjust UTC server time to local date (approx. US Eastern Time)
+        from datetime import datetime, timedelta
+        today_local = (datetime.utcnow() - timedelta(hours=5)).date()
+        
+        assessment_date = st.date_input(
+            "Assessment Date",
+            value=st.session_state.get("assessment_date", today_local)
+        )
+    
+    st.session_state["org_name"] = org_name
+    st.session_state["assessment_date"] = assessment_date
+
+    
+    st.markdown('---')
+    
+    st.markdown("""
+    ### What to Expect
+    
+    This assessment examines 5 critical business lifelines:
+    - **Leadership Awareness** - Quality of operational visibility
+    - **Operational Dependencies** - Key process and resource dependencies
+    - **Decision Clarity** - Information quality for decisions
+    - **Resource Resilience** - Backup capacity and sustainability
+    - **Information Flow** - Communication and signal detection
+    
+    **Time required:** Approximately 15 minutes
+    
+    **Output:** A single-page executive artifact showing where your decisions rest on verified information versus assumptions.
+    """)
+    
+    st.markdown('---')
+    
+    if st.button('Begin Assessment', use_container_width=True):
+        if org_name.strip():
+            st.session_state.org_name = org_name
+            st.session_state.assessment_date = assessment_date
+            st.session_state.current_lifeline = 0
+            request_scroll_top()
+            go_to('assessment')
+        else:
+            st.error('Please enter an organization name to continue.')
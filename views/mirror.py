@@ -0,0 +1,154 @@
+"""
+House of Cards Assessment™
+Mirror Session Page - facilitator view of a live room
+
+Participants join with ?room=<code> on the start page. A small fragment
+polls the room's mailbox and reruns the page only when a new snapshot has
+been published (see mirror.py), so an idle room does not resend the map.
+"""
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import streamlit as st
+
+from core import LIFELINES, render_brand_header
+from mirror import close_room, create_room, get_room, open_rooms
+from session_memory import current_session_id
+from signal_store import QUESTION_KEYS
+
+REFRESH_SECONDS = 2
+
+
+def _question_text(key: str) -> str:
+    lifeline_idx, q_idx = map(int, key.split("_"))
+    lifeline = LIFELINES[lifeline_idx]
+    return f"{lifeline['name']}: {lifeline['questions'][q_idx]}"
+
+
+def _stop_watching():
+    """Unsubscribe this session from the room it was watching"""
+    room = get_room(st.session_state.pop("mirror_watching", None))
+    if room is not None:
+        room.unsubscribe(current_session_id())
+
+
+def _join_link(code: str) -> str:
+    parts = urlsplit(st.context.url or "")
+    base = f"{parts.scheme}://{parts.netloc}" if parts.netloc else ""
+    return f"{base}/?room={code}"
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def _watch_room(code: str):
+    """Rerun the page when the room publishes a snapshot newer than the one shown"""
+    room = get_room(code)
+    version = room.subscribe(current_session_id())["latest"]["version"] if room is not None else None
+    if st.session_state.get("mirror_shown") != (code, version):
+        st.rerun()
+
+
+def _live_view(code: str):
+    from results import figure_from_spec
+
+    room = get_room(code)
+    if room is None:
+        st.session_state.mirror_shown = (code, None)
+        st.warning("This room has closed.")
+        return
+
+    snapshot = room.subscribe(current_session_id())["latest"]
+    st.session_state.mirror_shown = (code, snapshot["version"])
+    col1, col2 = st.columns(2)
+    col1.metric("Participants", snapshot["participants"])
+    col2.metric("Last update", datetime.fromtimestamp(snapshot["updated"]).strftime("%H:%M:%S"))
+
+    if not snapshot["analysis"]:
+        st.info("Waiting for the first submissions...")
+        return
+
+    st.plotly_chart(figure_from_spec(snapshot["map_spec"]), use_container_width=True, key="mirror_map")
+    st.table([
+        {
+            "Lifeline": name,
+            "Status": data["status"],
+            "Signal Pattern": ", ".join(f"{sig}: {count}" for sig, count in data["signals"].items()),
+        }
+        for name, data in snapshot["analysis"].items()
+    ])
+
+    if snapshot["divergent"]:
+        st.subheader("Where the Room Disagrees")
+        st.table([
+            {
+                "Lifeline": item["lifeline"],
+                "Question": item["question"],
+                "Agreement": f"{item['agreement']:.0%}",
+                "Split": ", ".join(f"{sig}: {n}" for sig, n in item["split"].items()),
+            }
+            for item in snapshot["divergent"]
+        ])
+
+    _answer_themes(room)
+
+
+def _answer_themes(room):
+    """Group the room's written answers to one chosen question into themes"""
+    from themes import group_themes
+
+    questions = [key for key in QUESTION_KEYS if room.question_answers(key)]
+    if not questions:
+        return
+
+    st.subheader("Answer Themes")
+    key = st.selectbox(
+        "Question",
+        [None, *questions],
+        format_func=lambda k: "Choose a question..." if k is None else _question_text(k),
+        key="mirror_theme_question",
+    )
+    if key is None:
+        return
+    answers = room.question_answers(key)
+    themes = group_themes(answers)
+    st.caption(f"{len(answers)} written answer(s), {len(themes)} theme(s)")
+    st.table([{"Answers": theme["size"], "Theme": theme["representative"]} for theme in themes])
+
+
+def show_mirror_page():
+    """Facilitator view: open a room and watch the combined signal map"""
+    render_brand_header("Mirror Session", "Live combined signal map (facilitator)")
+
+    with st.form("new_room", clear_on_submit=True):
+        org_name = st.text_input("Organization Name")
+        if st.form_submit_button("Open Room") and org_name.strip():
+            st.session_state.mirror_facilitating = create_room(org_name).code
+
+    rooms = open_rooms()
+    if not rooms:
+        _stop_watching()
+        st.info("No open rooms. Open one above, then share its link with the participants.")
+        return
+
+    codes = [room.code for room in rooms]
+    current = st.session_state.get("mirror_facilitating")
+    code = st.selectbox(
+        "Room",
+        codes,
+        index=codes.index(current) if current in codes else 0,
+        format_func=lambda c: f"{c} — {get_room(c).org_name if get_room(c) else 'closed'}",
+    )
+    st.session_state.mirror_facilitating = code
+    if st.session_state.get("mirror_watching") != code:
+        _stop_watching()
+        st.session_state.mirror_watching = code
+
+    st.markdown(f"Participants join at **{_join_link(code)}**")
+    _live_view(code)
+    _watch_room(code)
+
+    st.markdown("---")
+    if st.button("Close Room"):
+        _stop_watching()
+        close_room(code)
+        st.session_state.pop("mirror_facilitating", None)
+        st.rerun()
@@ -0,0 +1,111 @@
+"""
+House of Cards Assessment™
+Startup Warm-up and Readiness Probe
+
+Start the app with `python warmup.py [streamlit flags]` instead of
+`streamlit run app.py`. The Streamlit server comes up immediately while a
+background thread imports the heavy modules, compiles the brief template,
+loads the assets and launches the image exporter once. When that is done the
+readiness file is written to Streamlit's static folder, so the probe at
+/app/static/ready.json answers 404 until the process is warm and 200 after.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+APP_SCRIPT = "app.py"
+READY_FILE = Path("static/ready.json")
+
+_state = {"ready": False, "timings_ms": {}}
+
+
+def _timed(name: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    _state["timings_ms"][name] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def _core_pages():
+    from core import PAGES
+    return PAGES.values()
+
+
+def _sample_analysis():
+    """A small analysis dict that exercises every chart status"""
+    from results import analyze_signal_responses
+
+    pattern = ["Observed", "Assumed", "Historical", "Compensated", "Observed"]
+    responses = {
+        f"{l}_{q}_signal": pattern[(l + q) % len(pattern)] + " - warm-up"
+        for l in range(5) for q in range(5)
+    }
+    return analyze_signal_responses(responses)
+
+
+def run_warmup() -> dict:
+    """Import, compile and render everything the first results page needs"""
+    _timed("import_numpy", lambda: __import__("numpy"))
+    _timed("import_plotly", lambda: __import__("plotly.graph_objects"))
+    _timed("import_jinja2", lambda: __import__("jinja2"))
+    results = _timed("import_results", lambda: __import__("results"))
+    _timed("import_pages", lambda: [__import__(module) for module, *_ in _core_pages()])
+
+    _timed("compile_template", results._brief_template)
+    _timed("load_assets", lambda: results.file_to_base64(results.LOGO_COLOR_PATH))
+
+    analysis = _timed("score_sample", _sample_analysis)
+    _timed("build_radar", lambda: results.create_signal_map(analysis))
+    fig = _timed("build_network", lambda: results.create_network_signal_map(analysis))
+    # Bypass the artifact cache: a cached sample PNG would leave Kaleido cold
+    png = _timed("image_exporter", lambda: results._render_png_base64(fig))
+    _timed("render_brief", lambda: results.build_executive_brief_html(
+        org_name="Warm-up", assessment_date="", analysis=analysis, map_png_b64=png,
+    ))
+
+    _state["image_exporter"] = png is not None
+    return _state
+
+
+def write_ready_file():
+    READY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = READY_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps({**_state, "pid": os.getpid()}, indent=2))
+    os.replace(tmp, READY_FILE)
+
+
+def _warmup_thread():
+    started = time.perf_counter()
+    try:
+        run_warmup()
+    except Exception as exc:  # a failed warm-up must not keep the service down
+        _state["error"] = repr(exc)
+    _state["ready"] = True
+    _state["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    write_ready_file()
+    print(f"Warm-up finished in {_state['total_ms']} ms", file=sys.stderr)
+
+
+def start_warmup() -> threading.Thread:
+    """Clear any stale readiness file and warm up in the background"""
+    READY_FILE.unlink(missing_ok=True)
+    thread = threading.Thread(target=_warmup_thread, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    """Warm up in-process, then hand over to the Streamlit CLI"""
+    from streamlit.web import cli as stcli
+
+    start_warmup()
+    sys.argv = ["streamlit", "run", APP_SCRIPT, *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()